@@ -430,6 +430,312 @@ def diff(before, after, format):
         print(row_fmt.format(*b_parts[:first_name_index], *results))
 
 
+@cli.command(name='entries-for-update')
+@click.option(
+    '--sizes',
+    default='1,2,4,8,16,32,64,128,256',
+    show_default=True,
+    help="Comma-separated numbers of entries to get per feed.",
+)
+@click.option(
+    '--entries',
+    type=int,
+    default=10000,
+    show_default=True,
+    help="Number of entries in the database (half of them in the queried feed).",
+)
+@click.option('-n', '--number', type=int, default=100, show_default=True)
+@click.option('-r', '--repeat', type=int, default=5, show_default=True)
+def entries_for_update(sizes, entries, number, repeat):
+    """Compare Storage.get_entries_for_update() strategies by feed size.
+
+    Shows the crossover point between getting entries one by one
+    and getting them in a single query
+    (Storage.entries_for_update_single_query_min).
+
+    Times are the minimum per call, in microseconds;
+    half of the entries asked for exist.
+
+    """
+    from datetime import datetime
+    from datetime import timezone
+
+    from reader._storage import Storage
+    from reader._types import EntryData
+    from reader._types import EntryUpdateIntent
+
+    sizes = [int(size) for size in sizes.split(',')]
+    now = datetime(2010, 1, 1, tzinfo=timezone.utc)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Storage(os.path.join(tmpdir, 'db.sqlite'))
+        for feed_url in 'one', 'two':
+            storage.add_feed(feed_url, now)
+        storage.add_or_update_entries(
+            EntryUpdateIntent(
+                EntryData(feed_url, str(i), summary='x' * 1000),
+                now,
+                now,
+                now,
+                now,
+            )
+            for i in range(entries)
+            for feed_url in ['one' if i % 2 else 'two']
+        )
+
+        strategies = {
+            'one_by_one': float('inf'),
+            'single_query': 0,
+        }
+        header = make_header(['size'], list(strategies))
+        row_fmt = make_row_fmt(['size'], list(strategies), '.1f')
+        print(header)
+
+        for size in sizes:
+            # odd ids exist in feed one, even ids don't
+            resource_ids = [('one', str(i)) for i in range(size)]
+            times = []
+            for single_query_min in strategies.values():
+                storage.entries_for_update_single_query_min = single_query_min
+                time = min(
+                    timeit.repeat(
+                        lambda: list(storage.get_entries_for_update(resource_ids)),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                times.append(time / number * 10**6)
+            print(row_fmt.format(size, *times))
+
+        storage.close()
+
+
+RSS_TEMPLATE = """\
+<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+<title>Feed</title>
+<link>https://example.com/</link>
+<description>A feed.</description>
+{}
+</channel>
+</rss>
+"""
+
+RSS_ITEM_TEMPLATE = """\
+<item>
+<title>Entry {0}</title>
+<link>https://example.com/{0}</link>
+<guid>https://example.com/{0}</guid>
+<pubDate>Sun, 06 Sep 2009 16:20:00 +0000</pubDate>
+<description>&lt;p&gt;Summary &lt;a href="/{0}"&gt;{0}&lt;/a&gt;&lt;/p&gt;</description>
+<content:encoded>&lt;p&gt;{1}&lt;/p&gt;</content:encoded>
+</item>
+"""
+
+ATOM_TEMPLATE = """\
+<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Feed</title>
+<link href="https://example.com/"/>
+<id>https://example.com/</id>
+<updated>2009-09-06T16:20:00Z</updated>
+{}
+</feed>
+"""
+
+ATOM_ENTRY_TEMPLATE = """\
+<entry>
+<title>Entry {0}</title>
+<link href="https://example.com/{0}"/>
+<id>https://example.com/{0}</id>
+<updated>2009-09-06T16:20:00Z</updated>
+<author><name>Someone</name></author>
+<summary>Summary {0}</summary>
+<content type="html">&lt;p&gt;{1}&lt;/p&gt;</content>
+</entry>
+"""
+
+
+@cli.command(name='parse-xml')
+@click.option(
+    '--sizes',
+    default='1,10,100,1000',
+    show_default=True,
+    help="Comma-separated numbers of entries per feed.",
+)
+@click.option(
+    '--content-size',
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Size of the content of each entry.",
+)
+@click.option('-n', '--number', type=int, default=1, show_default=True)
+@click.option('-r', '--repeat', type=int, default=5, show_default=True)
+def parse_xml(sizes, content_size, number, repeat):
+    """Compare the feedparser and ElementTree XML parsers by feed size.
+
+    Times are the minimum per call, in milliseconds.
+
+    """
+    import io
+
+    from reader._parser.etree import ElementTreeParser
+    from reader._parser.feedparser import FeedparserParser
+
+    sizes = [int(size) for size in sizes.split(',')]
+    content = ' '.join(['word'] * (content_size // 5))
+    headers = {'content-type': 'application/xml'}
+
+    def fallback(*args):
+        raise RuntimeError("unexpected fallback")
+
+    parsers = {
+        'feedparser': FeedparserParser(),
+        'etree': ElementTreeParser(fallback),
+    }
+    header = make_header(['type', 'size'], list(parsers))
+    row_fmt = make_row_fmt(['type', 'size'], list(parsers), '.2f')
+    print(header)
+
+    templates = {
+        'rss': (RSS_TEMPLATE, RSS_ITEM_TEMPLATE),
+        'atom': (ATOM_TEMPLATE, ATOM_ENTRY_TEMPLATE),
+    }
+    for feed_type, (feed_template, entry_template) in templates.items():
+        for size in sizes:
+            data = feed_template.format(
+                ''.join(entry_template.format(i, content) for i in range(size))
+            ).encode('utf-8')
+
+            times = []
+            for parser in parsers.values():
+
+                def parse():
+                    feed, entries = parser('url', io.BytesIO(data), headers)
+                    assert len(list(entries)) == size
+
+                time = min(timeit.repeat(parse, number=number, repeat=repeat))
+                times.append(time / number * 10**3)
+            print(row_fmt.format(feed_type, size, *times))
+
+
+DATES = {
+    'rfc822': 'Sun, 06 Sep 2009 16:20:00 +0000',
+    'rfc822_gmt': 'Tue, 10 Jun 2003 04:00:00 GMT',
+    'w3dtf': '2003-12-13T18:30:02Z',
+    'w3dtf_date': '2003-12-13',
+    'asctime': 'Sun Jan  4 16:29:06 PST 2004',
+    'iso8601': '20031213T183002Z',
+    'invalid': 'not a date',
+}
+
+
+@cli.command(name='parse-dates')
+@click.option('-n', '--number', type=int, default=1000, show_default=True)
+@click.option('-r', '--repeat', type=int, default=5, show_default=True)
+def parse_dates(number, repeat):
+    """Compare feedparser date parsing strategies by date format.
+
+    sequential tries all the date handlers in order (the original strategy),
+    dispatch skips the ones that can't match based on the shape of the date,
+    and cached is dispatch with the results cached (as used by feedparser).
+
+    Times are the minimum per call, in microseconds.
+
+    """
+    from reader._vendor.feedparser import datetimes
+
+    def sequential(date_string):
+        for handler in datetimes._date_handlers:
+            try:
+                date9tuple = handler(date_string)
+            except (KeyError, OverflowError, ValueError, AttributeError):
+                continue
+            if date9tuple and len(date9tuple) == 9:
+                return date9tuple
+        return None
+
+    strategies = {
+        'sequential': sequential,
+        'dispatch': datetimes._parse_date_cached.__wrapped__,
+        'cached': datetimes._parse_date,
+    }
+    names_width = max(map(len, DATES))
+    header = make_header(['format'.ljust(names_width)], list(strategies))
+    row_fmt = make_row_fmt(['format'.ljust(names_width)], list(strategies), '.2f')
+    print(header)
+
+    for name, date_string in DATES.items():
+        times = []
+        for strategy in strategies.values():
+            time = min(
+                timeit.repeat(
+                    partial(strategy, date_string), number=number, repeat=repeat
+                )
+            )
+            times.append(time / number * 10**6)
+        print(row_fmt.format(name, *times))
+
+
+HTML = {
+    'text': 'Just some text, no markup.',
+    'simple': (
+        '<p>Some <b>bold</b> text &amp; a <a href="rel/x.html?a=1&amp;b=2">link'
+        '</a>, and an <img src="/i.png" alt="i"> image &#8217;quoted&#8217;.</p>'
+    ),
+    'styled': (
+        '<div class="post" style="margin: 0 auto; color: red">'
+        '<pre><code class="py">x = 1</code></pre><!-- c --></div>'
+    ),
+    'script': '<p>embed</p><script async src="//e.com/w.js" charset="utf-8"></script>',
+    'fallback': '<p>a < b</p><!DOCTYPE html><svg><rect/></svg>',
+}
+
+
+@cli.command(name='sanitize-html')
+@click.option(
+    '--repeat-html',
+    type=int,
+    default=20,
+    show_default=True,
+    help="How many times to repeat each snippet.",
+)
+@click.option('-n', '--number', type=int, default=10, show_default=True)
+@click.option('-r', '--repeat', type=int, default=5, show_default=True)
+def sanitize_html(repeat_html, number, repeat):
+    """Compare the sgmllib and html.parser HTML sanitizers by content kind.
+
+    cached is html.parser with a (warm) SanitizeHTMLCache.
+
+    Times are the minimum per call, in microseconds.
+
+    """
+    from reader._parser import sanitizer
+
+    sanitizers = {
+        'sgmllib': sanitizer.sanitize_html_sgmllib,
+        'html.parser': sanitizer.sanitize_html,
+        'cached': sanitizer.SanitizeHTMLCache(),
+    }
+    names_width = max(map(len, HTML))
+    header = make_header(['kind'.ljust(names_width)], list(sanitizers))
+    row_fmt = make_row_fmt(['kind'.ljust(names_width)], list(sanitizers), '.1f')
+    print(header)
+
+    for name, html in HTML.items():
+        html = html * repeat_html
+        times = []
+        for sanitize in sanitizers.values():
+            args = html, 'https://example.com/feed.xml', 'text/html'
+            time = min(
+                timeit.repeat(partial(sanitize, *args), number=number, repeat=repeat)
+            )
+            times.append(time / number * 10**6)
+        print(row_fmt.format(name, *times))
+
+
 @cli.command()
 @click.argument('which', nargs=-1)
 @common_options
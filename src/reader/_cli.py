@@ -6,6 +6,7 @@ import sys
 import traceback
 from contextlib import nullcontext
 from datetime import datetime
+from datetime import timedelta
 
 import click
 import yaml
@@ -306,10 +307,45 @@ def iter_update_status(it, length):
     show_default=True,
     help="Number of threads to use when getting the feeds.",
 )
+@click.option(
+    '--parse-workers',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Number of processes to use when parsing the feeds.",
+)
+@click.option(
+    '--workers-per-host',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Maximum number of threads getting feeds from the same host.",
+)
+@click.option(
+    '--max-feeds',
+    type=click.IntRange(min=0),
+    help="Retrieve at most this many feeds.",
+)
+@click.option(
+    '--deadline',
+    type=click.FloatRange(min=0),
+    help="Stop retrieving new feeds after this many seconds.",
+)
 @make_log_verbose(True, -2)
 @log_command
 @pass_reader
-def update(reader, url, new, scheduled, workers, verbose):
+def update(
+    reader,
+    url,
+    new,
+    scheduled,
+    workers,
+    parse_workers,
+    workers_per_host,
+    max_feeds,
+    deadline,
+    verbose,
+):
     """Update one or all feeds.
 
     If URL is not given, update all the feeds.
@@ -325,11 +361,20 @@ def update(reader, url, new, scheduled, workers, verbose):
 
     """
     it = reader.update_feeds_iter(
-        feed=url, new=new, scheduled=scheduled, workers=workers
+        feed=url,
+        new=new,
+        scheduled=scheduled,
+        workers=workers,
+        parse_workers=parse_workers,
+        workers_per_host=workers_per_host,
+        max_feeds=max_feeds,
+        deadline=timedelta(seconds=deadline) if deadline is not None else None,
     )
     length = reader.get_feed_counts(
         feed=url, new=new, scheduled=scheduled, updates_enabled=True
     ).total
+    if max_feeds is not None:
+        length = min(length, max_feeds)
 
     ok_count = 0
     not_modified_count = 0
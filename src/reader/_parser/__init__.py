@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from collections.abc import Collection
 from collections.abc import Iterable
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -21,6 +20,7 @@ from .._types import EntryData
 from .._types import EntryForUpdate
 from .._types import FeedData
 from .._types import FeedForUpdate
+from .._types import NotModified
 from .._types import ParsedFeed
 from .._utils import lazy_import
 from ..exceptions import ParseError
@@ -45,6 +45,8 @@ T_cv = TypeVar('T_cv', contravariant=True)
 def default_parser(
     feed_root: str | None = None,
     session_timeout: TimeoutType = DEFAULT_TIMEOUT,
+    session_deadline: float | None = None,
+    session_max_size: int | None = None,
     _lazy: bool = True,
 ) -> Parser:
     """Create a pre-configured :class:`Parser`.
@@ -54,6 +56,10 @@ def default_parser(
             See :func:`~reader.make_reader` for details.
         session_timeout (float or tuple(float, float) or None):
             See :func:`~reader.make_reader` for details.
+        session_deadline (float or None):
+            See :func:`~reader.make_reader` for details.
+        session_max_size (int or None):
+            See :func:`~reader.make_reader` for details.
 
     Returns:
         Parser: The parser.
@@ -67,11 +73,11 @@ def default_parser(
         file_retriever = FileRetriever(feed_root)
 
     def post_init(parser: Parser) -> None:
+        from .etree import ElementTreeParser
         from .feedparser import FeedparserParser
         from .http import HTTPRetriever
         from .jsonfeed import JSONFeedParser
-
-        parser.session_factory.timeout = session_timeout
+        from .sanitizer import SanitizeHTMLCache
 
         http_retriever = HTTPRetriever(parser.session_factory.transient)
         parser.mount_retriever('https://', http_retriever)
@@ -80,11 +86,18 @@ def default_parser(
             # empty string means catch-all
             parser.mount_retriever('', file_retriever)
 
-        feedparser_parser = FeedparserParser()
+        # unchanged content gets sanitized only once, whichever parser is used
+        parser.sanitize_html_cache = sanitize_html = SanitizeHTMLCache()
+        feedparser_parser = FeedparserParser(sanitize_html)
+        etree_parser = ElementTreeParser(feedparser_parser, sanitize_html)
+        # for the same quality, the parser mounted first wins;
+        # the etree parser falls back to feedparser for anything it can't handle
+        parser.mount_parser_by_mime_type(etree_parser)
         parser.mount_parser_by_mime_type(feedparser_parser)
         parser.mount_parser_by_mime_type(JSONFeedParser())
         # fall back to feedparser if there's no better match
         # (replicates feedparser's original behavior)
+        parser.mount_parser_by_mime_type(etree_parser, '*/*;q=0.1')
         parser.mount_parser_by_mime_type(feedparser_parser, '*/*;q=0.1')
 
     if not _lazy:
@@ -95,6 +108,12 @@ def default_parser(
     else:
         parser = cast('Parser', LazyParser(post_init))
 
+    # not in post_init(), so they are visible (and can be changed)
+    # before the lazy parser is initialized
+    parser.session_factory.timeout = session_timeout
+    parser.session_factory.deadline = session_deadline
+    parser.session_factory.max_size = session_max_size
+
     return parser
 
 
@@ -183,6 +202,34 @@ class RetrieveResult(_namedtuple_compat, Generic[T_co]):
     #: The HTTP response headers associated with the resource.
     #: Passed to the parser.
     headers: Headers | None = None
+    #: How long (in seconds) the server asked us to wait
+    #: before retrieving the feed again, if at all
+    #: (e.g. via the HTTP ``Cache-Control`` or ``Expires`` headers).
+    #: Used to schedule the next update.
+    #:
+    #: .. versionadded:: 3.14
+    retry_after: int | None = None
+    #: A hash of the resource contents.
+    #: Set by :meth:`Parser.retrieve` for
+    #: :attr:`~RetrieverType.slow_to_read` retrievers.
+    #: If it is the same as on the last update,
+    #: the resource is treated as not modified.
+    #:
+    #: .. versionadded:: 3.14
+    resource_hash: bytes | None = None
+    #: If the resource was retrieved only through permanent redirects
+    #: (e.g. HTTP 301 or 308), the final URL.
+    #: Used to change the feed URL after a number of updates.
+    #:
+    #: .. versionadded:: 3.14
+    permanent_redirect: str | None = None
+    #: Whether the resource contains only the changes
+    #: since the last update (an RFC 3229 ``226 IM Used`` response).
+    #: Entries missing from a delta are not gone, and
+    #: its feed data may be incomplete, so it is ignored.
+    #:
+    #: .. versionadded:: 3.14
+    is_delta: bool = False
 
 
 class RetrieverType(Protocol[T_co]):  # pragma: no cover
@@ -200,7 +247,7 @@ class RetrieverType(Protocol[T_co]):  # pragma: no cover
         http_etag: str | None,
         http_last_modified: str | None,
         http_accept: str | None,
-    ) -> ContextManager[RetrieveResult[T_co] | None]:
+    ) -> ContextManager[RetrieveResult[T_co] | NotModified | None]:
         """Retrieve a feed.
 
         Args:
@@ -213,9 +260,10 @@ class RetrieverType(Protocol[T_co]):  # pragma: no cover
                 Content types to be retrieved, as an HTTP ``Accept`` header.
 
         Returns:
-            contextmanager(RetrieveResult or None):
+            contextmanager(RetrieveResult or NotModified or None):
             A context manager that has as target either the result
-            or :const:`None`, if the feed didn't change.
+            or, if the feed didn't change,
+            a :class:`~reader._types.NotModified` (or :const:`None`).
 
         Raises:
             ParseError
@@ -249,12 +297,19 @@ class FeedForUpdateRetrieverType(RetrieverType[T_co], Protocol):  # pragma: no c
         """
 
 
-FeedAndEntries = tuple[FeedData, Collection[EntryData]]
+FeedAndEntries = tuple[FeedData, Iterable[EntryData]]
 EntryPair = tuple[EntryData, Optional[EntryForUpdate]]
 
 
 class ParserType(Protocol[T_cv]):  # pragma: no cover
-    """A callable that knows how to parse a retrieved feed."""
+    """A callable that knows how to parse a retrieved feed.
+
+    When parsing in other processes
+    (the ``parse_map`` of :meth:`Parser.parallel`),
+    the parser, its arguments, and its results (including exceptions)
+    must be picklable.
+
+    """
 
     def __call__(
         self, url: str, resource: T_cv, headers: Headers | None
@@ -267,11 +322,17 @@ class ParserType(Protocol[T_cv]):  # pragma: no cover
                 The HTTP response headers associated with the resource.
 
         Returns:
-            tuple(FeedData, collection(EntryData)): The feed and entry data.
+            tuple(FeedData, iterable(EntryData)): The feed and entry data.
+            The entries may be a lazy iterable that parses them
+            as it is consumed (raising :exc:`ParseError` if needed);
+            see :meth:`Parser.parse` for details.
 
         Raises:
             ParseError
 
+        .. versionchanged:: 3.14
+            The entries may be any iterable, not just a collection.
+
         """
 
 
@@ -323,11 +384,16 @@ class FeedArgument(Protocol):  # pragma: no cover
     def http_last_modified(self) -> str | None:
         """The the HTTP ``Last-Modified`` header from the last update."""
 
+    @property
+    def resource_hash(self) -> bytes | None:
+        """The :attr:`~RetrieveResult.resource_hash` from the last update."""
+
 
 class FeedArgumentTuple(NamedTuple):
     url: str
     http_etag: str | None = None
     http_last_modified: str | None = None
+    resource_hash: bytes | None = None
 
 
 @contextmanager
@@ -348,3 +414,8 @@ def wrap_exceptions(url: str, when: str) -> Iterator[None]:
 def wrap_cm_exceptions(cm: ContextManager[T], url: str, when: str) -> Iterator[T]:
     with wrap_exceptions(url, when), cm as target:
         yield target
+
+
+def wrap_iter_exceptions(iterable: Iterable[T], url: str, when: str) -> Iterator[T]:
+    with wrap_exceptions(url, when):
+        yield from iterable
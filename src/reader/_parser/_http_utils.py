@@ -3,14 +3,62 @@ HTTP utilities. Contains no business logic.
 
 """
 
+from __future__ import annotations
+
 from collections.abc import Iterable
+from collections.abc import Mapping
+from datetime import datetime
+from datetime import timezone
 
 import werkzeug.http
 
 
 parse_options_header = werkzeug.http.parse_options_header
 parse_accept_header = werkzeug.http.parse_accept_header
+parse_date = werkzeug.http.parse_date
 
 
 def unparse_accept_header(values: Iterable[tuple[str, float]]) -> str:
     return werkzeug.datastructures.MIMEAccept(values).to_header()
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> int | None:
+    """Get how long (in seconds) the server asked us to wait
+    before retrieving the resource again, if at all.
+
+    Uses (in order) Retry-After, Cache-Control max-age, and Expires.
+    HTTP dates are relative to the Date header, if any,
+    or to the current time otherwise.
+
+    ``headers`` must be a case-insensitive mapping.
+
+    https://datatracker.ietf.org/doc/html/rfc9110#name-retry-after
+    https://datatracker.ietf.org/doc/html/rfc9111#name-calculating-freshness-lifet
+
+    """
+    date = parse_date(headers.get('date')) or datetime.now(timezone.utc)
+
+    def seconds_until(value: str) -> int | None:
+        if not (when := parse_date(value)):
+            return None
+        return max(0, int((when - date).total_seconds()))
+
+    if value := headers.get('retry-after', '').strip():
+        if value.isdigit():
+            return int(value)
+        if (rv := seconds_until(value)) is not None:
+            return rv
+
+    cache_control = werkzeug.http.parse_cache_control_header(
+        headers.get('cache-control'), cls=werkzeug.datastructures.ResponseCacheControl
+    )
+    if cache_control.no_store or cache_control.no_cache:
+        return None
+    if cache_control.max_age is not None:
+        age = headers.get('age', '').strip()
+        return max(0, cache_control.max_age - (int(age) if age.isdigit() else 0))
+
+    if expires := headers.get('expires'):
+        return seconds_until(expires)
+
+    return None
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 import mimetypes
-import shutil
 import tempfile
 from collections.abc import Iterable
 from collections.abc import Iterator
 from contextlib import contextmanager
 from contextlib import nullcontext
+from shutil import COPY_BUFSIZE  # type: ignore[attr-defined]
 from typing import Any
 from typing import ContextManager
+from typing import TYPE_CHECKING
 
+from .._types import EntryData
 from .._types import FeedForUpdate
+from .._types import NotModified
 from .._types import ParsedFeed
 from .._utils import MapFunction
 from ..exceptions import InvalidFeedURLError
@@ -27,12 +32,17 @@ from . import RetrieveResult
 from . import RetrieverType
 from . import wrap_cm_exceptions
 from . import wrap_exceptions
+from . import wrap_iter_exceptions
 from ._http_utils import parse_accept_header
 from ._http_utils import unparse_accept_header
 from ._url_utils import normalize_url
 from .requests import SessionFactory
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .sanitizer import SanitizeHTMLCache
+
+
 log = logging.getLogger('reader')
 
 
@@ -79,12 +89,18 @@ class Parser:
         #:
         self.session_factory = SessionFactory()
 
+        #: :class:`~reader._parser.sanitizer.SanitizeHTMLCache`
+        #: shared by the parsers mounted by :func:`default_parser`, if any;
+        #: :class:`~reader.Reader` persists it in storage, if possible.
+        self.sanitize_html_cache: SanitizeHTMLCache | None = None
+
     def parallel(
         self,
         feeds: Iterable[FeedArgument],
         map: MapFunction[Any, Any] = map,
-        is_parallel: bool = True,
-    ) -> Iterable[tuple[FeedArgument, ParsedFeed | None | ParseError]]:
+        parse_map: MapFunction[Any, Any] | None = None,
+        stream: bool = False,
+    ) -> Iterable[tuple[FeedArgument, ParsedFeed | NotModified | None | ParseError]]:
         """Retrieve and parse many feeds, possibly in parallel.
 
         Yields the parsed feeds, as soon as they are ready.
@@ -94,15 +110,26 @@ class Parser:
             map (function):
                 A :func:`map`-like function;
                 the results can be in any order.
-            is_parallel (bool): Whether ``map`` runs the tasks in parallel.
+            parse_map (function or None):
+                A :func:`map`-like function used to parse the feeds,
+                usually backed by a process pool;
+                the function, its arguments, and its results
+                are guaranteed to be picklable.
+                If none, parse the feeds in the current thread.
+            stream (bool):
+                Passed to :meth:`parse`;
+                the entries of a parsed feed can be consumed
+                only until the next (feed, result) pair is requested.
+                Ignored if ``parse_map`` is given.
 
         Yields:
-            tuple(:class:`FeedArgument`, :class:`~reader._types.ParsedFeed` or :const:`None` or :class:`~reader.ParseError`):
+            tuple(:class:`FeedArgument`, :class:`~reader._types.ParsedFeed` or :class:`~reader._types.NotModified` or :const:`None` or :class:`~reader.ParseError`):
 
                 A (feed, result) pair, where result is either:
 
                 * the parsed feed
-                * :const:`None`, if the feed didn't change
+                * a falsy :class:`~reader._types.NotModified` (or :const:`None`),
+                  if the feed didn't change
                 * an exception instance
 
         """
@@ -110,11 +137,12 @@ class Parser:
         def retrieve(
             feed: FeedArgument,
         ) -> tuple[
-            FeedArgument, ContextManager[RetrieveResult[Any] | None] | Exception
+            FeedArgument,
+            ContextManager[RetrieveResult[Any] | NotModified | None] | Exception,
         ]:
             try:
                 context = self.retrieve(
-                    feed.url, feed.http_etag, feed.http_last_modified, is_parallel
+                    feed.url, feed.http_etag, feed.http_last_modified
                 )
                 return feed, context
             except Exception as e:
@@ -127,10 +155,16 @@ class Parser:
             # if stuff hangs weirdly during debugging, change this to builtins.map
             retrieve_results = map(retrieve, feeds)
 
-            # we could parallelize parse() as well;
-            # however, most of the time is spent in pure-Python code,
-            # which doesn't benefit from the threads on CPython:
+            # Most of the time parse() is spent in pure-Python code,
+            # which doesn't benefit from threads on CPython:
             # https://github.com/lemon24/reader/issues/261#issuecomment-956412131
+            # So, we parse in the current thread by default,
+            # and allow using a process pool instead.
+
+            if parse_map is not None:
+                parse_args = self._detach_retrieve_results(retrieve_results)
+                yield from parse_map(parse_detached, parse_args)
+                return
 
             for feed, context in retrieve_results:
                 if isinstance(context, ParseError):
@@ -145,13 +179,61 @@ class Parser:
                         if not result or isinstance(result, ParseError):
                             yield feed, result
                             continue
+                        if resource_unchanged(feed, result):
+                            yield feed, NotModified(result.retry_after)
+                            continue
 
-                        yield feed, self.parse(feed.url, result)
+                        yield feed, self.parse(feed.url, result, stream=stream)
 
                 except ParseError as e:
                     log.debug("parse() exception, traceback follows", exc_info=True)
                     yield feed, e
 
+    def _detach_retrieve_results(
+        self,
+        retrieve_results: Iterable[
+            tuple[
+                FeedArgument,
+                ContextManager[RetrieveResult[Any] | NotModified | None] | Exception,
+            ]
+        ],
+    ) -> Iterable[DetachedParseArgs]:
+        # Turn retrieve results into something that can be sent
+        # to another process (the resource is read fully into memory).
+        # Results that don't need parsing are passed through as-is.
+
+        for feed, context in retrieve_results:
+            if isinstance(context, ParseError):
+                yield feed, context
+                continue
+
+            if isinstance(context, Exception):  # pragma: no cover
+                raise context
+
+            try:
+                with context as result:
+                    if result is None or isinstance(result, NotModified):
+                        yield feed, result
+                        continue
+                    if isinstance(result, ParseError):
+                        yield feed, result
+                        continue
+                    if resource_unchanged(feed, result):
+                        yield feed, NotModified(result.retry_after)
+                        continue
+
+                    parser, mime_type = self.get_parser(feed.url, result.mime_type)
+                    with wrap_exceptions(feed.url, "while reading feed"):
+                        resource = io.BytesIO(result.resource.read())
+                    result = result._replace(resource=resource, mime_type=mime_type)
+
+            except ParseError as e:
+                log.debug("parse() exception, traceback follows", exc_info=True)
+                yield feed, e
+                continue
+
+            yield feed, (parser, result)
+
     def __call__(
         self,
         url: str,
@@ -179,66 +261,55 @@ class Parser:
         """
         feed = FeedArgumentTuple(url, http_etag, http_last_modified)
 
-        # is_parallel=True ensures the parser tests cover more code
-        ((_, result),) = self.parallel([feed], is_parallel=True)
+        ((_, result),) = self.parallel([feed])
 
         if isinstance(result, Exception):
             raise result
-        return result
+        return result or None
 
     def retrieve(
         self,
         url: str,
         http_etag: str | None = None,
         http_last_modified: str | None = None,
-        is_parallel: bool = False,
-    ) -> ContextManager[RetrieveResult[Any] | None]:
+    ) -> ContextManager[RetrieveResult[Any] | NotModified | None]:
         """Retrieve a feed.
 
+        The contents of :attr:`~RetrieverType.slow_to_read` retrievers
+        are read into a temporary file
+        (and the result gets a :attr:`~RetrieveResult.resource_hash`).
+
         Args:
             url (str): The feed URL.
             http_etag (str or None):
                 The HTTP ``ETag`` header from the last update.
             http_last_modified (str or None):
                 The the HTTP ``Last-Modified`` header from the last update.
-            is_parallel (bool):
-                Whether this was called from :meth:`parallel`
-                (writes the contents to a temporary file, if possible).
 
         Returns:
-            contextmanager(RetrieveResult or None):
+            contextmanager(RetrieveResult or NotModified or None):
             A context manager that has as target either the result
-            or :const:`None`, if the feed didn't change.
+            or, if the feed didn't change,
+            a :class:`~reader._types.NotModified` (or :const:`None`).
 
         Raises:
             ParseError
 
         """
-        parser = self.get_parser_by_url(url)
-
-        http_accept: str | None
-        if not parser:
-            http_accept = unparse_accept_header(
-                (mime_type, quality)
-                for mime_type, parsers in self.parsers_by_mime_type.items()
-                for quality, _ in parsers
-            )
-        else:
-            # URL parsers get the default session / requests Accept (*/*);
-            # later, we may use parser.http_accept, if it exists, but YAGNI
-            http_accept = None
-
+        http_accept = self._get_http_accept(url)
         retriever = self.get_retriever(url)
 
         with wrap_exceptions(url, 'during retriever'):
             context = retriever(url, http_etag, http_last_modified, http_accept)
         context = wrap_cm_exceptions(context, url, 'during retriever')
 
-        if not (is_parallel and retriever.slow_to_read):
+        if not retriever.slow_to_read:
             return context
 
         # Ensure we read everything *before* yielding the response,
         # i.e. __enter__() does most of the work.
+        # We also hash the contents on the way,
+        # so parallel() can skip parsing if they did not change.
         #
         # Gives a ~20% speed improvement over yielding response.raw
         # when updating many feeds in parallel,
@@ -250,13 +321,18 @@ class Parser:
 
         with context as result:
             if not result:
-                return nullcontext()
+                return nullcontext(result)
 
             temp = tempfile.TemporaryFile()
-            shutil.copyfileobj(result.resource, temp)
+            resource_hash = hashlib.md5()
+            while chunk := result.resource.read(COPY_BUFSIZE):
+                resource_hash.update(chunk)
+                temp.write(chunk)
             temp.seek(0)
 
-            result = result._replace(resource=temp)
+            result = result._replace(
+                resource=temp, resource_hash=resource_hash.digest()
+            )
 
         @contextmanager
         def make_context() -> Iterator[RetrieveResult[Any]]:
@@ -266,12 +342,33 @@ class Parser:
 
         return make_context()
 
-    def parse(self, url: str, result: RetrieveResult[Any]) -> ParsedFeed:
+    def _get_http_accept(self, url: str) -> str | None:
+        if self.get_parser_by_url(url):
+            # URL parsers get the default session / requests Accept (*/*);
+            # later, we may use parser.http_accept, if it exists, but YAGNI
+            return None
+        # parsers are sorted by quality, and only the last one gets used
+        return unparse_accept_header(
+            (mime_type, parsers[-1][0])
+            for mime_type, parsers in self.parsers_by_mime_type.items()
+            if parsers
+        )
+
+    def parse(
+        self, url: str, result: RetrieveResult[Any], stream: bool = False
+    ) -> ParsedFeed:
         """Parse a retrieved feed.
 
         Args:
             url (str): The feed URL.
             result (RetrieveResult): A retrieve result.
+            stream (bool):
+                If true, the entries are an iterator
+                that yields them as the parser produces them
+                (instead of a list), so only some of them
+                need to be in memory at any given time;
+                parsing errors are raised as :exc:`ParseError` when iterating.
+                The iterator may need the result resource to remain open.
 
         Returns:
             ParsedFeed: The feed and entry data.
@@ -281,12 +378,7 @@ class Parser:
 
         """
         parser, mime_type = self.get_parser(url, result.mime_type)
-        with wrap_exceptions(url, 'during parser'):
-            feed, entries = parser(url, result.resource, result.headers)
-            entries = list(entries)
-        return ParsedFeed(
-            feed, entries, result.http_etag, result.http_last_modified, mime_type
-        )
+        return parse_with(parser, url, result._replace(mime_type=mime_type), stream)
 
     def get_parser(
         self, url: str, mime_type: str | None
@@ -511,5 +603,76 @@ class Parser:
         parser, _ = self.get_parser(url, mime_type)
         if not isinstance(parser, EntryPairsParserType):
             return pairs
-        with wrap_exceptions(url, "during parser.process_entry_pairs()"):
-            return list(parser.process_entry_pairs(url, pairs))
+        when = "during parser.process_entry_pairs()"
+        with wrap_exceptions(url, when):
+            pairs = parser.process_entry_pairs(url, pairs)
+        # don't consume the pairs here, so the entries can be streamed
+        return wrap_iter_exceptions(pairs, url, when)
+
+
+def parse_with(
+    parser: ParserType[Any],
+    url: str,
+    result: RetrieveResult[Any],
+    stream: bool = False,
+) -> ParsedFeed:
+    """Parse a retrieved feed with a specific parser.
+
+    The result mime_type should be the one returned by :meth:`Parser.get_parser`.
+
+    """
+    entries: Iterable[EntryData]
+    with wrap_exceptions(url, 'during parser'):
+        feed, entries = parser(url, result.resource, result.headers)
+        if stream:
+            entries = wrap_iter_exceptions(entries, url, 'during parser')
+        else:
+            entries = list(entries)
+    return ParsedFeed(
+        feed,
+        entries,
+        result.http_etag,
+        result.http_last_modified,
+        result.mime_type,
+        result.retry_after,
+        result.resource_hash,
+        result.permanent_redirect,
+        result.is_delta,
+    )
+
+
+def resource_unchanged(feed: FeedArgument, result: RetrieveResult[Any]) -> bool:
+    """Check if the retrieved resource is the same as on the last update,
+    in which case it can be treated as not modified (like HTTP 304).
+
+    """
+    if not result.resource_hash or result.resource_hash != feed.resource_hash:
+        return False
+    log.info("update feed %r: resource hash unchanged, not parsing", feed.url)
+    return True
+
+
+DetachedParseArgs = tuple[
+    FeedArgument,
+    tuple[ParserType[Any], RetrieveResult[Any]] | ParseError | NotModified | None,
+]
+
+
+def parse_detached(
+    args: DetachedParseArgs,
+) -> tuple[FeedArgument, ParsedFeed | NotModified | None | ParseError]:
+    """Worker function for :meth:`Parser.parallel` ``parse_map``.
+
+    Must be a module-level function, so it can be pickled.
+
+    """
+    feed, value = args
+    if not isinstance(value, tuple):
+        return feed, value
+    parser, result = value
+    try:
+        with result.resource:
+            return feed, parse_with(parser, feed.url, result)
+    except ParseError as e:
+        log.debug("parse() exception, traceback follows", exc_info=True)
+        return feed, e
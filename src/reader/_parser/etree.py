@@ -0,0 +1,792 @@
+"""
+A fast path for parsing well-formed RSS 2.0 and Atom 1.0 feeds.
+
+:class:`ElementTreeParser` builds the same intermediate data as feedparser
+(``FeedParserDict`` objects) using :func:`~xml.etree.ElementTree.iterparse`,
+without going through feedparser's SAX handlers,
+and then post-processes it exactly like :class:`.FeedparserParser` does.
+
+The document is parsed twice: first for the feed
+(which also checks the whole document is well-formed),
+then for the entries, lazily, one at a time, as they are consumed,
+so memory usage does not grow with the number of entries.
+
+It only knows about a subset of the two formats,
+and replicates feedparser's behavior (quirks included) for that subset only.
+Anything outside it (other feed types or encodings, DOCTYPEs, ``xml:base``,
+XHTML or base64 content, unknown or repeated elements, extension namespaces
+other than a few common ones etc.) is delegated to the fallback parser,
+so the result is the same as if the fallback parser was used directly.
+If an entry turns out to be unsupported after some entries were returned,
+the remaining entries come from the fallback parser.
+
+tests/test_parser_etree.py compares the two on a corpus of feeds.
+
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import logging
+import re
+from collections.abc import Iterator
+from typing import Any
+from typing import IO
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree
+
+from .._types import EntryData
+from .._vendor.feedparser import NonXMLContentType
+from .._vendor.feedparser.datetimes import _parse_date
+from .._vendor.feedparser.encodings import parse_content_type
+from .._vendor.feedparser.encodings import RE_XML_PI_ENCODING
+from .._vendor.feedparser.html import _cp1252
+from .._vendor.feedparser.mixin import XMLParserMixin
+from .._vendor.feedparser.urls import _urljoin
+from .._vendor.feedparser.urls import make_safe_absolute_uri
+from .._vendor.feedparser.util import FeedParserDict
+from .feedparser import _process_entries
+from .feedparser import _process_feed_data
+from .feedparser import FeedparserParser
+from .sanitizer import sanitize_html
+from .sanitizer import SanitizeHTML
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from xml.etree.ElementTree import Element
+
+    from . import FeedAndEntries
+    from . import ParserType
+    from .requests import Headers
+
+
+log = logging.getLogger('reader')
+
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+
+# Extension namespaces feedparser has no handlers for,
+# whose (childless) elements can be safely skipped.
+IGNORED_NAMESPACES = (
+    '{http://purl.org/rss/1.0/modules/slash/}',
+    '{http://purl.org/rss/1.0/modules/syndication/}',
+    '{http://wellformedweb.org/CommentAPI/}',
+)
+
+# Childless elements whose values we don't use,
+# and which don't change the state of the feedparser parser
+# in a way that would change the values we do use.
+IGNORED_RSS_CHANNEL = {
+    'pubDate',
+    'webMaster',
+    'language',
+    'ttl',
+    'generator',
+    'docs',
+    'copyright',
+    'category',
+    'cloud',
+}
+IGNORED_RSS_ITEM = {'category', 'comments'}
+IGNORED_RSS_IMAGE = {'title', 'url', 'link', 'width', 'height', 'description'}
+IGNORED_ATOM_FEED = {
+    ATOM + name
+    for name in ['published', 'generator', 'rights', 'icon', 'logo', 'category']
+}
+IGNORED_ATOM_ENTRY = {ATOM + name for name in ['rights', 'category']}
+ATOM_PERSON = {ATOM + name for name in ['name', 'email', 'uri']}
+
+# Elements that can appear more than once.
+REPEATABLE = {'category', 'enclosure', 'content', CONTENT_ENCODED} | {
+    ATOM + name for name in ['link', 'content', 'contributor', 'category']
+}
+
+# Declaring these makes feedparser think the feed is RSS 0.90 / 1.0.
+RDF_NAMESPACES = {
+    'http://my.netscape.com/rdf/simple/0.9/',
+    'http://purl.org/rss/1.0/',
+}
+
+# From XMLParserMixin.
+CAN_BE_RELATIVE_URI = XMLParserMixin.can_be_relative_uri
+CAN_CONTAIN_RELATIVE_URIS = XMLParserMixin.can_contain_relative_uris
+CAN_CONTAIN_DANGEROUS_MARKUP = XMLParserMixin.can_contain_dangerous_markup
+HTML_TYPES = XMLParserMixin.html_types
+
+# Text content types we know how to handle.
+TEXT_TYPES = {'text/plain', 'text/html'}
+
+# How much of the document to use for checking the encoding and prolog.
+HEAD_SIZE = 2**16
+
+PROLOG_RE = re.compile(rb'(?:\s+|<\?.*?\?>|<!--.*?-->)*', re.DOTALL)
+LINK_ENTITY_RE = re.compile('&([A-Za-z0-9_]+);')
+
+
+class ElementTreeParser:
+    """Parse common, well-formed RSS 2.0 and Atom 1.0 feeds
+    using :mod:`xml.etree.ElementTree`, falling back to another parser
+    (by default, :class:`.FeedparserParser`) for everything else.
+
+    The result is the same as that of :class:`.FeedparserParser`.
+
+    """
+
+    http_accept = (
+        'application/atom+xml,application/rss+xml,'
+        'application/xml;q=0.9,text/xml;q=0.2'
+    )
+
+    def __init__(
+        self,
+        fallback: ParserType[IO[bytes]] | None = None,
+        sanitize_html: SanitizeHTML = sanitize_html,
+    ) -> None:
+        self.fallback = fallback or FeedparserParser(sanitize_html)
+        #: Like :attr:`.FeedparserParser.sanitize_html`.
+        self.sanitize_html = sanitize_html
+
+    def __call__(
+        self,
+        url: str,
+        resource: IO[bytes],
+        headers: Headers | None = None,
+    ) -> FeedAndEntries:
+        # The document is read more than once, so it must be seekable.
+        resource, start = _make_seekable(resource)
+
+        head = resource.read(HEAD_SIZE)
+        resource.seek(start)
+        try:
+            builder, result = _parse_feed(head, resource, headers, self.sanitize_html)
+        except (_Unsupported, ElementTree.ParseError) as e:
+            log.debug("parse %s: falling back to %r: %s", url, self.fallback, e)
+            resource.seek(start)
+            return self.fallback(url, resource, headers)
+
+        feed = _process_feed_data(url, result)
+        resource.seek(start)
+        return feed, self._parse_entries(url, resource, start, headers, builder)
+
+    def _parse_entries(
+        self,
+        url: str,
+        resource: IO[bytes],
+        start: int,
+        headers: Headers | None,
+        builder: _Builder,
+    ) -> Iterator[EntryData]:
+        # The whole document was checked when parsing the feed,
+        # so at this point, only entries can be unsupported.
+        count = 0
+        try:
+            entries = _iter_entries(resource, builder)
+            for entry in _process_entries(url, entries, not builder.atom):
+                yield entry
+                count += 1
+        except _Unsupported as e:
+            log.debug(
+                "parse %s: falling back to %r after %d entries: %s",
+                *(url, self.fallback, count, e),
+            )
+            # the fallback skips the same (invalid) entries,
+            # so the first count of its entries are the ones we yielded
+            resource.seek(start)
+            _, fallback_entries = self.fallback(url, resource, headers)
+            yield from itertools.islice(fallback_entries, count, None)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _make_seekable(resource: IO[bytes]) -> tuple[IO[bytes], int]:
+    try:
+        # mmap objects have seek() and tell(), but no seekable()
+        start = resource.tell()
+        resource.seek(start)
+    except (AttributeError, OSError, ValueError):
+        return io.BytesIO(resource.read()), 0
+    return resource, start
+
+
+def _parse_feed(
+    head: bytes,
+    resource: IO[bytes],
+    headers: Headers | None,
+    sanitize_html: SanitizeHTML,
+) -> tuple[_Builder, Any]:
+    # feedparser copies the headers to a dict, so lookups are case-sensitive
+    http_headers = dict(headers or {})
+    error = _check_encoding(head, http_headers)
+
+    # if the prolog is longer than head, it looks like a DOCTYPE (fall back)
+    prolog = PROLOG_RE.match(head)
+    assert prolog is not None
+    if head.startswith(b'<!', prolog.end()):
+        raise _Unsupported("DOCTYPE")
+
+    # like feedparser.api._parse_file_inplace() and unknown_starttag()
+    base = http_headers.get('content-location', '')
+    if base:
+        base = make_safe_absolute_uri(base, base) or base
+    lang = http_headers.get('content-language')
+
+    builder: _Builder | None = None
+    root: Element | None = None
+    stack: list[Element] = []
+
+    events = ElementTree.iterparse(resource, ('start', 'end', 'start-ns'))
+    for event, elem in events:
+        if event == 'start-ns':
+            _, uri = elem
+            if uri.lower() in RDF_NAMESPACES:
+                raise _Unsupported(f"namespace {uri}")
+            continue
+
+        if event == 'start':
+            if not stack:
+                builder = _Builder.for_root(elem, base, lang, sanitize_html)
+                root = elem
+            stack.append(elem)
+            continue
+
+        assert builder is not None
+        stack.pop()
+        if builder.is_entry(elem, stack):
+            # entries are parsed later, by _iter_entries()
+            stack[-1].remove(elem)
+
+    assert builder is not None and root is not None
+    result = FeedParserDict(
+        bozo=False,
+        version=builder.version,
+        feed=builder.feed(root),
+        entries=[],
+    )
+    if error:
+        result.update(bozo=True, bozo_exception=error)
+    return builder, result
+
+
+def _iter_entries(resource: IO[bytes], builder: _Builder) -> Iterator[Any]:
+    stack: list[Element] = []
+    for event, elem in ElementTree.iterparse(resource, ('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+        stack.pop()
+        if builder.is_entry(elem, stack):
+            yield builder.entry(elem, stack)
+            # keep memory usage flat(ish) for large feeds
+            stack[-1].remove(elem)
+
+
+def _check_encoding(data: bytes, http_headers: dict[str, str]) -> Exception | None:
+    """Bail out if feedparser would not decode data as UTF-8.
+
+    Return the (survivable) error feedparser would set, if any.
+
+    Like feedparser.encodings.convert_to_utf8(), but no BOMs.
+
+    """
+    if not data.lstrip()[:1] == b'<' or b'\x00' in data[:4]:
+        raise _Unsupported("unknown encoding")
+
+    xml_encoding = ''
+    if match := RE_XML_PI_ENCODING.match(data):
+        xml_encoding = match.group(1).decode('utf-8').lower()
+
+    content_type, http_encoding = parse_content_type(
+        http_headers.get('content-type') or ''
+    )
+
+    acceptable_content_type = True
+    if content_type in ('application/xml', 'application/xml-dtd') or (
+        content_type.startswith('application/') and content_type.endswith('+xml')
+    ):
+        encoding = http_encoding or xml_encoding or 'utf-8'
+    elif content_type == 'text/xml' or (
+        content_type.startswith('text/') and content_type.endswith('+xml')
+    ):
+        encoding = http_encoding or 'us-ascii'
+    elif content_type in ('application/feed+json', 'application/json'):
+        raise _Unsupported("JSON")
+    elif content_type.startswith('text/'):
+        acceptable_content_type = False
+        encoding = http_encoding or 'us-ascii'
+    elif http_headers and 'content-type' not in http_headers:
+        acceptable_content_type = False
+        encoding = xml_encoding or 'iso-8859-1'
+    else:
+        acceptable_content_type = False
+        encoding = xml_encoding or 'utf-8'
+
+    if encoding.lower() not in ('utf-8', 'utf8'):
+        raise _Unsupported(f"encoding {encoding!r}")
+    if xml_encoding not in ('', 'utf-8', 'utf8'):
+        raise _Unsupported(f"declared encoding {xml_encoding!r}")
+
+    if http_headers and not acceptable_content_type:
+        if 'content-type' in http_headers:
+            message = f"{http_headers['content-type']} is not an accepted media type"
+        else:
+            message = "no Content-type specified"
+        return NonXMLContentType(message)
+    return None
+
+
+class _Builder:
+    """Turn elements into the FeedParserDicts feedparser would return.
+
+    Element handling mirrors the feedparser XMLParserMixin
+    (and namespaces._base.Namespace) _start_*() / _end_*() methods.
+
+    """
+
+    version: str
+    feed_tag: str
+    entry_tag: str
+    atom: bool
+
+    def __init__(
+        self, base: str, lang: str | None, sanitize_html: SanitizeHTML
+    ) -> None:
+        self.base = base
+        self.lang = lang
+        self.sanitize_html = sanitize_html
+
+    @staticmethod
+    def for_root(
+        root: Element, base: str, lang: str | None, sanitize_html: SanitizeHTML
+    ) -> _Builder:
+        attrs = _get_attrs(root)
+        builder: _Builder
+        if root.tag == ATOM + 'feed':
+            builder = _AtomBuilder(base, lang, sanitize_html)
+        elif root.tag == 'rss' and attrs.get('version', '').startswith('2.'):
+            builder = _RSSBuilder(base, lang, sanitize_html)
+        else:
+            raise _Unsupported(f"root element {root.tag}")
+        if attrs.keys() - {'version', 'xml:lang', 'lang'}:
+            raise _Unsupported(f"{root.tag} attributes")
+        builder.lang = _get_lang(builder.lang, attrs)
+        return builder
+
+    def is_entry(self, elem: Element, stack: list[Element]) -> bool:
+        return (
+            elem.tag == self.entry_tag
+            and len(stack) == (1 if self.atom else 2)
+            and stack[-1].tag == self.feed_tag
+        )
+
+    def feed(self, root: Element) -> Any:  # pragma: no cover
+        raise NotImplementedError
+
+    def entry(self, elem: Element, stack: list[Element]) -> Any:  # pragma: no cover
+        raise NotImplementedError
+
+    def get_lang(self, stack: list[Element]) -> str | None:
+        lang = self.lang
+        for elem in stack[1:]:
+            lang = _get_lang(lang, _get_attrs(elem))
+        return lang
+
+    def pop(
+        self,
+        element: str,
+        text: str | None,
+        content_type: str | None = None,
+        guidislink: bool = False,
+    ) -> str:
+        """Like XMLParserMixin.pop()."""
+        output = (text or '').strip()
+
+        if element in CAN_BE_RELATIVE_URI and output:
+            if not element == 'id' or guidislink:
+                output = _urljoin(self.base, output)
+
+        content_type = content_type or 'text/html'
+        if content_type in HTML_TYPES:
+            # like XMLParserMixin.pop() with html_sanitizer set
+            # (the two element sets are the same)
+            if (
+                element in CAN_CONTAIN_RELATIVE_URIS
+                and element in CAN_CONTAIN_DANGEROUS_MARKUP
+            ):
+                output = self.sanitize_html(output, self.base, content_type)
+
+        try:
+            output = output.encode('iso-8859-1').decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+
+        return output.translate(_cp1252)
+
+    def text(
+        self,
+        element: str,
+        elem: Element,
+        attrs: dict[str, str],
+        default_type: str = 'text/plain',
+        allowed_types: set[str] = TEXT_TYPES,
+    ) -> tuple[str, str]:
+        """Handle a push_content() / pop_content() element."""
+        _check_childless(elem)
+        if 'src' in attrs:
+            raise _Unsupported(f"{elem.tag} src")
+        content_type = _map_content_type(attrs.get('type', default_type))
+        if content_type not in allowed_types:
+            raise _Unsupported(f"{elem.tag} type {content_type!r}")
+
+        # some feed formats require consumers to guess
+        # whether the content is html or plain text
+        if not self.atom and content_type == 'text/plain':
+            if XMLParserMixin.looks_like_html((elem.text or '').strip()):
+                content_type = 'text/html'
+
+        return self.pop(element, elem.text, content_type), content_type
+
+    def date(self, element: str, elem: Element) -> Any:
+        """Like _end_updated() / _end_published()."""
+        _check_childless(elem)
+        return _parse_date(self.pop(element, elem.text))
+
+    def link(self, context: Any, elem: Element, attrs: dict[str, str]) -> None:
+        """Like _start_link(), for elements with an href."""
+        _check_childless(elem)
+        attrs.setdefault('rel', 'alternate')
+        if attrs['rel'] == 'self':
+            attrs.setdefault('type', 'application/atom+xml')
+        else:
+            attrs.setdefault('type', 'text/html')
+        attrs = XMLParserMixin._enforce_href(attrs)
+        if 'href' not in attrs:
+            raise _Unsupported("link without href")
+        attrs['href'] = _urljoin(self.base, attrs['href'])
+        context.setdefault('links', []).append(FeedParserDict(attrs))
+        if attrs['rel'] == 'alternate':
+            if _map_content_type(attrs['type']) in HTML_TYPES:
+                context['link'] = attrs['href']
+
+    def id(self, context: Any, elem: Element, attrs: dict[str, str]) -> None:
+        """Like _start_guid() / _end_guid()."""
+        _check_childless(elem)
+        guidislink = attrs.get('ispermalink', 'true') == 'true'
+        value = self.pop('id', elem.text, guidislink=guidislink)
+        context['id'] = value
+        context['guidislink'] = guidislink and 'link' not in context
+        if guidislink:
+            context.setdefault('link', value)
+
+    def content(
+        self,
+        context: Any,
+        elem: Element,
+        attrs: dict[str, str],
+        lang: str | None,
+        default_type: str = 'text/plain',
+    ) -> None:
+        """Like _start_content() / _end_content()."""
+        # any text/* type is fine (no base64, not sanitized unless HTML)
+        content_type = _map_content_type(attrs.get('type', default_type))
+        if not content_type.startswith('text/'):
+            raise _Unsupported(f"content type {content_type!r}")
+        value, content_type = self.text(
+            'content', elem, attrs, default_type, {content_type}
+        )
+
+        lang = _get_lang(lang, attrs)
+        context.setdefault('content', []).append(
+            FeedParserDict(
+                type=content_type,
+                language=lang.replace('_', '-') if lang else lang,
+                base=self.base,
+                value=value,
+            )
+        )
+        if content_type in {'text/plain'} | HTML_TYPES:
+            context.setdefault('summary', value)
+
+
+class _AtomBuilder(_Builder):
+    version = 'atom10'
+    feed_tag = ATOM + 'feed'
+    entry_tag = ATOM + 'entry'
+    atom = True
+
+    def feed(self, root: Element) -> Any:
+        context = FeedParserDict()
+        seen: set[str] = set()
+
+        for elem in root:
+            tag = elem.tag
+            attrs = _get_attrs(elem)
+            _check_unique(tag, seen)
+
+            if tag == ATOM + 'title':
+                context['title'], _ = self.text('title', elem, attrs)
+            elif tag == ATOM + 'subtitle':
+                context['subtitle'], _ = self.text('subtitle', elem, attrs)
+            elif tag == ATOM + 'link':
+                self.link(context, elem, attrs)
+            elif tag == ATOM + 'id':
+                self.id(context, elem, attrs)
+            elif tag == ATOM + 'updated':
+                context['updated_parsed'] = self.date('updated', elem)
+            elif tag == ATOM + 'author':
+                context['author'] = self.author(elem)
+            elif tag == ATOM + 'contributor':
+                self.author(elem)
+            else:
+                _check_ignored(elem, IGNORED_ATOM_FEED)
+
+        return context
+
+    def entry(self, entry: Element, stack: list[Element]) -> Any:
+        entry_attrs = _get_attrs(entry)
+        if entry_attrs.keys() - {'xml:lang', 'lang'}:
+            raise _Unsupported("entry attributes")
+        entry_lang = _get_lang(self.get_lang(stack), entry_attrs)
+
+        context = FeedParserDict()
+        seen: set[str] = set()
+
+        for elem in entry:
+            tag = elem.tag
+            attrs = _get_attrs(elem)
+            _check_unique(tag, seen)
+
+            if tag == ATOM + 'title':
+                context['title'], _ = self.text('title', elem, attrs)
+            elif tag == ATOM + 'summary':
+                context['summary'], _ = self.text('summary', elem, attrs)
+            elif tag == ATOM + 'content':
+                self.content(context, elem, attrs, entry_lang)
+            elif tag == ATOM + 'link':
+                self.link(context, elem, attrs)
+            elif tag == ATOM + 'id':
+                self.id(context, elem, attrs)
+            elif tag == ATOM + 'updated':
+                context['updated_parsed'] = self.date('updated', elem)
+            elif tag == ATOM + 'published':
+                context['published_parsed'] = self.date('published', elem)
+            elif tag == ATOM + 'author':
+                context['author'] = self.author(elem)
+            elif tag == ATOM + 'contributor':
+                self.author(elem)
+            else:
+                _check_ignored(elem, IGNORED_ATOM_ENTRY)
+
+        return context
+
+    def author(self, elem: Element) -> str:
+        """Like _start_author() / _end_author() / _sync_author_detail()."""
+        detail = {}
+        for child in elem:
+            if child.tag not in ATOM_PERSON:
+                raise _Unsupported(f"{elem.tag} child {child.tag}")
+            _check_childless(child)
+            _get_attrs(child)
+            # pushed with expecting_text=0, so only whitespace is stripped
+            detail[child.tag] = (child.text or '').strip()
+
+        name = detail.get(ATOM + 'name')
+        email = detail.get(ATOM + 'email')
+        if name and email:
+            return f"{name} ({email})"
+        if name:
+            return name
+        if email:
+            return email
+
+        # the text between children also ends up in the author element
+        text = ''.join([elem.text or ''] + [child.tail or '' for child in elem])
+        return self.pop('author', text)
+
+
+class _RSSBuilder(_Builder):
+    version = 'rss20'
+    feed_tag = 'channel'
+    entry_tag = 'item'
+    atom = False
+
+    def feed(self, root: Element) -> Any:
+        if len(root) != 1 or root[0].tag != 'channel':
+            raise _Unsupported("rss children")
+        channel = root[0]
+        if _get_attrs(channel):
+            raise _Unsupported("channel attributes")
+
+        context = FeedParserDict()
+        seen: set[str] = set()
+
+        for elem in channel:
+            tag = elem.tag
+            attrs = _get_attrs(elem)
+
+            if tag == ATOM + 'link':
+                self.link(context, elem, attrs)
+                continue
+
+            if tag in ('author', 'managingEditor', DC_CREATOR):
+                _check_unique('author', seen)
+            else:
+                _check_unique(tag, seen)
+
+            if tag == 'title':
+                context['title'], _ = self.text('title', elem, attrs)
+            elif tag == 'description':
+                context['subtitle'], _ = self.text(
+                    'description', elem, attrs, 'text/html'
+                )
+            elif tag == 'link':
+                context['link'] = _fix_link_entities(self.link_text(elem, attrs))
+            elif tag == 'lastBuildDate':
+                context['updated_parsed'] = self.date('updated', elem)
+            elif tag in ('author', 'managingEditor', DC_CREATOR):
+                context['author'] = self.author(elem)
+            elif tag == 'image':
+                for child in elem:
+                    _check_ignored(child, IGNORED_RSS_IMAGE)
+            else:
+                _check_ignored(elem, IGNORED_RSS_CHANNEL)
+
+        return context
+
+    def entry(self, item: Element, stack: list[Element]) -> Any:
+        if _get_attrs(item):
+            raise _Unsupported("item attributes")
+        item_lang = self.get_lang(stack)
+
+        context = FeedParserDict()
+        seen: set[str] = set()
+
+        for elem in item:
+            tag = elem.tag
+            attrs = _get_attrs(elem)
+
+            if tag == ATOM + 'link':
+                self.link(context, elem, attrs)
+                continue
+            if tag == 'enclosure':
+                self.enclosure(context, elem, attrs)
+                continue
+
+            if tag in ('author', DC_CREATOR):
+                _check_unique('author', seen)
+            else:
+                _check_unique(tag, seen)
+
+            if tag == 'title':
+                context['title'], _ = self.text('title', elem, attrs)
+            elif tag == 'description':
+                context['summary'], _ = self.text(
+                    'description', elem, attrs, 'text/html'
+                )
+            elif tag == CONTENT_ENCODED:
+                self.content(context, elem, attrs, item_lang, 'text/html')
+            elif tag == 'content':
+                self.content(context, elem, attrs, item_lang)
+            elif tag == 'link':
+                value = self.link_text(elem, attrs).replace('&amp;', '&')
+                context['link'] = _fix_link_entities(value)
+            elif tag == 'guid':
+                self.id(context, elem, attrs)
+            elif tag == 'pubDate':
+                context['published_parsed'] = self.date('published', elem)
+            elif tag in ('author', DC_CREATOR):
+                context['author'] = self.author(elem)
+            else:
+                _check_ignored(elem, IGNORED_RSS_ITEM)
+
+        return context
+
+    def link_text(self, elem: Element, attrs: dict[str, str]) -> str:
+        """Like _start_link() / _end_link(), for elements with text."""
+        _check_childless(elem)
+        if attrs.keys() - {'xml:lang', 'lang'}:
+            raise _Unsupported("link attributes")
+        return self.pop('link', elem.text)
+
+    def author(self, elem: Element) -> str:
+        # detail is empty, so _sync_author_detail() leaves the value alone
+        _check_childless(elem)
+        return self.pop('author', elem.text)
+
+    def enclosure(self, context: Any, elem: Element, attrs: dict[str, str]) -> None:
+        """Like _start_enclosure()."""
+        _check_childless(elem)
+        attrs = XMLParserMixin._enforce_href(attrs)
+        attrs['rel'] = 'enclosure'
+        context.setdefault('links', []).append(FeedParserDict(attrs))
+
+
+def _get_attrs(elem: Element) -> dict[str, str]:
+    """Like StrictFeedParser.startElementNS() / _normalize_attributes()."""
+    attrs = {}
+    for key, value in elem.attrib.items():
+        if key.startswith('{'):
+            if key != XML_LANG:
+                raise _Unsupported(f"{elem.tag} attribute {key}")
+            key = 'xml:lang'
+        key = key.lower()
+        if key in ('rel', 'type'):
+            value = value.lower()
+        attrs[key] = value
+    # xml:base is namespaced, so it's already covered by the above
+    if 'base' in attrs or 'mode' in attrs:
+        raise _Unsupported(f"{elem.tag} attributes")
+    return attrs
+
+
+def _get_lang(lang: str | None, attrs: dict[str, str]) -> str | None:
+    """Like the xml:lang tracking in XMLParserMixin.unknown_starttag()."""
+    value = attrs.get('xml:lang', attrs.get('lang'))
+    if value == '':
+        return None
+    if value is None:
+        return lang
+    return value
+
+
+def _map_content_type(content_type: str) -> str:
+    """Like XMLParserMixin.map_content_type()."""
+    content_type = content_type.lower()
+    if content_type == 'text' or content_type == 'plain':
+        return 'text/plain'
+    if content_type == 'html':
+        return 'text/html'
+    if content_type == 'xhtml':
+        return 'application/xhtml+xml'
+    return content_type
+
+
+def _fix_link_entities(value: str) -> str:
+    # query variables in urls in link elements are improperly
+    # converted from `?a=1&b=2` to `?a=1&b;=2` as if they're
+    # unhandled character references; see XMLParserMixin.pop()
+    return LINK_ENTITY_RE.sub(r'&\g<1>', value)
+
+
+def _check_childless(elem: Element) -> None:
+    if len(elem):
+        raise _Unsupported(f"{elem.tag} children")
+
+
+def _check_unique(tag: str, seen: set[str]) -> None:
+    if tag in REPEATABLE:
+        return
+    if tag in seen:
+        raise _Unsupported(f"repeated {tag}")
+    seen.add(tag)
+
+
+def _check_ignored(elem: Element, ignored: set[str]) -> None:
+    if elem.tag not in ignored and not elem.tag.startswith(IGNORED_NAMESPACES):
+        raise _Unsupported(f"element {elem.tag}")
+    _check_childless(elem)
@@ -4,9 +4,12 @@ import calendar
 import logging
 import time
 import warnings
+from collections.abc import Iterable
+from collections.abc import Iterator
 from datetime import datetime
 from datetime import timezone
 from typing import Any
+from typing import Collection
 from typing import IO
 from typing import TYPE_CHECKING
 
@@ -18,6 +21,8 @@ from ..types import Content
 from ..types import Enclosure
 from ._http_utils import parse_accept_header
 from ._http_utils import unparse_accept_header
+from .sanitizer import sanitize_html
+from .sanitizer import SanitizeHTML
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -28,6 +33,28 @@ if TYPE_CHECKING:  # pragma: no cover
 log = logging.getLogger('reader')
 
 
+# Namespaces whose elements never end up in FeedData / EntryData,
+# either because their feedparser handlers set other keys
+# (cc, georss, psc), or because they have no handlers at all.
+# Not in here: dc, itunes, media (they set author, summary etc.).
+IGNORED_NAMESPACES = frozenset(
+    {
+        'admin',
+        'cc',
+        'creativeCommons',
+        'feedburner',
+        'geo',
+        'georss',
+        'gml',
+        'psc',
+        'slash',
+        'sy',
+        'thr',
+        'wfw',
+    }
+)
+
+
 class FeedparserParser:
     # The wildcard gets added back explicitly later on.
     http_accept = unparse_accept_header(
@@ -36,6 +63,20 @@ class FeedparserParser:
         if v != '*/*'
     )
 
+    def __init__(
+        self,
+        sanitize_html: SanitizeHTML = sanitize_html,
+        ignored_namespaces: Collection[str] = IGNORED_NAMESPACES,
+    ) -> None:
+        #: Resolves relative URIs in and sanitizes HTML content;
+        #: use :func:`.sanitize_html_sgmllib` to get feedparser's own
+        #: (slower) implementation.
+        self.sanitize_html = sanitize_html
+        #: Prefixes of namespaces feedparser should skip altogether;
+        #: set to an empty collection to get all the elements
+        #: (e.g. in a subclass that uses more of the feedparser result).
+        self.ignored_namespaces = ignored_namespaces
+
     def __call__(
         self,
         url: str,
@@ -56,6 +97,8 @@ class FeedparserParser:
             resolve_relative_uris=True,
             sanitize_html=True,
             response_headers=headers or {},  # type: ignore[arg-type]
+            html_sanitizer=self.sanitize_html,
+            ignored_namespaces=self.ignored_namespaces,
         )
         return _process_feed(url, result)
 
@@ -67,7 +110,12 @@ _SURVIVABLE_EXCEPTION_TYPES = (
 )
 
 
-def _process_feed(url: str, d: Any) -> tuple[FeedData, list[EntryData]]:
+def _process_feed(url: str, d: Any) -> FeedAndEntries:
+    feed = _process_feed_data(url, d)
+    return feed, _process_entries(url, d.entries, d.version.startswith('rss'))
+
+
+def _process_feed_data(url: str, d: Any) -> FeedData:
     if d.get('bozo'):
         exception = d.get('bozo_exception')
         if isinstance(exception, _SURVIVABLE_EXCEPTION_TYPES):
@@ -78,9 +126,7 @@ def _process_feed(url: str, d: Any) -> tuple[FeedData, list[EntryData]]:
     if not d.version:
         raise ParseError(url, message="unknown feed type")
 
-    is_rss = d.version.startswith('rss')
-
-    feed = FeedData(
+    return FeedData(
         url,
         _get_datetime_attr(d.feed, 'updated_parsed'),
         d.feed.get('title'),
@@ -90,13 +136,17 @@ def _process_feed(url: str, d: Any) -> tuple[FeedData, list[EntryData]]:
         d.version,
     )
 
-    # entries must be a list, not a generator expression,
-    # otherwise the user may get a ParseError when calling
-    # next(parse_result.entries), i.e. after parse() returned.
-    entries = []
+
+def _process_entries(
+    url: str, entries: Iterable[Any], is_rss: bool
+) -> Iterator[EntryData]:
+    # A generator, so entries can be processed as they are consumed;
+    # Parser.parse() lists them, unless streaming
+    # (then, the ParseError below is raised when iterating).
+    any_entries = False
     first_parse_error = None
 
-    for e in d.entries:
+    for e in entries:
         try:
             entry = _process_entry(url, e, is_rss)
         except ParseError as e:
@@ -106,14 +156,13 @@ def _process_feed(url: str, d: Any) -> tuple[FeedData, list[EntryData]]:
             if not first_parse_error:
                 first_parse_error = e
         else:
-            entries.append(entry)
+            any_entries = True
+            yield entry
 
     # If all entries failed, raise the first exception.
-    if first_parse_error and not entries:
+    if first_parse_error and not any_entries:
         raise first_parse_error
 
-    return feed, entries
-
 
 def _get_datetime_attr(thing: Any, key: str) -> datetime | None:
     # feedparser.FeedParserDict.get('updated') defaults to published
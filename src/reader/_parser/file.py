@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import mmap
+import os
 import pathlib
+import stat
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import cast
 from typing import IO
 
 from ..exceptions import ParseError
@@ -21,6 +24,10 @@ class FileRetriever:
     Allows restricting file-system access to a single directory;
     see :func:`~reader.make_reader` for details.
 
+    For regular files, :attr:`~RetrieveResult.http_etag` is derived
+    from the modification time, size, and inode of the file;
+    if it is the same as on the last update, the file is not modified.
+
     """
 
     feed_root: str
@@ -32,8 +39,12 @@ class FileRetriever:
 
     @contextmanager
     def __call__(
-        self, url: str, *args: Any, **kwargs: Any
-    ) -> Iterator[RetrieveResult[IO[bytes]]]:
+        self,
+        url: str,
+        http_etag: str | None = None,
+        http_last_modified: str | None = None,
+        http_accept: str | None = None,
+    ) -> Iterator[RetrieveResult[IO[bytes]] | None]:
         try:
             normalized_url = self._normalize_url(url)
         except ValueError as e:
@@ -41,7 +52,20 @@ class FileRetriever:
 
         with wrap_exceptions(url, "while reading feed"):
             with open(normalized_url, 'rb') as file:
-                yield RetrieveResult(file)
+                etag = _make_etag(os.fstat(file.fileno()))
+                if etag and etag == http_etag:
+                    yield None
+                    return
+
+                try:
+                    resource = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # empty files, pipes etc. can't be mapped
+                    yield RetrieveResult(file, http_etag=etag)
+                    return
+
+                with resource:
+                    yield RetrieveResult(cast(IO[bytes], resource), http_etag=etag)
 
     def validate_url(self, url: str) -> None:
         self._normalize_url(url)
@@ -53,3 +77,11 @@ class FileRetriever:
             if pathlib.PurePath(path).is_reserved():
                 raise ValueError("path must not be reserved")
         return path
+
+
+def _make_etag(st: os.stat_result) -> str | None:
+    # the contents of non-regular files (e.g. pipes)
+    # can change without the stat result changing
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return f'"file-{st.st_mtime_ns:x}-{st.st_size:x}-{st.st_ino:x}"'
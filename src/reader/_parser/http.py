@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import io
+import time
 from collections.abc import Callable
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Any
+from typing import cast
 from typing import ContextManager
 from typing import IO
 
 import requests
 
+from .._types import NotModified
 from ..exceptions import ParseError
 from . import RetrieveResult
 from . import wrap_exceptions
 from ._http_utils import parse_options_header
+from ._http_utils import parse_retry_after
 from .requests import SessionWrapper
 
 
+# 301 Moved Permanently, 308 Permanent Redirect
+PERMANENT_REDIRECT_CODES = frozenset({301, 308})
+
+
 @dataclass(frozen=True)
 class HTTPRetriever:
     """http(s):// retriever that uses Requests.
@@ -28,6 +38,9 @@ class HTTPRetriever:
     * If-None-Match is set by SessionWrapper.caching_get()
     * If-Modified-Since is set by SessionWrapper.caching_get()
 
+    The session :attr:`~SessionWrapper.deadline`
+    and :attr:`~SessionWrapper.max_size` are enforced here.
+
     .. [*] https://github.com/kurtmckee/feedparser/blob/6.0.10/feedparser/http.py
 
     """
@@ -42,16 +55,9 @@ class HTTPRetriever:
         http_etag: str | None = None,
         http_last_modified: str | None = None,
         http_accept: str | None = None,
-    ) -> Iterator[RetrieveResult[IO[bytes]] | None]:
-        request_headers = {
-            # https://tools.ietf.org/html/rfc3229#section-10.5.3
-            # "Accept-Instance-Manipulation"
-            # https://www.ctrl.blog/entry/feed-delta-updates.html
-            # https://www.ctrl.blog/entry/feed-caching.html
-            'A-IM': 'feed',
-        }
-        if http_accept:
-            request_headers['Accept'] = http_accept
+    ) -> Iterator[RetrieveResult[IO[bytes]] | NotModified]:
+        request_headers = self._make_request_headers(http_accept)
+        start = time.monotonic()
 
         with self.get_session() as session:
             with wrap_exceptions(url, "while getting feed"):
@@ -63,46 +69,172 @@ class HTTPRetriever:
                     stream=True,
                 )
 
-            try:
-                response.raise_for_status()
-            except Exception as e:
-                raise ParseError(url, message="bad HTTP status code") from e
-
-            if response.status_code == 304:
-                response.close()
-                yield None
-                return
-
-            response_headers = response.headers.copy()
-            response_headers.setdefault('content-location', response.url)
-
-            # https://datatracker.ietf.org/doc/html/rfc9110#name-content-encoding
-            # Content-Encoding is the counterpart of Accept-Encoding;
-            # it is about binary transformations (mainly compression),
-            # not text encoding (Content-Type charset does that).
-            # We let Requests/urllib3 take care of it and remove the header,
-            # so parsers (like feedparser) don't do it a second time.
-            response_headers.pop('content-encoding', None)
-            response.raw.decode_content = True
-
-            content_type = response_headers.get('content-type')
-            mime_type: str | None
-            if content_type:
-                mime_type, _ = parse_options_header(content_type)
-            else:
-                mime_type = None
-
-            with wrap_exceptions(url, "while reading feed"), response:
-                yield RetrieveResult(
-                    response.raw,
-                    mime_type,
-                    http_etag,
-                    http_last_modified,
-                    response_headers,
+            with response:
+                result = self._make_result(url, response, http_etag, http_last_modified)
+                if not result:
+                    yield result
+                    return
+
+                reader = LimitedReader(
+                    result.resource, url, session.max_size, session.deadline, start
                 )
+                reader.check_deadline()
+                check_content_length(url, response, session.max_size)
+                result = result._replace(resource=cast(IO[bytes], reader))
+
+                with wrap_exceptions(url, "while reading feed"):
+                    yield result
+
+    @staticmethod
+    def _make_request_headers(http_accept: str | None) -> dict[str, str]:
+        request_headers = {
+            # https://tools.ietf.org/html/rfc3229#section-10.5.3
+            # "Accept-Instance-Manipulation"
+            # https://www.ctrl.blog/entry/feed-delta-updates.html
+            # https://www.ctrl.blog/entry/feed-caching.html
+            'A-IM': 'feed',
+        }
+        if http_accept:
+            request_headers['Accept'] = http_accept
+        return request_headers
+
+    @staticmethod
+    def _make_result(
+        url: str,
+        response: requests.Response,
+        http_etag: str | None,
+        http_last_modified: str | None,
+    ) -> RetrieveResult[IO[bytes]] | NotModified:
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            error = ParseError(url, message="bad HTTP status code")
+            # 429 Too Many Requests, 503 Service Unavailable
+            if response.status_code in (429, 503):
+                error._retry_after = parse_retry_after(response.headers)
+            raise error from e
+
+        if response.status_code == 304:
+            response.close()
+            # a 304 can update Cache-Control / Expires too
+            return NotModified(parse_retry_after(response.headers))
+
+        response_headers = response.headers.copy()
+        response_headers.setdefault('content-location', response.url)
+
+        # https://datatracker.ietf.org/doc/html/rfc9110#name-content-encoding
+        # Content-Encoding is the counterpart of Accept-Encoding;
+        # it is about binary transformations (mainly compression),
+        # not text encoding (Content-Type charset does that).
+        # We let Requests/urllib3 take care of it and remove the header,
+        # so parsers (like feedparser) don't do it a second time.
+        response_headers.pop('content-encoding', None)
+        response.raw.decode_content = True
+
+        content_type = response_headers.get('content-type')
+        mime_type: str | None
+        if content_type:
+            mime_type, _ = parse_options_header(content_type)
+        else:
+            mime_type = None
+
+        # only if *all* the redirects were permanent
+        permanent_redirect = None
+        if response.history and all(
+            r.status_code in PERMANENT_REDIRECT_CODES for r in response.history
+        ):
+            permanent_redirect = response.url
+
+        # https://www.rfc-editor.org/rfc/rfc3229#section-10.4.1
+        # 226 IM Used means the instance-manipulations in the IM header
+        # were applied; for "feed", the body has only the changed entries
+        is_delta = response.status_code == 226 and 'feed' in [
+            im.strip().lower() for im in response_headers.get('IM', '').split(',')
+        ]
+
+        return RetrieveResult(
+            response.raw,
+            mime_type,
+            http_etag,
+            http_last_modified,
+            response_headers,
+            parse_retry_after(response_headers),
+            permanent_redirect=permanent_redirect,
+            is_delta=is_delta,
+        )
 
     def validate_url(self, url: str) -> None:
         with self.get_session() as session_wrapper:
             session = session_wrapper.session
             session.get_adapter(url)
             session.prepare_request(requests.Request('GET', url))
+
+
+class LimitedReader(io.RawIOBase):
+    """Wrap a response body, raising :exc:`ParseError`
+    if it gets larger than max_size bytes,
+    or if reading it takes longer than the deadline (from start).
+
+    The deadline is checked before each read;
+    reads return as soon as *some* data is available (if the file
+    has a ``read1()`` method), so a read can exceed the deadline
+    by at most the session read timeout.
+
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        url: str,
+        max_size: int | None = None,
+        deadline: float | None = None,
+        start: float | None = None,
+    ):
+        self.file = file
+        self.url = url
+        self.max_size = max_size
+        self.deadline = deadline
+        self.start = start if start is not None else time.monotonic()
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        self.check_deadline()
+        read = getattr(self.file, 'read1', self.file.read)
+        chunk = read(len(buffer))
+        n = len(chunk)
+        self.size += n
+        if self.max_size is not None and self.size > self.max_size:
+            raise too_large_error(self.url, self.max_size)
+        buffer[:n] = chunk
+        return n
+
+    def check_deadline(self) -> None:
+        if self.deadline is None:
+            return
+        if time.monotonic() - self.start > self.deadline:
+            raise deadline_error(self.url, self.deadline)
+
+
+def check_content_length(
+    url: str, response: requests.Response, max_size: int | None
+) -> None:
+    # fail early if we know the body is too large
+    if max_size is None or response.headers.get('content-encoding'):
+        return
+    try:
+        length = int(response.headers.get('content-length', ''))
+    except ValueError:
+        return
+    if length > max_size:
+        raise too_large_error(url, max_size)
+
+
+def too_large_error(url: str, max_size: int | None) -> ParseError:
+    return ParseError(url, message=f"response body larger than {max_size} bytes")
+
+
+def deadline_error(url: str, deadline: float | None) -> ParseError:
+    return ParseError(url, message=f"retrieving took longer than {deadline} seconds")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Generator
 from datetime import datetime
 from datetime import timezone
 from typing import Any
@@ -19,27 +21,174 @@ from ..types import Content
 from ..types import Enclosure
 
 
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover
+    _orjson_loads = None  # type: ignore[assignment]
+
+
 if TYPE_CHECKING:  # pragma: no cover
     from . import FeedAndEntries
     from .requests import Headers
 
 
+# Documents at least this large are decoded incrementally by default.
+INCREMENTAL_MIN_SIZE = 2**20
+
+
 class JSONFeedParser:
     """https://jsonfeed.org/version/1.1"""
 
     http_accept = 'application/feed+json,application/json;q=0.9'
 
+    def __init__(self, incremental: bool | None = None) -> None:
+        #: If true, decode the items one by one, as the entries are consumed,
+        #: instead of decoding the whole document upfront,
+        #: so memory usage does not grow with the size of the items.
+        #: Because feed-level members may come after the items array,
+        #: the items are decoded twice (first to find its end), so this is slower.
+        #: If false, use :mod:`orjson` (if available) to decode the document.
+        #: If none, decode incrementally only documents of 1 MiB or more.
+        #:
+        #: .. versionadded:: 3.14
+        self.incremental = incremental
+
     def __call__(
         self,
         url: str,
         resource: IO[bytes],
         headers: Headers | None = None,
     ) -> FeedAndEntries:
+        data = resource.read()
+        incremental = self.incremental
+        if incremental is None:
+            incremental = len(data) >= INCREMENTAL_MIN_SIZE
         try:
-            result = json.load(resource)
+            if not incremental:
+                return _process_feed(url, _loads(data))
+            text = data.decode(json.detect_encoding(data), 'surrogatepass')
+            del data
+            d, items_index = _scan_feed(text)
         except json.JSONDecodeError as e:
             raise ParseError(url, "invalid JSON") from e
-        return _process_feed(url, result)
+
+        if items_index is None:
+            return _process_feed(url, d)
+        feed, lang = _process_feed_data(url, d)
+        entries = (_process_entry(url, e, lang) for e in _iter_array(text, items_index))
+        return feed, entries
+
+
+# orjson decodes integers that don't fit in 64 bits as floats
+# (json doesn't), which would change the ids of such entries
+_MAYBE_BIG_INT = re.compile(rb'[0-9]{19}')
+
+
+def _loads(data: bytes) -> Any:
+    if _orjson_loads is not None and not _MAYBE_BIG_INT.search(data):
+        try:
+            return _orjson_loads(data)
+        except json.JSONDecodeError:
+            # orjson is stricter than json (only UTF-8, no NaN,
+            # no lone surrogates); let json decide
+            pass
+    return json.loads(data)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    match = _WHITESPACE.match(text, index)
+    assert match is not None  # matches the empty string too
+    return match.end()
+
+
+def _scan_feed(text: str) -> tuple[Any, int | None]:
+    """Decode a JSON document like json.loads(), except for
+    the top-level object "items" array, which is only checked.
+
+    Return the document and the index right after
+    the "[" of the items array (None if there isn't one).
+
+    """
+    end = _skip_whitespace(text, 0)
+    if text[end : end + 1] != '{':
+        return json.loads(text), None
+
+    d: dict[str, Any] = {}
+    items_index = None
+
+    end = _skip_whitespace(text, end + 1)
+    if text[end : end + 1] == '}':
+        end += 1
+    else:
+        while True:
+            if text[end : end + 1] != '"':
+                raise json.JSONDecodeError(
+                    "Expecting property name enclosed in double quotes", text, end
+                )
+            key, end = _decoder.raw_decode(text, end)
+            end = _skip_whitespace(text, end)
+            if text[end : end + 1] != ':':
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, end)
+            end = _skip_whitespace(text, end + 1)
+
+            # like json, the last of duplicate keys wins
+            if key == 'items' and text[end : end + 1] == '[':
+                d.pop(key, None)
+                items_index = end + 1
+                end = _skip_array(text, items_index)
+            else:
+                d[key], end = _decoder.raw_decode(text, end)
+                if key == 'items':
+                    items_index = None
+
+            end = _skip_whitespace(text, end)
+            char = text[end : end + 1]
+            end += 1
+            if char == '}':
+                break
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, end - 1)
+            end = _skip_whitespace(text, end)
+
+    end = _skip_whitespace(text, end)
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return d, items_index
+
+
+def _iter_array(text: str, index: int) -> Generator[Any, None, int]:
+    """Decode the values of the array starting right after index, one by one.
+
+    Return the index right after the "]" of the array.
+
+    """
+    end = _skip_whitespace(text, index)
+    if text[end : end + 1] == ']':
+        return end + 1
+    while True:
+        value, end = _decoder.raw_decode(text, end)
+        yield value
+        end = _skip_whitespace(text, end)
+        char = text[end : end + 1]
+        end += 1
+        if char == ']':
+            return end
+        if char != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, end - 1)
+        end = _skip_whitespace(text, end)
+
+
+def _skip_array(text: str, index: int) -> int:
+    values = _iter_array(text, index)
+    while True:
+        try:
+            next(values)
+        except StopIteration as e:
+            return cast(int, e.value)
 
 
 _VERSION_URL_PREFIX = "https://jsonfeed.org/version/"
@@ -51,6 +200,16 @@ _VERSION_UNKNOWN = 'json'
 
 
 def _process_feed(url: str, d: Any) -> FeedAndEntries:
+    feed, lang = _process_feed_data(url, d)
+
+    # TODO: skip entries that raise ParseError with a warning
+    entry_dicts = _get(d, 'items', list) or ()
+    entries = [_process_entry(url, e, lang) for e in entry_dicts]
+
+    return feed, entries
+
+
+def _process_feed_data(url: str, d: Any) -> tuple[FeedData, str | None]:
     version = _get(d, 'version', str) or ''
     version_lower = version.lower()
     if not version_lower.startswith(_VERSION_URL_PREFIX):
@@ -68,11 +227,7 @@ def _process_feed(url: str, d: Any) -> FeedAndEntries:
     )
     lang = _get(d, 'language', str)
 
-    # TODO: skip entries that raise ParseError with a warning
-    entry_dicts = _get(d, 'items', list) or ()
-    entries = [_process_entry(url, e, lang) for e in entry_dicts]
-
-    return feed, entries
+    return feed, lang
 
 
 _T = TypeVar('_T')
@@ -107,6 +107,20 @@ class SessionFactory:
     #: Sequence of :class:`ResponseHook`\s to be associated with new sessions.
     response_hooks: Sequence[ResponseHook] = field(default_factory=list)
 
+    #: Maximum time, in seconds, to spend retrieving a feed,
+    #: including connecting, redirects, and reading the body;
+    #: unlike the ``timeout``, this bounds servers that send data slowly.
+    #: If none, there is no limit.
+    #:
+    #: .. versionadded:: 3.14
+    deadline: float | None = None
+
+    #: Maximum size, in bytes, of a (decoded) response body.
+    #: If none, there is no limit.
+    #:
+    #: .. versionadded:: 3.14
+    max_size: int | None = None
+
     session: SessionWrapper | None = None
 
     def __call__(self) -> SessionWrapper:
@@ -122,6 +136,8 @@ class SessionFactory:
         session = SessionWrapper(
             request_hooks=list(self.request_hooks),
             response_hooks=list(self.response_hooks),
+            deadline=self.deadline,
+            max_size=self.max_size,
         )
         timeout_adapter = TimeoutHTTPAdapter(self.timeout)
         session.session.mount('https://', timeout_adapter)
@@ -66,6 +66,13 @@ class SessionWrapper:
     #: Sequence of :class:`ResponseHook`\s.
     response_hooks: Sequence[ResponseHook] = field(default_factory=list)
 
+    #: Maximum time to spend retrieving a feed; see :class:`SessionFactory`.
+    #: Not enforced by the wrapper, only by its users.
+    deadline: float | None = None
+    #: Maximum size of a response body; see :class:`SessionFactory`.
+    #: Not enforced by the wrapper, only by its users.
+    max_size: int | None = None
+
     def get(
         self, url: str | bytes, headers: Headers | None = None, **kwargs: Any
     ) -> requests.Response:
@@ -0,0 +1,430 @@
+"""
+A faster HTML sanitizer for feed content.
+
+For HTML content, feedparser first resolves relative URIs
+(:class:`~feedparser.urls.RelativeURIResolver`),
+and then sanitizes the result (:class:`~feedparser.sanitizer.HTMLSanitizer`);
+both are :mod:`sgmllib` parsers, so each value is tokenized twice,
+by a rather slow tokenizer.
+
+:func:`sanitize_html` does both in a single :mod:`html.parser` pass,
+applying the exact same transformations to each token.
+
+The two tokenizers disagree on plenty of malformed markup, so only a subset
+both agree on is handled (well-formed tags with simple attributes,
+terminated character references, plain comments etc.); anything else
+(DOCTYPEs, CDATA sections, a stray ``<``, SVG and MathML etc.)
+is delegated to :func:`sanitize_html_sgmllib`,
+so the result is the same as if it was used directly.
+
+tests/test_parser_sanitizer.py compares the two on a corpus of snippets.
+
+:class:`SanitizeHTMLCache` caches the results of either,
+so content that does not change between updates is only sanitized once
+(the cache can be persisted in storage; see its docstring for details).
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from html.entities import name2codepoint
+from html.parser import HTMLParser
+from typing import Any
+from typing import TYPE_CHECKING
+
+from .._vendor.feedparser.html import _cp1252
+from .._vendor.feedparser.html import BaseHTMLProcessor
+from .._vendor.feedparser.sanitizer import HTMLSanitizer
+from .._vendor.feedparser.sanitizer import sanitize_html as _sanitize_html
+from .._vendor.feedparser.urls import make_safe_absolute_uri
+from .._vendor.feedparser.urls import RelativeURIResolver
+from .._vendor.feedparser.urls import resolve_relative_uris
+from ..exceptions import StorageError
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .._types import SanitizedHTMLStorageType
+
+
+log = logging.getLogger('reader')
+
+
+#: A function that takes HTML content, the base URI,
+#: and the content type (``text/html`` or ``application/xhtml+xml``),
+#: and returns the content with relative URIs resolved and sanitized.
+SanitizeHTML = Callable[[str, str, str], str]
+
+
+def sanitize_html_sgmllib(html: str, base_uri: str, content_type: str) -> str:
+    """Resolve relative URIs and sanitize `html` like feedparser does."""
+    html = resolve_relative_uris(html, base_uri, 'utf-8', content_type)
+    return _sanitize_html(html, 'utf-8', content_type)  # type: ignore[no-any-return]
+
+
+def sanitize_html(html: str, base_uri: str, content_type: str) -> str:
+    """Like :func:`sanitize_html_sgmllib`, but faster."""
+    if '<' not in html and '&' not in html:
+        return html.strip().replace('\r\n', '\n')
+    try:
+        return _Sanitizer(base_uri, content_type).sanitize(html)
+    except _Unsupported:
+        return sanitize_html_sgmllib(html, base_uri, content_type)
+
+
+class SanitizeHTMLCache:
+    """Wrap a :data:`SanitizeHTML` function with a bounded (LRU) cache.
+
+    Keys are a digest of the HTML, base URI, and content type,
+    so only the (sanitized) values count towards `max_size`,
+    which is the maximum total length (in characters) of the cached values.
+
+    If :attr:`store` is set, values not in memory are looked up there,
+    and newly sanitized values are added to it (in batches, and on
+    :meth:`flush`), so processes that update the feeds once and exit
+    (e.g. the ``update`` CLI command run from cron) benefit too;
+    the store keeps at most `max_stored` values, the oldest are deleted first.
+    Storage errors are logged, and otherwise ignored.
+
+    When pickled (e.g. with the parser, when parsing in other processes),
+    the cached values and the store are not copied; instead,
+    all the copies unpickled in the same process share a single cache,
+    so each worker process has a cache for as long as it is alive.
+
+    Thread-safe.
+
+    """
+
+    #: Add newly sanitized values to the store after this many.
+    flush_size = 2**8
+
+    def __init__(
+        self,
+        sanitize_html: SanitizeHTML = sanitize_html,
+        max_size: int = 2**24,
+        max_stored: int = 2**16,
+    ) -> None:
+        self.sanitize_html = sanitize_html
+        self.max_size = max_size
+        self.max_stored = max_stored
+        self.size = 0
+        #: Where to persist the values, if anywhere.
+        self.store: SanitizedHTMLStorageType | None = None
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._pending: list[tuple[bytes, str]] = []
+        self._lock = threading.Lock()
+        self._id = os.urandom(16).hex()
+
+    def __call__(self, html: str, base_uri: str, content_type: str) -> str:
+        if '<' not in html and '&' not in html:
+            # cheaper to sanitize than to look up
+            return self.sanitize_html(html, base_uri, content_type)
+
+        # length-prefixed, so different (base URI, content type) can't collide
+        key_prefix = f'{len(base_uri)}:{base_uri}{len(content_type)}:{content_type}'
+        hasher = hashlib.blake2b(key_prefix.encode('utf-8'), digest_size=16)
+        hasher.update(html.encode('utf-8', 'surrogatepass'))
+        key = hasher.digest()
+
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                return value
+
+        store = self.store
+        if store is not None:
+            try:
+                value = store.get_sanitized_html(key)
+            except StorageError:
+                log.warning("could not get sanitized HTML", exc_info=True)
+
+        if value is None:
+            value = self.sanitize_html(html, base_uri, content_type)
+            if store is not None:
+                with self._lock:
+                    self._pending.append((key, value))
+                    flush = len(self._pending) >= self.flush_size
+                if flush:
+                    self.flush()
+
+        if len(value) > self.max_size:
+            return value
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = value
+                self.size += len(value)
+            while self.size > self.max_size:
+                _, evicted = self._cache.popitem(last=False)
+                self.size -= len(evicted)
+
+        return value
+
+    def flush(self) -> None:
+        """Add the values sanitized since the last flush to :attr:`store`."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        store = self.store
+        if not pending or store is None:
+            return
+        try:
+            store.add_sanitized_html(pending, self.max_stored)
+        except StorageError:
+            log.warning("could not add sanitized HTML", exc_info=True)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            _unpickle_cache,
+            (self._id, self.sanitize_html, self.max_size, self.max_stored),
+        )
+
+
+# the copies of each cache unpickled in this process, by id;
+# a worker process gets a new copy of the parser with every feed
+_unpickled_caches: dict[str, SanitizeHTMLCache] = {}
+_unpickled_caches_lock = threading.Lock()
+
+
+def _unpickle_cache(
+    id: str, sanitize_html: SanitizeHTML, max_size: int, max_stored: int
+) -> SanitizeHTMLCache:
+    with _unpickled_caches_lock:
+        cache = _unpickled_caches.get(id)
+        if cache is None:
+            cache = SanitizeHTMLCache(sanitize_html, max_size, max_stored)
+            cache._id = id
+            _unpickled_caches[id] = cache
+        return cache
+
+
+class _Unsupported(Exception):
+    pass
+
+
+# like BaseHTMLProcessor.feed()
+_DECL_RE = re.compile(r"<!((?!DOCTYPE|--|\[))", re.IGNORECASE)
+_SHORTTAG_RE = re.compile(r"<([^<>\s]+?)\s*/>")
+
+# character references sgmllib and html.parser don't agree on,
+# and entity references html.parser may leave at the end of the buffer
+_UNSUPPORTED_REF_RE = re.compile(
+    r"&#(?![0-9]+;|[xX][0-9a-fA-F]+;)|&[a-zA-Z][-.a-zA-Z0-9]*\Z"
+)
+
+# characters that can follow & in a (partial) reference
+_REF_CHARS = frozenset(
+    '#-.0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+# a subset of what the sgmllib regexes (feedparser.sgml) accept,
+# parsed the same way by all of them
+_NAME = r"[a-zA-Z_][-:.a-zA-Z_0-9]*"
+_VALUE = r"""(?:"[^"<>]*"|'[^'<>]*'|[-a-zA-Z0-9./,:;+*%?!&$()_#=~@\[\]]+)"""
+_ATTR = rf"\s+({_NAME})(?:\s*=\s*({_VALUE}))?"
+_STARTTAG_RE = re.compile(
+    rf"<([a-zA-Z][-_.:a-zA-Z0-9]*)((?:\s+{_NAME}(?:\s*=\s*{_VALUE})?)*)\s*/?>"
+)
+_ATTR_RE = re.compile(_ATTR)
+_ENDTAG_RE = re.compile(r"</([a-zA-Z][-_.:a-zA-Z0-9]*)\s*>")
+_COMMENT_RE = re.compile(r"<!--([^-<>&]*(?:-[^-<>&]+)*)-->")
+_PI_RE = re.compile(r"<\?[^<>]*>")
+
+_normalize_attrs = BaseHTMLProcessor.normalize_attrs
+_bare_ampersand_sub = BaseHTMLProcessor.bare_ampersand.sub
+_sanitize_style = HTMLSanitizer().sanitize_style
+
+_NO_END_TAG = BaseHTMLProcessor.elements_no_end_tag
+_RELATIVE_URIS = RelativeURIResolver.relative_uris
+_ACCEPTABLE_ELEMENTS = HTMLSanitizer.acceptable_elements
+_ACCEPTABLE_ATTRIBUTES = HTMLSanitizer.acceptable_attributes
+_UNACCEPTABLE_ELEMENTS = HTMLSanitizer.unacceptable_elements_with_end_tag
+# start tags that change HTMLSanitizer state beyond unacceptablestack
+_FOREIGN_ELEMENTS = {'svg', 'math'}
+
+
+def _escape(value: str) -> str:
+    # like BaseHTMLProcessor.unknown_starttag()
+    value = value.replace('>', '&gt;').replace('<', '&lt;').replace('"', '&quot;')
+    return _bare_ampersand_sub('&amp;', value)
+
+
+class _Sanitizer(HTMLParser):
+    """Tokenize with html.parser, but only accept tokens sgmllib would
+    tokenize the same way; for each one, emit what HTMLSanitizer would emit
+    for the output of RelativeURIResolver.
+
+    The only thing html.parser is trusted with is the data / reference split;
+    tags, comments and processing instructions are parsed here.
+
+    """
+
+    def __init__(self, base_uri: str, content_type: str) -> None:
+        super().__init__(convert_charrefs=False)
+        self.base_uri = base_uri
+        self.xhtml = content_type == 'application/xhtml+xml'
+        self.pieces: list[str] = []
+        # HTMLSanitizer.unacceptablestack; can go negative
+        self.unacceptable = 0
+
+    def sanitize(self, html: str) -> str:
+        # BaseHTMLProcessor.feed() preprocessing (only needed once,
+        # since it is a no-op on the output of the first pass)
+        html = _DECL_RE.sub(r'&lt;!\1', html)
+        html = _SHORTTAG_RE.sub(self._shorttag_replace, html)
+        html = html.replace('&#39;', "'").replace('&#34;', '"')
+        if _UNSUPPORTED_REF_RE.search(html):
+            raise _Unsupported("character or entity reference")
+        self.feed(html)
+        self.close()
+        return ''.join(self.pieces).strip().replace('\r\n', '\n')
+
+    @staticmethod
+    def _shorttag_replace(match: re.Match[str]) -> str:
+        tag = match.group(1)
+        if tag in _NO_END_TAG:
+            return '<' + tag + ' />'
+        return '<' + tag + '></' + tag + '>'
+
+    # tokenizer
+
+    def parse_starttag(self, i: int) -> int:
+        match = _STARTTAG_RE.match(self.rawdata, i)
+        if not match:
+            raise _Unsupported("start tag")
+        attrs = []
+        for name, value in _ATTR_RE.findall(match.group(2)):
+            if not value:
+                value = name
+            elif value[0] in '"\'':
+                value = value[1:-1]
+            attrs.append((name.lower(), value))
+        tag = match.group(1).lower()
+        self.starttag(tag, attrs)
+        end = match.end()
+        if self.xhtml and self.rawdata[end - 2 : end] == '/>':
+            self.endtag(tag)
+        return end
+
+    def parse_endtag(self, i: int) -> int:
+        match = _ENDTAG_RE.match(self.rawdata, i)
+        if not match:
+            raise _Unsupported("end tag")
+        tag = match.group(1).lower()
+        if tag in _NO_END_TAG:
+            # the first sgmllib pass drops the end tag, so the second one
+            # sees a bare & before it joined with the text after it
+            j = i
+            while j and self.rawdata[j - 1] in _REF_CHARS:
+                j -= 1
+            if j and self.rawdata[j - 1] == '&':
+                raise _Unsupported("& before void end tag")
+        self.endtag(tag)
+        return match.end()
+
+    def parse_comment(self, i: int, report: bool = True) -> int:
+        match = _COMMENT_RE.match(self.rawdata, i)
+        if not match:
+            raise _Unsupported("comment")
+        # HTMLSanitizer keeps comments, even inside unacceptable elements
+        self.pieces.append(match.group())
+        return match.end()
+
+    def parse_pi(self, i: int) -> int:
+        match = _PI_RE.match(self.rawdata, i)
+        if not match:
+            raise _Unsupported("processing instruction")
+        # HTMLSanitizer drops processing instructions
+        return match.end()
+
+    def parse_html_declaration(self, i: int) -> int:
+        raise _Unsupported("declaration")
+
+    def parse_bogus_comment(self, i: int, report: bool = True) -> int:
+        raise _Unsupported("bogus comment")
+
+    def handle_data(self, data: str) -> None:
+        if '<' in data:
+            raise _Unsupported("stray <")
+        if not self.unacceptable:
+            self.pieces.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        # like BaseHTMLProcessor.handle_charref(); idempotent
+        ref = name.lower()
+        value = int(ref[1:], 16) if ref.startswith('x') else int(ref)
+        if value in _cp1252:
+            self.pieces.append('&#%s;' % hex(ord(_cp1252[value]))[1:])
+        else:
+            self.pieces.append('&#%s;' % ref)
+
+    def handle_entityref(self, name: str) -> None:
+        # like BaseHTMLProcessor.handle_entityref();
+        # on the second pass, &amp;name is &amp; followed by data
+        if name in name2codepoint or name == 'apos':
+            self.pieces.append('&%s;' % name)
+        else:
+            self.pieces.append('&amp;')
+            self.handle_data(name)
+
+    # handlers
+
+    def starttag(self, tag: str, attrs: list[tuple[str, str]]) -> None:
+        if tag in _FOREIGN_ELEMENTS:
+            raise _Unsupported(tag)
+
+        # RelativeURIResolver.unknown_starttag()
+        resolved = []
+        for key, value in _normalize_attrs(attrs):
+            if (tag, key) in _RELATIVE_URIS:
+                uri = make_safe_absolute_uri(self.base_uri, value.strip())
+                value = uri or value
+            value = _escape(value)
+            # BaseHTMLProcessor.feed() preprocessing, second pass
+            if '&#34;' in value:
+                raise _Unsupported("quote in attribute value")
+            resolved.append((key, value.replace('&#39;', "'")))
+
+        # HTMLSanitizer.unknown_starttag()
+        if tag not in _ACCEPTABLE_ELEMENTS:
+            if tag in _UNACCEPTABLE_ELEMENTS:
+                self.unacceptable += 1
+            return
+
+        strattrs = ''
+        for key, value in resolved:
+            if key == 'style':
+                value = _sanitize_style(value)
+                if not value:
+                    continue
+            elif key in _ACCEPTABLE_ATTRIBUTES:
+                if key == 'href':
+                    value = make_safe_absolute_uri(value)
+            else:
+                continue
+            strattrs += f' {key}="{_escape(value)}"'
+
+        if tag in _NO_END_TAG:
+            self.pieces.append(f'<{tag}{strattrs} />')
+        else:
+            self.pieces.append(f'<{tag}{strattrs}>')
+
+    def endtag(self, tag: str) -> None:
+        # RelativeURIResolver drops these, HTMLSanitizer never sees them
+        if tag in _NO_END_TAG:
+            return
+        # HTMLSanitizer.unknown_endtag()
+        if tag not in _ACCEPTABLE_ELEMENTS:
+            if tag in _UNACCEPTABLE_ELEMENTS:
+                self.unacceptable -= 1
+            return
+        self.pieces.append(f'</{tag}>')
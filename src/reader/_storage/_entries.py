@@ -5,15 +5,18 @@ import logging
 import sqlite3
 from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Sequence
 from datetime import datetime
 from datetime import timedelta
 from functools import partial
+from itertools import groupby
 from typing import Any
 from typing import TYPE_CHECKING
 
 from .._types import EntryFilter
 from .._types import EntryForUpdate
 from .._types import EntryUpdateIntent
+from .._types import FeedUpdateIntent
 from .._utils import chunks
 from .._utils import exactly_one
 from .._utils import zero_or_one
@@ -28,6 +31,7 @@ from ..types import EntryCounts
 from ..types import EntrySort
 from ._base import wrap_exceptions
 from ._feeds import feed_factory
+from ._feeds import update_feed
 from ._sql_utils import Query
 from ._sql_utils import SortKey
 from ._sqlite_utils import adapt_datetime
@@ -159,22 +163,57 @@ class EntriesMixin(StorageBase):
     def _get_entries_for_update_page(
         self, entries: Iterable[tuple[str, str]]
     ) -> Iterable[EntryForUpdate | None]:
-        # Fetching everything in a single query is not much faster.
-        # Also, the maximum number of SQL variables can be as low as 999.
-        # See https://github.com/lemon24/reader/issues/109 for details.
-        # See e39b0134cb3a2fe2bb346d42355a764181926a82 for a single query version.
-
-        def row_factory(_: sqlite3.Cursor, row: sqlite3.Row) -> EntryForUpdate:
-            fu, fu_epoch, recent_sort, updated, data_hash, data_hash_changed = row
-            return EntryForUpdate(
-                convert_timestamp(fu),
-                convert_timestamp(fu_epoch),
-                convert_timestamp(recent_sort),
-                convert_timestamp(updated) if updated else None,
+        rv: list[EntryForUpdate | None] = []
+
+        # Usually, all the entries are from the same feed.
+        for feed_url, group in groupby(entries, key=lambda e: e[0]):
+            ids = [id for _, id in group]
+            if len(ids) >= self.entries_for_update_single_query_min:
+                rv.extend(self._get_entries_for_update_single_query(feed_url, ids))
+            else:
+                rv.extend(self._get_entries_for_update_one_by_one(feed_url, ids))
+
+        return rv
+
+    # Private API, used by tests and benchmarks.
+    # Below this many entries (per feed), querying them one by one is
+    # about as fast as a single query; see scripts/bench.py entries-for-update.
+    entries_for_update_single_query_min = 8
+
+    def _get_entries_for_update_single_query(
+        self, feed_url: str, ids: list[str]
+    ) -> list[EntryForUpdate | None]:
+        # Pass the ids as a JSON array, since the maximum number
+        # of SQL variables can be as low as 999, and join against it;
+        # restoring the input order in Python is faster than ORDER BY.
+        # Using a single feed URL (instead of [feed, id] pairs) avoids
+        # json_extract() calls, which make the query ~2x slower.
+
+        query = """
+            SELECT
+                input.key,
+                first_updated,
+                first_updated_epoch,
+                recent_sort,
+                updated,
                 data_hash,
-                data_hash_changed,
-            )
+                data_hash_changed
+            FROM json_each(:ids) AS input
+            -- CROSS JOIN forces input to be the outer loop; otherwise,
+            -- the planner may prefer to scan all the entries of the feed
+            CROSS JOIN entries
+                ON (entries.feed, entries.id) = (:feed_url, input.value);
+        """
+        context = dict(feed_url=feed_url, ids=json.dumps(ids))
 
+        rv: list[EntryForUpdate | None] = [None] * len(ids)
+        for index, *row in self.get_db().execute(query, context):
+            rv[index] = entry_for_update_factory(row)
+        return rv
+
+    def _get_entries_for_update_one_by_one(
+        self, feed_url: str, ids: list[str]
+    ) -> list[EntryForUpdate | None]:
         query = """
             SELECT
                 first_updated,
@@ -190,12 +229,12 @@ class EntriesMixin(StorageBase):
 
         with self.get_db() as db:
             cursor = db.cursor()
-            cursor.row_factory = row_factory
+            cursor.row_factory = lambda _, row: entry_for_update_factory(row)
 
             # Use an explicit transaction for speed.
             cursor.execute('BEGIN;')
 
-            return [cursor.execute(query, entry).fetchone() for entry in entries]
+            return [cursor.execute(query, (feed_url, id)).fetchone() for id in ids]
 
     @wrap_exceptions()
     def add_or_update_entries(self, intents: Iterable[EntryUpdateIntent]) -> None:
@@ -206,38 +245,103 @@ class EntriesMixin(StorageBase):
         # be updated on the next update (because the feed will not be marked
         # as updated if there's an exception, so we get a free retry).
         for iterable in iterables:
-            self._add_or_update_entries(iterable)
+            with self.get_db() as db:
+                self._add_or_update_entries(db, iterable)
 
-    def _add_or_update_entries(self, intents: Iterable[EntryUpdateIntent]) -> None:
-        with self.get_db() as db:
-            try:
-                for intent in intents:
-                    # we cannot rely on the updater getting an EntryForUpdate
-                    # to tell if the entry is new at *this* point in time,
-                    # the entry may have been added/deleted by a parallel update
-                    #
-                    # as a consequence, EntryUpdateIntent must set all fields,
-                    # including the ones which have a single value
-                    # for the entire lifetime of the entry (like first_updated)
-
-                    new = not list(
-                        db.execute(
-                            "SELECT 1 FROM entries WHERE (feed, id) = (?, ?)",
-                            intent.entry.resource_id,
-                        )
-                    )
+    @wrap_exceptions()
+    def update_feeds_and_entries(
+        self,
+        intents: Iterable[tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]]],
+    ) -> list[FeedNotFoundError | None]:
+        rv: list[FeedNotFoundError | None] = []
 
-                    if new:
-                        self._insert_entry(db, intent)
-                    else:
-                        self._update_entry(db, intent)
+        # Everything happens in a single transaction, to amortize its cost
+        # (locking, fsync) over many feeds.
+        #
+        # Each feed gets its own savepoint, so a feed removed
+        # during the update doesn't prevent the other ones from being written.
 
+        with self.get_db() as db:
+            db.execute("BEGIN;")
+            for feed_intent, entry_intents in intents:
+                db.execute("SAVEPOINT update_feed;")
+                try:
+                    self._add_or_update_entries(db, entry_intents)
+                    update_feed(db, feed_intent)
+                except FeedNotFoundError as e:
+                    db.execute("ROLLBACK TO update_feed;")
+                    rv.append(e)
+                else:
+                    rv.append(None)
+                db.execute("RELEASE update_feed;")
+
+        return rv
+
+    def _add_or_update_entries(
+        self, db: sqlite3.Connection, intents: Iterable[EntryUpdateIntent]
+    ) -> None:
+        # Set-based version of _add_or_update_entries_one_by_one():
+        # for every feed, update the entries that exist,
+        # and insert the ones that don't, using only two executemany() calls
+        # (instead of 2 statements per entry, plus Python overhead).
+        #
+        # We can't use INSERT ... ON CONFLICT DO UPDATE ("upsert") because
+        # its conflict policy overrides the INSERT OR REPLACE in the
+        # changes_entry_* triggers (see _changes.py for details).
+        #
+        # One pair of statements per feed, so we know which feed
+        # a foreign key constraint failure refers to.
+
+        for feed_url, group in groupby(intents, key=lambda i: i.entry.feed_url):
+            group_intents = list(group)
+
+            # Duplicate ids must be written in order (the last one wins,
+            # but the first one determines the insert-only columns).
+            if len({i.entry.id for i in group_intents}) != len(group_intents):
+                self._add_or_update_entries_one_by_one(db, group_intents)
+                continue
+
+            params = list(map(entry_update_intent_to_params, group_intents))
+            try:
+                db.executemany(UPDATE_ENTRY_QUERY, params)
+                db.executemany(INSERT_ENTRY_IF_MISSING_QUERY, params)
             except sqlite3.IntegrityError as e:
                 e_msg = str(e).lower()
                 if "foreign key constraint failed" in e_msg:
-                    raise FeedNotFoundError(intent.entry.feed_url) from None
+                    raise FeedNotFoundError(feed_url) from None
                 raise  # pragma: no cover
 
+    def _add_or_update_entries_one_by_one(
+        self, db: sqlite3.Connection, intents: Iterable[EntryUpdateIntent]
+    ) -> None:
+        try:
+            for intent in intents:
+                # we cannot rely on the updater getting an EntryForUpdate
+                # to tell if the entry is new at *this* point in time,
+                # the entry may have been added/deleted by a parallel update
+                #
+                # as a consequence, EntryUpdateIntent must set all fields,
+                # including the ones which have a single value
+                # for the entire lifetime of the entry (like first_updated)
+
+                new = not list(
+                    db.execute(
+                        "SELECT 1 FROM entries WHERE (feed, id) = (?, ?)",
+                        intent.entry.resource_id,
+                    )
+                )
+
+                if new:
+                    self._insert_entry(db, intent)
+                else:
+                    self._update_entry(db, intent)
+
+        except sqlite3.IntegrityError as e:
+            e_msg = str(e).lower()
+            if "foreign key constraint failed" in e_msg:
+                raise FeedNotFoundError(intent.entry.feed_url) from None
+            raise  # pragma: no cover
+
     def _insert_entry(self, db: sqlite3.Connection, intent: EntryUpdateIntent) -> None:
         query = """
             INSERT INTO entries (
@@ -394,6 +498,35 @@ class EntriesMixin(StorageBase):
             )
         rowcount_exactly_one(cursor, lambda: EntryNotFoundError(feed_url, entry_id))
 
+    @wrap_exceptions()
+    def get_sanitized_html(self, key: bytes) -> str | None:
+        row = (
+            self.get_db()
+            .execute(
+                "SELECT value FROM sanitized_html WHERE key = :key;", dict(key=key)
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    @wrap_exceptions()
+    def add_sanitized_html(
+        self, values: Iterable[tuple[bytes, str]], max_count: int
+    ) -> None:
+        with self.get_db() as db:
+            db.executemany(
+                "INSERT OR IGNORE INTO sanitized_html (key, value) VALUES (?, ?);",
+                values,
+            )
+            # first in, first out; ids increase, so this keeps max_count values
+            db.execute(
+                """
+                DELETE FROM sanitized_html
+                WHERE id <= (SELECT max(id) FROM sanitized_html) - :max_count;
+                """,
+                dict(max_count=max_count),
+            )
+
 
 def get_entries_query(
     filter: EntryFilter, sort: EntrySort
@@ -635,6 +768,114 @@ def get_entry_counts_query(
     return query, context
 
 
+# Must have the same semantics as _insert_entry() / _update_entry();
+# notably, read, first_updated, and first_updated_epoch
+# are set only when the entry is inserted.
+#
+# Both use the parameters from entry_update_intent_to_params().
+
+UPDATE_ENTRY_QUERY = """
+    UPDATE entries
+    SET
+        title = ?3,
+        link = ?4,
+        updated = ?5,
+        author = ?6,
+        published = ?7,
+        summary = ?8,
+        content = ?9,
+        enclosures = ?10,
+        last_updated = ?11,
+        feed_order = ?14,
+        recent_sort = ?15,
+        original_feed = NULL,
+        data_hash = ?16,
+        data_hash_changed = ?17,
+        added_by = ?18
+    WHERE (feed, id) = (?2, ?1);
+"""
+
+INSERT_ENTRY_IF_MISSING_QUERY = """
+    INSERT INTO entries (
+        id,
+        feed,
+        title,
+        link,
+        updated,
+        author,
+        published,
+        summary,
+        content,
+        enclosures,
+        read,
+        last_updated,
+        first_updated,
+        first_updated_epoch,
+        feed_order,
+        recent_sort,
+        data_hash,
+        data_hash_changed,
+        added_by
+    )
+    SELECT
+        ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10,
+        0,  -- read (should be not null in the schema, but isn't)
+        ?11, ?12, ?13, ?14, ?15, ?16, ?17, ?18
+    WHERE NOT EXISTS (
+        SELECT 1 FROM entries WHERE (feed, id) = (?2, ?1)
+    );
+"""
+
+
+def entry_update_intent_to_params(intent: EntryUpdateIntent) -> tuple[Any, ...]:
+    """Like entry_update_intent_to_dict(), but as a tuple.
+
+    Avoids building intermediary dicts (this runs for every updated entry).
+
+    """
+    entry = intent.entry
+    return (
+        entry.id,
+        entry.feed_url,
+        entry.title,
+        entry.link,
+        adapt_datetime(entry.updated) if entry.updated else None,
+        entry.author,
+        adapt_datetime(entry.published) if entry.published else None,
+        entry.summary,
+        json.dumps([t._asdict() for t in entry.content]) if entry.content else None,
+        (
+            json.dumps([t._asdict() for t in entry.enclosures])
+            if entry.enclosures
+            else None
+        ),
+        adapt_datetime(intent.last_updated),
+        adapt_datetime(intent.first_updated) if intent.first_updated else None,
+        (
+            adapt_datetime(intent.first_updated_epoch)
+            if intent.first_updated_epoch
+            else None
+        ),
+        intent.feed_order,
+        adapt_datetime(intent.recent_sort) if intent.recent_sort else None,
+        entry.hash,
+        intent.hash_changed,
+        intent.added_by,
+    )
+
+
+def entry_for_update_factory(row: Sequence[Any]) -> EntryForUpdate:
+    fu, fu_epoch, recent_sort, updated, data_hash, data_hash_changed = row
+    return EntryForUpdate(
+        convert_timestamp(fu),
+        convert_timestamp(fu_epoch),
+        convert_timestamp(recent_sort),
+        convert_timestamp(updated) if updated else None,
+        data_hash,
+        data_hash_changed,
+    )
+
+
 def entry_update_intent_to_dict(intent: EntryUpdateIntent) -> dict[str, Any]:
     context = intent._asdict()
     entry = context.pop('entry')
@@ -82,8 +82,14 @@ class FeedsMixin(StorageBase):
                     version = NULL,
                     http_etag = NULL,
                     http_last_modified = NULL,
+                    resource_hash = NULL,
                     stale = 0,
                     update_after = NULL,
+                    adaptive_interval = NULL,
+                    consecutive_failures = 0,
+                    redirect_url = NULL,
+                    redirect_count = 0,
+                    early_stops = 0,
                     last_retrieved = NULL,
                     last_updated = NULL,
                     last_exception = NULL
@@ -174,6 +180,7 @@ class FeedsMixin(StorageBase):
     def get_feeds_for_update(
         self,
         filter: FeedFilter = FeedFilter(),  # noqa: B008
+        config_key: str | None = None,
     ) -> Iterable[FeedForUpdate]:
         def row_factory(row: tuple[Any, ...]) -> FeedForUpdate:
             (
@@ -185,7 +192,14 @@ class FeedsMixin(StorageBase):
                 last_updated,
                 last_exception,
                 data_hash,
-            ) = row
+                config,
+                adaptive_interval,
+                resource_hash,
+                consecutive_failures,
+                redirect_url,
+                redirect_count,
+                early_stops,
+            ) = row[:15]
             return FeedForUpdate(
                 url,
                 convert_timestamp(updated) if updated else None,
@@ -195,6 +209,13 @@ class FeedsMixin(StorageBase):
                 convert_timestamp(last_updated) if last_updated else None,
                 last_exception == 1,
                 data_hash,
+                json.loads(config) if config is not None else None,
+                adaptive_interval,
+                resource_hash,
+                consecutive_failures,
+                redirect_url,
+                redirect_count,
+                early_stops,
             )
 
         def make_query() -> tuple[Query, dict[str, Any]]:
@@ -209,11 +230,31 @@ class FeedsMixin(StorageBase):
                     'last_updated',
                     ('last_exception', 'last_exception IS NOT NULL'),
                     'data_hash',
+                    ('config', 'config.value'),
+                    'adaptive_interval',
+                    'resource_hash',
+                    'consecutive_failures',
+                    'redirect_url',
+                    'redirect_count',
+                    'early_stops',
                 )
                 .FROM("feeds")
-                .scrolling_window_order_by("url")
+                # get the config in the same query, to avoid
+                # one get_tag() round-trip per feed during update
+                .LEFT_JOIN(
+                    "feed_tags AS config "
+                    "ON (config.feed, config.key) = (feeds.url, :config_key)"
+                )
             )
+            # For scheduled updates, get the most overdue feeds first.
+            # Updated feeds get an update_after in the future,
+            # so they don't show up again in later pages.
+            if filter.update_after is not None:
+                query.scrolling_window_sort_key(SCHEDULED_UPDATE_SORT_KEY)
+            else:
+                query.scrolling_window_order_by("url")
             context = feed_filter(query, filter)
+            context.update(config_key=config_key)
             return query, context
 
         return self.paginated_query(make_query, row_factory=row_factory)
@@ -229,45 +270,54 @@ class FeedsMixin(StorageBase):
 
     @wrap_exceptions()
     def update_feed(self, intent: FeedUpdateIntent) -> None:
-        url, _, _, value = intent
-
-        context: dict[str, Any] = {
-            'url': url,
-            'last_retrieved': adapt_datetime(intent.last_retrieved),
-            'update_after': adapt_datetime(intent.update_after),
-        }
-        expressions: list[str] = []
-
-        if isinstance(value, FeedToUpdate):
-            assert url == value.feed.url, "updating feed URL not supported"
-
-            context.update(value._asdict())
-            feed = context.pop('feed')
+        with self.get_db() as db:
+            update_feed(db, intent)
+
+
+def update_feed(db: sqlite3.Connection, intent: FeedUpdateIntent) -> None:
+    url, value = intent.url, intent.value
+
+    context: dict[str, Any] = {
+        'url': url,
+        'last_retrieved': adapt_datetime(intent.last_retrieved),
+        'update_after': adapt_datetime(intent.update_after),
+        'adaptive_interval': intent.adaptive_interval,
+        'consecutive_failures': intent.consecutive_failures,
+        'redirect_url': intent.redirect_url,
+        'redirect_count': intent.redirect_count,
+        'early_stops': intent.early_stops,
+    }
+    if intent.resource_hash is not None:
+        context['resource_hash'] = intent.resource_hash
+    expressions: list[str] = []
+
+    if isinstance(value, FeedToUpdate):
+        context.update(value._asdict())
+        feed = context.pop('feed')
+        context.update(last_updated=adapt_datetime(value.last_updated))
+
+        if feed is not None:
+            assert url == feed.url, "updating feed URL not supported"
             context.update(
                 feed._asdict(),
                 updated=adapt_datetime(feed.updated) if feed.updated else None,
-                last_updated=adapt_datetime(value.last_updated),
                 data_hash=feed.hash,
             )
             context.pop('hash', None)
-
             expressions.append("stale = 0")
 
-        expressions.extend(f"{n} = :{n}" for n in context if n != 'url')
-
-        if isinstance(value, ExceptionInfo):
-            context['last_exception'] = json.dumps(value._asdict())
-            expressions.append("last_exception = :last_exception")
-        else:
-            assert isinstance(value, FeedToUpdate | None)
-            expressions.append("last_exception = NULL")
-
-        query = f"UPDATE feeds SET {', '.join(expressions)} WHERE url = :url;"
+    expressions.extend(f"{n} = :{n}" for n in context if n != 'url')
 
-        with self.get_db() as db:
-            cursor = db.execute(query, context)
+    if isinstance(value, ExceptionInfo):
+        context['last_exception'] = json.dumps(value._asdict())
+        expressions.append("last_exception = :last_exception")
+    else:
+        assert isinstance(value, FeedToUpdate | None)
+        expressions.append("last_exception = NULL")
 
-        rowcount_exactly_one(cursor, lambda: FeedNotFoundError(url))
+    query = f"UPDATE feeds SET {', '.join(expressions)} WHERE url = :url;"
+    cursor = db.execute(query, context)
+    rowcount_exactly_one(cursor, lambda: FeedNotFoundError(url))
 
 
 def get_feeds_query(filter: FeedFilter, sort: FeedSort) -> tuple[Query, dict[str, Any]]:
@@ -338,6 +388,14 @@ FEED_SORT_KEYS = {
     'added': SortKey("added", "url", desc=True),
 }
 
+# scheduled updates: most overdue first, never updated first of all;
+# uses the feeds_by_kinda_update_after index
+SCHEDULED_UPDATE_SORT_KEY = SortKey(
+    ("kinda_update_after", "coalesce(update_after, '')"),
+    ("kinda_last_retrieved", "coalesce(last_retrieved, '')"),
+    "url",
+)
+
 
 def feed_filter(query: Query, filter: FeedFilter) -> dict[str, Any]:
     url, tags, broken, updates_enabled, new, update_after = filter
@@ -357,7 +415,9 @@ def feed_filter(query: Query, filter: FeedFilter) -> dict[str, Any]:
     if new is not None:
         query.WHERE(f"last_retrieved is {'' if new else 'NOT'} NULL")
     if update_after is not None:
-        query.WHERE("update_after is NULL or update_after <= :update_after")
+        # same as "update_after is NULL or update_after <= :update_after",
+        # but can use the feeds_by_kinda_update_after index
+        query.WHERE("coalesce(update_after, '') <= :update_after")
         context.update(update_after=adapt_datetime(update_after))
 
     return context
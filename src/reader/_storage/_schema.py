@@ -20,12 +20,18 @@ CREATE TABLE feeds (
     user_title TEXT,  -- except this one, which comes from reader
     http_etag TEXT,
     http_last_modified TEXT,
+    resource_hash BLOB,  -- derived from the retrieved resource
     data_hash BLOB,  -- derived from feed data
 
     -- reader data
     stale INTEGER NOT NULL DEFAULT 0,
     updates_enabled INTEGER NOT NULL DEFAULT 1,
     update_after TIMESTAMP,  -- null if the feed was never retrieved
+    adaptive_interval INTEGER,  -- null unless the update interval is adaptive
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    redirect_url TEXT,  -- null unless permanently redirected
+    redirect_count INTEGER NOT NULL DEFAULT 0,
+    early_stops INTEGER NOT NULL DEFAULT 0,
     last_retrieved TIMESTAMP,  -- null if the feed was never retrieved
     last_updated TIMESTAMP,  -- null if the feed was never updated
     added TIMESTAMP NOT NULL,
@@ -102,6 +108,14 @@ CREATE TABLE entry_tags (
         ON DELETE CASCADE
 );
 
+-- persistent SanitizeHTMLCache for the default parsers;
+-- key is a digest of the original HTML, base URI, and content type
+CREATE TABLE sanitized_html (
+    id INTEGER PRIMARY KEY,  -- insertion order, oldest values are deleted first
+    key BLOB NOT NULL UNIQUE,
+    value TEXT NOT NULL
+);
+
 -- speed up get_entries() queries that use apply_recent()
 CREATE INDEX entries_by_recent ON entries (
     recent_sort DESC,
@@ -115,6 +129,13 @@ CREATE INDEX entries_by_recent ON entries (
 -- speed up get_entry_counts(feed=...)
 CREATE INDEX entries_by_feed ON entries (feed);
 
+-- speed up scheduled updates (filter and order by update_after)
+CREATE INDEX feeds_by_kinda_update_after ON feeds (
+    coalesce(update_after, ''),
+    coalesce(last_retrieved, ''),
+    url
+);
+
 """)  # fmt: skip
 
 feeds_table = SCHEMA['table']['feeds']
@@ -122,9 +143,11 @@ entries_table = SCHEMA['table']['entries']
 global_tags_table = SCHEMA['table']['global_tags']
 feed_tags_table = SCHEMA['table']['feed_tags']
 entry_tags_table = SCHEMA['table']['entry_tags']
+sanitized_html_table = SCHEMA['table']['sanitized_html']
 
 entries_by_recent_index = SCHEMA['index']['entries_by_recent']
 entries_by_feed_index = SCHEMA['index']['entries_by_feed']
+feeds_by_kinda_update_after_index = SCHEMA['index']['feeds_by_kinda_update_after']
 
 
 def create_all(db: sqlite3.Connection) -> None:
@@ -133,12 +156,14 @@ def create_all(db: sqlite3.Connection) -> None:
     global_tags_table.create(db)
     feed_tags_table.create(db)
     entry_tags_table.create(db)
+    sanitized_html_table.create(db)
     create_indexes(db)
 
 
 def create_indexes(db: sqlite3.Connection) -> None:
     entries_by_recent_index.create(db)
     entries_by_feed_index.create(db)
+    feeds_by_kinda_update_after_index.create(db)
 
 
 def update_from_36_to_37(db: sqlite3.Connection, /) -> None:  # pragma: no cover
@@ -224,7 +249,9 @@ def update_from_37_to_38(db: sqlite3.Connection, /) -> None:  # pragma: no cover
     db.execute("DROP TABLE entries;")
     db.execute("ALTER TABLE new_entries RENAME TO entries;")
 
-    create_indexes(db)
+    # only the entries indexes, the others didn't exist yet
+    entries_by_recent_index.create(db)
+    entries_by_feed_index.create(db)
     # pre-3.12 (version 38), we'd re-create the entries search triggers here;
     # no point in doing that anymore, update_from_38_to_39 drops them anyway
 
@@ -273,7 +300,26 @@ def update_from_39_to_40(db: sqlite3.Connection, /) -> None:  # pragma: no cover
     db.execute("ALTER TABLE feeds ADD COLUMN last_retrieved TIMESTAMP;")
 
 
-VERSION = 40
+def update_from_40_to_41(db: sqlite3.Connection, /) -> None:  # pragma: no cover
+    db.execute("ALTER TABLE feeds ADD COLUMN resource_hash BLOB;")
+    db.execute("ALTER TABLE feeds ADD COLUMN adaptive_interval INTEGER;")
+    db.execute(
+        "ALTER TABLE feeds "
+        "ADD COLUMN consecutive_failures INTEGER NOT NULL DEFAULT 0;"
+    )
+    db.execute(
+        "UPDATE feeds SET consecutive_failures = 1 WHERE last_exception IS NOT NULL;"
+    )
+    db.execute("ALTER TABLE feeds ADD COLUMN redirect_url TEXT;")
+    db.execute(
+        "ALTER TABLE feeds ADD COLUMN redirect_count INTEGER NOT NULL DEFAULT 0;"
+    )
+    db.execute("ALTER TABLE feeds ADD COLUMN early_stops INTEGER NOT NULL DEFAULT 0;")
+    feeds_by_kinda_update_after_index.create(db)
+    sanitized_html_table.create(db)
+
+
+VERSION = 41
 
 MIGRATIONS = {
     # 1-9 removed before 0.1 (last in e4769d8ba77c61ec1fe2fbe99839e1826c17ace7)
@@ -284,6 +330,7 @@ MIGRATIONS = {
     37: update_from_37_to_38,
     38: update_from_38_to_39,
     39: update_from_39_to_40,
+    40: update_from_40_to_41,
 }
 MISSING_SUFFIX = (
     "; you may have skipped some required migrations, see "
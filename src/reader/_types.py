@@ -25,6 +25,7 @@ from typing import TypeVar
 from typing import Union
 
 from ._hash_utils import get_hash
+from .exceptions import FeedNotFoundError
 from .exceptions import SingleUpdateHookError
 from .exceptions import UpdateHookError
 from .exceptions import UpdateHookErrorGroup
@@ -258,6 +259,37 @@ class ParsedFeed(NamedTuple):
     #: Used by :meth:`~reader._parser.Parser.process_entry_pairs`
     #: to select an appropriate parser.
     mime_type: str | None = None
+    #: How long (in seconds) the server asked us to wait
+    #: before retrieving the feed again, if at all.
+    #: Used to schedule the next update.
+    retry_after: int | None = None
+    #: The hash of the retrieved resource, if any.
+    #: Passed back to :meth:`~reader._parser.Parser.parallel`
+    #: on the next update, to skip parsing if the resource did not change.
+    resource_hash: bytes | None = None
+    #: The URL the feed was permanently redirected to, if any.
+    #: Used to change the feed URL after a number of updates.
+    permanent_redirect: str | None = None
+    #: Whether the feed contains only the entries changed since the last update
+    #: (see :attr:`~reader._parser.RetrieveResult.is_delta` for details).
+    is_delta: bool = False
+
+
+@dataclass(frozen=True)
+class NotModified:
+    """The feed was not modified since the last update.
+
+    Falsy, so it can be checked for like :const:`None`.
+
+    """
+
+    #: How long (in seconds) the server asked us to wait
+    #: before retrieving the feed again, if at all.
+    #: Used to schedule the next update.
+    retry_after: int | None = None
+
+    def __bool__(self) -> Literal[False]:
+        return False
 
 
 class FeedForUpdate(NamedTuple):
@@ -288,6 +320,31 @@ class FeedForUpdate(NamedTuple):
     #: The :attr:`~FeedData.hash` of the corresponding FeedData.
     hash: bytes | None
 
+    #: The value of the feed tag named by
+    #: :meth:`~StorageType.get_feeds_for_update` ``config_key``;
+    #: none if the tag is not set (or no key was given).
+    config: JSONType | None = None
+
+    #: The current adaptive update interval, in minutes;
+    #: none if the update interval is not adaptive.
+    adaptive_interval: int | None = None
+
+    #: The :attr:`~ParsedFeed.resource_hash` from the last update.
+    resource_hash: bytes | None = None
+
+    #: The number of updates in a row that failed.
+    consecutive_failures: int = 0
+
+    #: The :attr:`~ParsedFeed.permanent_redirect` from the last update.
+    redirect_url: str | None = None
+
+    #: The number of updates in a row redirected to :attr:`redirect_url`.
+    redirect_count: int = 0
+
+    #: The number of updates in a row that stopped early
+    #: (did not look at all the entries).
+    early_stops: int = 0
+
 
 class EntryForUpdate(NamedTuple):
     """Update-relevant information about an existing entry, from Storage."""
@@ -333,12 +390,35 @@ class FeedUpdateIntent(NamedTuple):
     #: the cause of :exc:`.UpdateError`, if one happened.
     value: FeedToUpdate | None | ExceptionInfo
 
+    #: The next adaptive update interval, in minutes;
+    #: none if the update interval is not adaptive.
+    adaptive_interval: int | None = None
+
+    #: The hash of the retrieved resource, if any;
+    #: if none, the stored hash remains unchanged.
+    resource_hash: bytes | None = None
+
+    #: The number of updates in a row that failed, including this one.
+    consecutive_failures: int = 0
+
+    #: The URL the feed was permanently redirected to
+    #: and the number of updates in a row this happened, including this one.
+    redirect_url: str | None = None
+    redirect_count: int = 0
+
+    #: If set, change the feed URL to this after the update.
+    new_url: str | None = None
+
+    #: The number of updates in a row that stopped early, including this one.
+    early_stops: int = 0
+
 
 class FeedToUpdate(NamedTuple):
     """Data passed to Storage when (successfully) updating a feed."""
 
     #: The feed data.
-    feed: FeedData
+    #: If none (e.g. for a delta update), the stored feed data remains unchanged.
+    feed: FeedData | None
 
     #: The time at the start of updating this feed.
     last_updated: datetime
@@ -780,6 +860,7 @@ class StorageType(Protocol):  # pragma: no cover
         :meth:`set_feed_stale`
         :meth:`get_entries_for_update`
         :meth:`add_or_update_entries`
+        :meth:`update_feeds_and_entries`
         :meth:`get_entry_recent_sort`
         :meth:`set_entry_recent_sort`
 
@@ -1070,15 +1151,23 @@ class StorageType(Protocol):  # pragma: no cover
 
         """
 
-    def get_feeds_for_update(self, filter: FeedFilter) -> Iterable[FeedForUpdate]:
+    def get_feeds_for_update(
+        self, filter: FeedFilter, config_key: str | None = None
+    ) -> Iterable[FeedForUpdate]:
         """Called by update logic.
 
         Args:
             filter
+            config_key:
+                If given, also get the value of the feed tag with this key
+                (as :attr:`FeedForUpdate.config`).
 
         Returns:
             A lazy iterable.
 
+        .. versionchanged:: 3.14
+            Add the ``config_key`` argument.
+
         """
 
     def update_feed(self, intent: FeedUpdateIntent, /) -> None:
@@ -1129,6 +1218,28 @@ class StorageType(Protocol):  # pragma: no cover
 
         """
 
+    def update_feeds_and_entries(
+        self,
+        intents: Iterable[tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]]],
+        /,
+    ) -> list[FeedNotFoundError | None]:
+        """Called by update logic.
+
+        Like calling :meth:`add_or_update_entries` and :meth:`update_feed`
+        for each feed, but in a single transaction.
+
+        Args:
+            intents: (feed intent, entry intents) pairs.
+
+        Returns:
+            For each pair, in order,
+            :class:`.FeedNotFoundError` if the feed does not exist
+            (the other feeds are updated regardless), or None otherwise.
+
+        .. versionadded:: 3.14
+
+        """
+
     def get_entry_recent_sort(self, entry: tuple[str, str], /) -> datetime:
         """Get :attr:`EntryUpdateIntent.recent_sort`.
 
@@ -1175,6 +1286,37 @@ class BoundSearchStorageType(StorageType, Protocol):
         """
 
 
+@runtime_checkable
+class SanitizedHTMLStorageType(StorageType, Protocol):
+    """A storage that can persist the values of a
+    :class:`~reader._parser.sanitizer.SanitizeHTMLCache` between processes.
+
+    """
+
+    def get_sanitized_html(self, key: bytes, /) -> str | None:
+        """Get a sanitized HTML value.
+
+        Args:
+            key: Digest of the original HTML, base URI, and content type.
+
+        Returns:
+            The value, or None if there is no value for the key.
+
+        """
+
+    def add_sanitized_html(
+        self, values: Iterable[tuple[bytes, str]], max_count: int, /  # noqa: W504
+    ) -> None:
+        """Add sanitized HTML values (existing keys are ignored),
+        then delete the values added first, so at most `max_count` remain.
+
+        Args:
+            values: (key, value) pairs.
+            max_count: Maximum number of values to keep.
+
+        """
+
+
 class SearchType(Protocol):  # pragma: no cover
     """Search DAO protocol.
 
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import logging
+import math
 import random
+import time
+from collections.abc import Callable
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 from functools import partial
 from itertools import chain
+from itertools import islice
 from itertools import starmap
 from itertools import tee
 from typing import Any
 from typing import NamedTuple
 from typing import Optional
 from typing import TYPE_CHECKING
+from typing import TypeVar
+from urllib.parse import urlsplit
 
 from ._types import EntryData
 from ._types import EntryForUpdate
@@ -22,10 +29,15 @@ from ._types import FeedData
 from ._types import FeedForUpdate
 from ._types import FeedToUpdate
 from ._types import FeedUpdateIntent
+from ._types import NotModified
 from ._types import ParsedFeed
+from ._utils import chunks
 from ._utils import count_consumed
+from ._utils import iter_in_thread
 from ._utils import PrefixLogger
+from .exceptions import FeedExistsError
 from .exceptions import FeedNotFoundError
+from .exceptions import InvalidFeedURLError
 from .exceptions import ParseError
 from .exceptions import UpdateError
 from .types import EntryUpdateStatus
@@ -43,8 +55,16 @@ if TYPE_CHECKING:  # pragma: no cover
 
 log = logging.getLogger("reader")
 
+_T = TypeVar('_T')
+
 HASH_CHANGED_LIMIT = 24
 
+# how the adaptive update interval changes (multiplier)
+# when the feed did / did not change
+ADAPTIVE_INTERVAL_SHRINK = 0.5
+ADAPTIVE_INTERVAL_GROW = 1.5
+FAILURE_BACKOFF = 2
+
 
 EntryPairs = Iterable[tuple[EntryData, Optional[EntryForUpdate]]]
 
@@ -75,10 +95,15 @@ class Decider:
             # (last_updated is always set if the feed was updated at least
             # once, unless the database predates last_updated).
             #
-            feed = feed._replace(updated=None, http_etag=None, http_last_modified=None)
+            feed = feed._replace(
+                updated=None,
+                http_etag=None,
+                http_last_modified=None,
+                resource_hash=None,
+            )
             log.info(
                 "update feed %r: feed marked as stale, "
-                "ignoring updated, http_etag and http_last_modified",
+                "ignoring updated, http_etag, http_last_modified, and resource_hash",
                 feed.url,
             )
         return feed
@@ -90,9 +115,16 @@ class Decider:
         now: datetime,
         global_now: datetime,
         config: UpdateConfig,
-        parsed_feed: ParsedFeed | None | ParseError,
-        entry_pairs: EntryPairs,
+        parsed_feed: ParsedFeed | NotModified | None | ParseError,
+        get_entry_pairs: Callable[[int], EntryPairs],
     ) -> tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]]:
+        """Make the feed / entry update intents.
+
+        get_entry_pairs is called (only if there are entries to look at)
+        with the early stop value (see get_early_stop()),
+        so it can look entries up accordingly.
+
+        """
         decider = cls(
             old_feed,
             now,
@@ -100,7 +132,7 @@ class Decider:
             config,
             PrefixLogger(log, ["update feed %r" % old_feed.url]),
         )
-        return decider.update(parsed_feed, entry_pairs)
+        return decider.update(parsed_feed, get_entry_pairs)
 
     def __post_init__(self) -> None:
         object.__setattr__(
@@ -195,16 +227,47 @@ class Decider:
         debug("entry not updated, skipping")
         return None
 
-    def get_entries_to_update(self, pairs: EntryPairs) -> Iterable[EntryUpdateIntent]:
-        for feed_order, (new, old) in reversed(list(enumerate(pairs))):
-            # This may fail if we ever implement changing the feed URL
-            # in response to a permanent redirect.
+    def get_entries_to_update(
+        self, pairs: EntryPairs, early_stop: int = 0
+    ) -> tuple[list[EntryUpdateIntent], bool]:
+        """Get the entries that need updating.
+
+        If early_stop is true, stop after this many unchanged entries in a row
+        (most feeds list entries newest-first, so the rest are likely unchanged);
+        the remaining pairs are not consumed.
+
+        Returns:
+            (entries to update, whether we stopped early) tuple.
+
+        """
+        # Keep only the entries that need updating, so the pairs
+        # (and the entries they come from) can be consumed in a streaming fashion.
+        to_update = []
+        unchanged = 0
+        stopped_early = False
+        for feed_order, (new, old) in enumerate(pairs):
+            # The feed URL is changed only after the update is written.
             assert new.feed_url == self.url, f'{new.feed_url!r}, {self.url!r}'
 
             should_update = self.should_update_entry(new, old)
-            if not should_update:
+            if should_update:
+                to_update.append((feed_order, new, old, should_update))
+                unchanged = 0
                 continue
 
+            unchanged += 1
+            if early_stop and unchanged >= early_stop:
+                self.log.info("%s unchanged entries in a row, stopping", unchanged)
+                stopped_early = True
+                break
+
+        return list(self.make_entry_intents(to_update)), stopped_early
+
+    def make_entry_intents(
+        self,
+        to_update: list[tuple[int, EntryData, EntryForUpdate | None, UpdateReasons]],
+    ) -> Iterable[EntryUpdateIntent]:
+        for feed_order, new, old, should_update in reversed(to_update):
             if not old:
                 if not self.old_feed.last_updated:
                     recent_sort = new.published or new.updated or self.global_now
@@ -229,6 +292,23 @@ class Decider:
         parsed_feed: ParsedFeed,
         entries_to_update: bool,
     ) -> FeedToUpdate | None:
+        # a delta should not happen for a never updated or stale feed
+        # (there are no caching headers), but if it does, it's all we have
+        if parsed_feed.is_delta and self.old_feed.last_updated and not self.stale:
+            # The feed data of a delta may be incomplete,
+            # so we neither compare its hash nor store it;
+            # we do store the caching headers (the next delta is based on them).
+            if not entries_to_update:
+                self.log.info("delta update has no entries to update, skipping")
+                return None
+            self.log.info("delta update has entries to update, treating as updated")
+            return FeedToUpdate(
+                None,
+                self.now,
+                parsed_feed.http_etag,
+                parsed_feed.http_last_modified,
+            )
+
         if self.should_update_feed(parsed_feed.feed, entries_to_update):
             return FeedToUpdate(
                 parsed_feed.feed,
@@ -240,38 +320,225 @@ class Decider:
 
     def update(
         self,
-        parsed_feed: ParsedFeed | None | ParseError,
-        entry_pairs: EntryPairs,
+        parsed_feed: ParsedFeed | NotModified | None | ParseError,
+        get_entry_pairs: Callable[[int], EntryPairs],
     ) -> tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]]:
 
         # TODO: move entries_to_update in FeedToUpdate, maybe?
         entries_to_update: Iterable[EntryUpdateIntent] = ()
         value: FeedToUpdate | None | ExceptionInfo
+        # not modified or error, we didn't look at the entries
+        early_stops = self.old_feed.early_stops
 
         if not parsed_feed:
             value = None
         elif isinstance(parsed_feed, ParseError):
             value = ExceptionInfo.from_exception(parsed_feed)
         else:
-            entries_to_update = list(self.get_entries_to_update(entry_pairs))
+            early_stop = self.get_early_stop()
+            entries_to_update, stopped_early = self.get_entries_to_update(
+                get_entry_pairs(early_stop), early_stop
+            )
             value = self.get_feed_to_update(parsed_feed, bool(entries_to_update))
+            early_stops = early_stops + 1 if stopped_early else 0
 
         # We always return a FeedUpdateIntent because
         # we always want to set last_retrieved and update_after,
         # and clear last_exception (if set before the update).
 
-        update_after = next_update_after(self.global_now, **self.config)
+        if isinstance(value, ExceptionInfo):
+            changed = None
+            failures = self.old_feed.consecutive_failures + 1
+        else:
+            changed = bool(entries_to_update)
+            failures = 0
+
+        adaptive_interval = self.get_adaptive_interval(changed)
+        interval = self.get_failure_interval(
+            adaptive_interval or self.config['interval'], failures
+        )
+        update_after = next_update_after(
+            self.global_now, interval, self.config['jitter']
+        )
+        if parsed_feed is not None:
+            update_after = self.apply_retry_after(update_after, parsed_feed)
+
+        # store the resource hash even if the feed did not change,
+        # so the next update can skip parsing it
+        resource_hash = None
+        if isinstance(parsed_feed, ParsedFeed):
+            resource_hash = parsed_feed.resource_hash
+
+        redirect_url, redirect_count, new_url = self.get_redirect(parsed_feed)
+
         return (
-            FeedUpdateIntent(self.url, self.now, update_after, value),
+            FeedUpdateIntent(
+                self.url,
+                self.now,
+                update_after,
+                value,
+                adaptive_interval,
+                resource_hash,
+                failures,
+                redirect_url,
+                redirect_count,
+                new_url,
+                early_stops,
+            ),
             entries_to_update,
         )
 
+    def get_early_stop(self) -> int:
+        """Get the number of unchanged entries in a row after which
+        to stop looking at the rest of the entries (0 means never),
+        from the ``early_stop_after`` config value.
+
+        Every ``full_update_every`` updates, all the entries are looked at,
+        to catch changes further down the feed.
+
+        """
+        early_stop = self.config['early_stop_after']
+        if not early_stop or self.stale or not self.old_feed.last_updated:
+            return 0
+        if self.old_feed.early_stops + 1 >= self.config['full_update_every']:
+            self.log.info(
+                "stopped early %s time(s) in a row, looking at all entries",
+                self.old_feed.early_stops,
+            )
+            return 0
+        return early_stop
+
+    def get_redirect(
+        self, parsed_feed: ParsedFeed | NotModified | None | ParseError
+    ) -> tuple[str | None, int, str | None]:
+        """Count the updates in a row permanently redirected to the same URL.
+
+        Returns:
+            (redirect URL, count, new feed URL) tuple;
+            the new feed URL is set once the count reaches
+            the ``change_url_after`` config value.
+
+        """
+        if not isinstance(parsed_feed, ParsedFeed):
+            # not modified or error, we don't know if it was redirected
+            return self.old_feed.redirect_url, self.old_feed.redirect_count, None
+
+        url = parsed_feed.permanent_redirect
+        if not url:
+            return None, 0, None
+
+        count = 1
+        if url == self.old_feed.redirect_url:
+            count += self.old_feed.redirect_count
+
+        change_url_after = self.config['change_url_after']
+        if not change_url_after or count < change_url_after:
+            self.log.info(
+                "permanently redirected to %r, %s time(s) in a row", url, count
+            )
+            return url, count, None
+
+        return url, count, url
+
+    def apply_retry_after(
+        self,
+        update_after: datetime,
+        parsed_feed: ParsedFeed | NotModified | ParseError,
+    ) -> datetime:
+        """Push update_after forward if the server asked us to wait
+        (Cache-Control / Expires / Retry-After),
+        up to the ``max_retry_after`` config value.
+
+        """
+        if isinstance(parsed_feed, ParseError):
+            retry_after = parsed_feed._retry_after
+        else:
+            retry_after = parsed_feed.retry_after
+        max_retry_after = self.config['max_retry_after'] * 60
+        if not retry_after or not max_retry_after:
+            return update_after
+
+        if retry_after > max_retry_after:
+            self.log.info(
+                "retry after %ss exceeds the maximum (%ss), capping",
+                retry_after,
+                max_retry_after,
+            )
+            retry_after = max_retry_after
+
+        server_update_after = self.now + timedelta(seconds=retry_after)
+        if server_update_after <= update_after:
+            return update_after
+
+        self.log.info("server asked to retry after %ss", retry_after)
+        return server_update_after
+
+    def get_failure_interval(self, interval: int, failures: int) -> int:
+        """Back off exponentially after consecutive failures.
+
+        The first failure keeps the interval; after that, it is doubled
+        for every failure, up to the ``max_failure_interval`` config value
+        (which is ignored if less than the interval).
+
+        """
+        max_interval = self.config['max_failure_interval']
+        if failures <= 1 or max_interval <= interval:
+            return interval
+
+        # cap the exponent, the interval would be huge well before that
+        exponent = min(failures - 1, 32)
+        new = min(interval * int(FAILURE_BACKOFF**exponent), max_interval)
+        self.log.info(
+            "%s consecutive failures, backing off to %s minutes", failures, new
+        )
+        return new
+
+    def get_adaptive_interval(self, changed: bool | None) -> int | None:
+        """Get the next adaptive update interval.
+
+        Args:
+            changed:
+                Whether the feed had new / modified entries;
+                none if we don't know (e.g. there was an error).
+
+        Returns:
+            The interval, or none if the update interval is not adaptive.
+
+        """
+        interval = self.config['interval']
+        min_interval = min(self.config.get('min_interval', interval), interval)
+        max_interval = max(self.config.get('max_interval', interval), interval)
+        if min_interval == max_interval:
+            return None
+
+        old = self.old_feed.adaptive_interval or interval
+        old = min(max(old, min_interval), max_interval)
+
+        if changed is None:
+            new = old
+        elif changed:
+            new = max(min_interval, int(old * ADAPTIVE_INTERVAL_SHRINK))
+        else:
+            new = min(max_interval, math.ceil(old * ADAPTIVE_INTERVAL_GROW))
+
+        if new != old:
+            self.log.info("adaptive interval changed from %s to %s", old, new)
+        return new
+
 
 class UpdateReasons(NamedTuple):
     hash_changed: int = 0
 
 
-DEFAULT_CONFIG = UpdateConfig(interval=60, jitter=0)
+DEFAULT_CONFIG = UpdateConfig(
+    interval=60,
+    jitter=0,
+    max_retry_after=0,
+    max_failure_interval=60 * 24,
+    change_url_after=0,
+    early_stop_after=0,
+    full_update_every=10,
+)
 CONFIG_KEY = 'update'
 
 
@@ -286,6 +553,14 @@ def flatten_config(config: Any, default: UpdateConfig) -> UpdateConfig:
 
     set_number('interval', config, rv, int, min=1)  # type: ignore
     set_number('jitter', config, rv, float, max=1)  # type: ignore
+    set_number('min_interval', config, rv, int, min=1)  # type: ignore
+    set_number('max_interval', config, rv, int, min=1)  # type: ignore
+    set_number('max_retry_after', config, rv, int)  # type: ignore
+    set_number('max_failure_interval', config, rv, int)  # type: ignore
+    set_number('change_url_after', config, rv, int)  # type: ignore
+    set_number('max_entries', config, rv, int, min=1)  # type: ignore
+    set_number('early_stop_after', config, rv, int)  # type: ignore
+    set_number('full_update_every', config, rv, int, min=1)  # type: ignore
     return rv
 
 
@@ -314,6 +589,14 @@ def set_number(name, src, dst, type, min=0, max=float('inf')):  # type: ignore
     dst[name] = value
 
 
+def get_feed_host(feed: FeedForUpdate) -> str | None:
+    """Key for limiting concurrent requests to the same host
+    (none for URLs without a host, e.g. local files).
+
+    """
+    return urlsplit(feed.url).hostname
+
+
 # start on a Monday, so weekly amounts of seconds line up
 UPDATE_AFTER_START = datetime(1970, 1, 5)
 EPOCH_OFFSET = (UPDATE_AFTER_START - datetime(1970, 1, 1)).total_seconds()
@@ -344,13 +627,14 @@ class Pipeline:
         | xargs -n1 parser.process_feed_for_update
         | xargs -n1 decider.process_feed_for_update
         | xargs -n1 -P $workers parser.retrieve
-        | xargs -n1 parser.parse
+        | xargs -n1 -P $parse_workers parser.parse
         | xargs -n1 storage.get_entries_for_update
         | xargs -n1 parser.process_entry_pairs
         | xargs -n1 decider.make_intents
         | xargs -n1 update_feed
 
-    At the moment, only parser.retrieve runs in parallel.
+    At the moment, only parser.retrieve and parser.parse run in parallel
+    (the latter only if a parse_map is given).
 
     """
 
@@ -371,16 +655,34 @@ class Pipeline:
     global_now: datetime
 
     map: MapFunction[Any, Any]
+    parse_map: MapFunction[Any, Any] | None = None
+
+    # Write the changes for up to batch_size feeds in a single transaction,
+    # waiting for at most batch_interval seconds (checked when a feed arrives).
+    # Trades (some) latency and hook ordering for throughput.
+    batch_size: int = 1
+    batch_interval: float | None = None
+
+    # If greater than 0, parse the feeds and make the intents in one thread,
+    # and write them (and run the update hooks) in another (the writer),
+    # with queues of up to queue_size feeds between them (for backpressure);
+    # the results are yielded in the calling thread. Decouples retrieval,
+    # parsing, and writes, so that none of them waits for the others.
+    # Storage must not be private (each thread uses its own connection).
+    queue_size: int = 0
+
+    # Stop retrieving new feeds after max_feeds feeds,
+    # or once reader._now() reaches the deadline;
+    # feeds already being retrieved are still updated.
+    max_feeds: int | None = None
+    deadline: datetime | None = None
+
     decider = Decider
 
     def update(self, filter: FeedFilter) -> Iterable[UpdateResult]:
         config_key = self.reader.make_reader_reserved_name(CONFIG_KEY)
         config = flatten_config(self.reader.get_tag((), config_key, {}), DEFAULT_CONFIG)
 
-        process_parse_result = partial(self.process_parse_result, config)
-
-        is_parallel = self.map is not map
-
         # ಠ_ಠ
         # The pipeline is not equipped to handle ParseErrors
         # as early as parser.process_feed_for_update().
@@ -401,15 +703,30 @@ class Pipeline:
                     parser_process_feeds_for_update_errors.append((feed, e))
 
         # assemble pipeline
-        feeds_for_update = self.reader._storage.get_feeds_for_update(filter)
+        feeds_for_update = self.reader._storage.get_feeds_for_update(filter, config_key)
+        feeds_for_update = self.apply_budget(feeds_for_update)
         # feeds_for_update = map(self.parser.process_feed_for_update, feeds_for_update)
         feeds_for_update = parser_process_feeds_for_update(feeds_for_update)
         feeds_for_update = map(self.decider.process_feed_for_update, feeds_for_update)
         parse_results = self.reader._parser.parallel(
-            feeds_for_update, self.map, is_parallel
+            feeds_for_update,
+            self.apply_deadline(self.map),
+            parse_map=self.parse_map,
+            stream=True,
         )
         parse_results = chain(parse_results, parser_process_feeds_for_update_errors)
-        update_results = starmap(process_parse_result, parse_results)
+        pending: Iterable[PendingUpdate]
+        pending = starmap(partial(self.make_pending, config), parse_results)
+        if self.queue_size:
+            pending = self.run_in_thread(pending, 'reader-update-parse')
+
+        update_results: Iterable[tuple[str, UpdatedFeed | None | Exception]]
+        if self.batch_size > 1 or self.batch_interval is not None:
+            update_results = self.write_pending_batched(pending)
+        else:
+            update_results = map(self.write_pending, pending)
+        if self.queue_size:
+            update_results = self.run_in_thread(update_results, 'reader-update-write')
 
         for url, value in update_results:
             if isinstance(value, FeedNotFoundError):
@@ -422,16 +739,121 @@ class Pipeline:
 
             yield UpdateResult(url, value)
 
-    def process_parse_result(
+    def apply_budget(self, feeds: Iterable[FeedForUpdate]) -> Iterable[FeedForUpdate]:
+        for i, feed in enumerate(feeds):
+            if self.max_feeds is not None and i >= self.max_feeds:
+                log.info("update feeds: reached max_feeds (%s), stopping", i)
+                return
+            if self.deadline is not None and self.reader._now() >= self.deadline:
+                log.info("update feeds: reached deadline after %s feeds, stopping", i)
+                return
+            yield feed
+
+    def apply_deadline(self, map: MapFunction[Any, Any]) -> MapFunction[Any, Any]:
+        # apply_budget() checks the deadline when a feed is taken from storage,
+        # but some maps take feeds well before they retrieve them
+        # (e.g. the workers_per_host one queues feeds for busy hosts),
+        # so check it again right before retrieving each feed.
+        deadline = self.deadline
+        if deadline is None:
+            return map
+
+        skipped = object()
+
+        def is_past_deadline(arg: Any) -> bool:
+            if self.reader._now() < deadline:
+                return False
+            log.debug("update feed %r: reached deadline, not retrieving", arg.url)
+            return True
+
+        def wrapper(fn: Callable[[Any], Any], iterable: Iterable[Any]) -> Any:
+            def wrapped_fn(arg: Any) -> Any:
+                if is_past_deadline(arg):
+                    return skipped
+                return fn(arg)
+
+            for rv in map(wrapped_fn, iterable):
+                if rv is not skipped:
+                    yield rv
+
+        return wrapper
+
+    def run_in_thread(self, iterable: Iterable[_T], name: str) -> Iterable[_T]:
+        # each thread gets its own connection, close it when done
+        return iter_in_thread(iterable, self.queue_size, name, self.reader.close)
+
+    def make_pending(
         self,
         config: UpdateConfig,
-        feed: FeedForUpdate,
-        result: ParsedFeed | None | ParseError,
+        # Any instead of FeedForUpdate because parser.parallel() is generic
+        feed: Any,
+        result: ParsedFeed | NotModified | None | ParseError,
+    ) -> PendingUpdate:
+        try:
+            try:
+                intents, total = self.make_intents(config, feed, result)
+            except ParseError as e:
+                # the entries are parsed as they are consumed, so parsing
+                # can fail here too; nothing was written yet, so treat it
+                # like any other parse error (and discard the entries)
+                log.debug("parse exception, traceback follows", exc_info=True)
+                result = e
+                intents, total = self.make_intents(config, feed, result)
+        except Exception as e:
+            return PendingUpdate(feed.url, result, e)
+        return PendingUpdate(feed.url, result, intents, total)
+
+    def write_pending(
+        self, pending: PendingUpdate
     ) -> tuple[str, UpdatedFeed | None | Exception]:
-        # TODO: don't duplicate code from update()
-        # TODO: the feed tag value should come from get_feeds_for_update()
-        config_key = self.reader.make_reader_reserved_name(CONFIG_KEY)
-        config = flatten_config(self.reader.get_tag(feed, config_key, {}), config)
+        url, result, value, total = pending
+        if isinstance(value, Exception):
+            return url, value
+
+        try:
+            counts = self.update_feed(*value)
+        except Exception as e:
+            return url, e
+
+        return url, make_updated_feed(url, result, counts, total)
+
+    def write_pending_batched(
+        self, pending: Iterable[PendingUpdate]
+    ) -> Iterable[tuple[str, UpdatedFeed | None | Exception]]:
+        # Like write_pending(), but write the changes of many feeds
+        # in a single transaction; the hooks for each feed still run in order
+        # (before_feed_update, write, after_entry_update, after_feed_update),
+        # but the before_feed_update hooks of all the feeds in a batch
+        # run before the after_* hooks of any of them.
+
+        batch: list[PendingUpdate] = []
+        batch_started = 0.0
+
+        for update in pending:
+            if not batch:
+                batch_started = time.monotonic()
+
+            batch.append(update)
+
+            if len(batch) >= self.batch_size or (
+                self.batch_interval is not None
+                and time.monotonic() - batch_started >= self.batch_interval
+            ):
+                yield from self.update_feeds(batch)
+                batch = []
+
+        if batch:
+            yield from self.update_feeds(batch)
+
+    def make_intents(
+        self,
+        config: UpdateConfig,
+        feed: FeedForUpdate,
+        result: ParsedFeed | NotModified | None | ParseError,
+    ) -> tuple[tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]], int]:
+        # the feed config comes from get_feeds_for_update()
+        if feed.config is not None:
+            config = flatten_config(feed.config, config)
 
         make_intents = partial(
             self.decider.make_intents,
@@ -442,56 +864,143 @@ class Pipeline:
             result,
         )
 
-        try:
-            # assemble pipeline
-            if result and not isinstance(result, Exception):
-                entry_pairs = self.get_entry_pairs(result)
-                entry_pairs = self.reader._parser.process_entry_pairs(
-                    feed.url, result.mime_type, entry_pairs
-                )
-                entry_pairs, get_total_count = count_consumed(entry_pairs)
-            else:
-                entry_pairs = ()
-                get_total_count = lambda: 0  # noqa: E731
-
-            intents = make_intents(entry_pairs)
-            counts = self.update_feed(*intents)
-            total = get_total_count()
-
-        except Exception as e:
-            return feed.url, e
+        get_total_count: Callable[[], int] = lambda: 0  # noqa: E731
+
+        # assemble pipeline (called by the decider only for ParsedFeed results)
+        def get_entry_pairs(early_stop: int) -> EntryPairs:
+            nonlocal get_total_count
+            assert isinstance(result, ParsedFeed), result
+            entries = result.entries
+            if 'max_entries' in config:
+                entries = islice(entries, config['max_entries'])
+            # if the decider may stop early, look up entries in batches
+            # of the same size, so we don't parse many entries past that point
+            entry_pairs = self.get_entry_pairs(entries, early_stop)
+            entry_pairs = self.reader._parser.process_entry_pairs(
+                feed.url, result.mime_type, entry_pairs
+            )
+            entry_pairs, get_total_count = count_consumed(entry_pairs)
+            return entry_pairs
 
-        if not result or isinstance(result, Exception):
-            return feed.url, result
+        intents = make_intents(get_entry_pairs)
+        return intents, get_total_count()
 
-        return feed.url, UpdatedFeed(feed.url, *counts, total - sum(counts))
+    def get_entry_pairs(
+        self, entries: Iterable[EntryData], batch_size: int = 0
+    ) -> EntryPairs:
+        if batch_size:
+            return self.get_entry_pairs_batched(entries, batch_size)
 
-    def get_entry_pairs(self, result: ParsedFeed) -> EntryPairs:
         # give storage a chance to consume entries in a streaming fashion
-        entries1, entries2 = tee(result.entries)
+        entries1, entries2 = tee(entries)
         entries_for_update = self.reader._storage.get_entries_for_update(
             (e.feed_url, e.id) for e in entries1
         )
         return zip(entries2, entries_for_update, strict=True)
 
+    def get_entry_pairs_batched(
+        self, entries: Iterable[EntryData], batch_size: int
+    ) -> EntryPairs:
+        # Look entries up a few at a time, so that if the decider stops early,
+        # we don't parse / look up many entries past that point
+        # (storage consumes them in much larger chunks).
+        for chunk in chunks(batch_size, entries):
+            batch = list(chunk)
+            entries_for_update = self.reader._storage.get_entries_for_update(
+                (e.feed_url, e.id) for e in batch
+            )
+            yield from zip(batch, entries_for_update, strict=True)
+
     def update_feed(
         self,
         feed: FeedUpdateIntent,
         entries: Iterable[EntryUpdateIntent],
     ) -> tuple[int, int]:
-        url = feed.url
-        hooks = self.reader._update_hooks
-
-        hooks.run('before_feed_update', (url,), url)
+        self.before_feed_update(feed.url)
 
         if entries:
             self.reader._storage.add_or_update_entries(entries)
         self.reader._storage.update_feed(feed)
 
-        # if feed_for_update.url != parsed_feed.feed.url, the feed was redirected.
-        # TODO: Maybe handle redirects somehow else (e.g. change URL if permanent).
+        counts = self.after_feed_update(feed.url, entries)
+        self.change_feed_url(feed)
+        return counts
+
+    def update_feeds(
+        self, batch: list[PendingUpdate]
+    ) -> Iterable[tuple[str, UpdatedFeed | None | Exception]]:
+        for i, pending in enumerate(batch):
+            if isinstance(pending.value, Exception):
+                continue
+            try:
+                self.before_feed_update(pending.url)
+            except Exception as e:
+                batch[i] = pending._replace(value=e)
+
+        to_write = [
+            (i, pending.value)
+            for i, pending in enumerate(batch)
+            if not isinstance(pending.value, Exception)
+        ]
+
+        errors: list[Exception | None] = []
+        if to_write:
+            try:
+                errors.extend(
+                    self.reader._storage.update_feeds_and_entries(
+                        intents for _, intents in to_write
+                    )
+                )
+            except Exception as e:
+                errors = [e] * len(to_write)
+
+        for (i, _), error in zip(to_write, errors, strict=True):
+            if error:
+                batch[i] = batch[i]._replace(value=error)
+
+        for url, result, value, total in batch:
+            if isinstance(value, Exception):
+                yield url, value
+                continue
+
+            feed, entries = value
+            try:
+                counts = self.after_feed_update(url, entries)
+                self.change_feed_url(feed)
+            except Exception as e:
+                yield url, e
+                continue
+
+            yield url, make_updated_feed(url, result, counts, total)
 
-        hook_errors = hooks.group("got unexpected after-update hook errors")
+    def change_feed_url(self, feed: FeedUpdateIntent) -> None:
+        if not feed.new_url:
+            return
+        try:
+            self.reader.change_feed_url(feed.url, feed.new_url)
+        except (FeedExistsError, InvalidFeedURLError) as e:
+            log.warning(
+                "update feed %r: could not change URL to %r: %s",
+                feed.url,
+                feed.new_url,
+                e,
+            )
+            return
+        log.info(
+            "update feed %r: permanently redirected, changed URL to %r",
+            feed.url,
+            feed.new_url,
+        )
+
+    def before_feed_update(self, url: str) -> None:
+        self.reader._update_hooks.run('before_feed_update', (url,), url)
+
+    def after_feed_update(
+        self, url: str, entries: Iterable[EntryUpdateIntent]
+    ) -> tuple[int, int]:
+        hook_errors = self.reader._update_hooks.group(
+            "got unexpected after-update hook errors"
+        )
 
         new_count = 0
         updated_count = 0
@@ -515,3 +1024,25 @@ class Pipeline:
         hook_errors.close()
 
         return new_count, updated_count
+
+
+class PendingUpdate(NamedTuple):
+    """The intents of a feed waiting to be written by the Pipeline."""
+
+    url: str
+    result: ParsedFeed | NotModified | None | ParseError
+    value: tuple[FeedUpdateIntent, Iterable[EntryUpdateIntent]] | Exception
+    total: int = 0
+
+
+def make_updated_feed(
+    url: str,
+    result: ParsedFeed | NotModified | None | ParseError,
+    counts: tuple[int, int],
+    total: int,
+) -> UpdatedFeed | None | ParseError:
+    if not result:
+        return None
+    if isinstance(result, Exception):
+        return result
+    return UpdatedFeed(url, *counts, total - sum(counts))
@@ -6,7 +6,10 @@ import itertools
 import logging
 import pkgutil
 import warnings
+from collections import Counter
+from collections import deque
 from collections.abc import Callable
+from collections.abc import Hashable
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
@@ -15,9 +18,14 @@ from contextlib import contextmanager
 from functools import wraps
 from typing import Any
 from typing import cast
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+
+
 FuncType = Callable[..., Any]
 F = TypeVar('F', bound=FuncType)
 
@@ -77,8 +85,9 @@ def count_consumed(it: Iterable[_T]) -> tuple[Iterable[_T], Callable[[], int]]:
     def wrapper() -> Iterable[_T]:
         nonlocal consumed
         for e in it:
-            yield e
+            # count before yielding, in case the consumer stops early
             consumed += 1
+            yield e
 
     def get_count() -> int:
         return consumed
@@ -91,15 +100,47 @@ MapContextManager = AbstractContextManager[MapFunction[_T, _U]]
 
 
 @contextmanager
-def make_pool_map(workers: int) -> Iterator[MapFunction[_T, _U]]:
+def make_pool_map(
+    workers: int,
+    key: Callable[[Any], Hashable] | None = None,
+    max_per_key: int = 0,
+) -> Iterator[MapFunction[Any, Any]]:
     # We are using concurrent.futures instead of multiprocessing.dummy
     # because the latter doesn't work on some environments (e.g. AWS Lambda).
-    # We are not using executor.map() because it consumes the entire iterable.
 
     # lazy import (https://github.com/lemon24/reader/issues/297)
     import concurrent.futures
 
-    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        if key and max_per_key:
+            yield make_executor_map_by_key(executor, workers, key, max_per_key)
+        else:
+            yield make_executor_map(executor, workers)
+
+
+@contextmanager
+def make_process_pool_map(workers: int) -> Iterator[MapFunction[Any, Any]]:
+    # The function and its arguments / results must be picklable.
+    #
+    # We use "spawn" regardless of platform, because forking a process
+    # that already has threads running (e.g. the make_pool_map() workers)
+    # may result in deadlocks.
+
+    # lazy import (https://github.com/lemon24/reader/issues/297)
+    import concurrent.futures
+    import multiprocessing
+
+    mp_context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context) as executor:
+        yield make_executor_map(executor, workers)
+
+
+def make_executor_map(
+    executor: concurrent.futures.Executor, workers: int
+) -> MapFunction[_T, _U]:
+    # We are not using executor.map() because it consumes the entire iterable.
+
+    import concurrent.futures
 
     def imap_unordered(fn: Callable[[_T], _U], iterable: Iterable[_T]) -> Iterator[_U]:
         iterable = iter(iterable)
@@ -124,8 +165,141 @@ def make_pool_map(workers: int) -> Iterator[MapFunction[_T, _U]]:
             while done:
                 yield done.pop().result()
 
-    with executor:
-        yield imap_unordered
+    return imap_unordered
+
+
+def make_executor_map_by_key(
+    executor: concurrent.futures.Executor,
+    workers: int,
+    key: Callable[[Any], Hashable],
+    max_per_key: int,
+) -> MapFunction[_T, _U]:
+    # Like make_executor_map(), but interleaves the arguments by key,
+    # and runs at most max_per_key tasks with the same key at the same time;
+    # the other workers are kept busy with tasks for other keys.
+    # Arguments with a None key are not limited.
+    #
+    # The iterable is consumed only as far as needed to find
+    # an argument that can run; the ones that can't are queued.
+
+    import concurrent.futures
+
+    def imap_unordered(fn: Callable[[_T], _U], iterable: Iterable[_T]) -> Iterator[_U]:
+        iterator = iter(iterable)
+
+        # dicts remember insertion order; moving a key to the end
+        # after taking an argument from it makes this a round-robin
+        queues: dict[Hashable, deque[_T]] = {}
+        running: Counter[Hashable] = Counter()
+        pending: dict[concurrent.futures.Future[_U], Hashable] = {}
+        no_key = object()
+
+        def can_run(arg_key: Hashable) -> bool:
+            return arg_key is None or running[arg_key] < max_per_key
+
+        def submit(arg_key: Hashable, arg: _T) -> None:
+            pending[executor.submit(fn, arg)] = arg_key
+            running[arg_key] += 1
+
+        def submit_next() -> bool:
+            # find the key first, queues can't change while iterating
+            arg_key = next(filter(can_run, queues), no_key)
+            if arg_key is not no_key:
+                queue = queues.pop(arg_key)
+                submit(arg_key, queue.popleft())
+                if queue:
+                    queues[arg_key] = queue
+                return True
+
+            for arg in iterator:
+                arg_key = key(arg)
+                if can_run(arg_key):
+                    submit(arg_key, arg)
+                    return True
+                queues.setdefault(arg_key, deque()).append(arg)
+
+            return False
+
+        while True:
+            while len(pending) < workers and submit_next():
+                pass
+
+            if not pending:
+                return
+
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                running[pending.pop(future)] -= 1
+                yield future.result()
+
+    return imap_unordered
+
+
+def iter_in_thread(
+    iterable: Iterable[_T],
+    queue_size: int,
+    name: str | None = None,
+    finalize: Callable[[], None] | None = None,
+) -> Iterator[_T]:
+    # Consume iterable in a new thread, passing the values to the caller
+    # through a queue of up to queue_size values (for backpressure).
+    # Exceptions are re-raised in the calling thread.
+    # If the caller stops early (the generator is closed),
+    # the iterable is closed after the current value.
+    # finalize() is called in the new thread, before it ends.
+
+    # lazy import (https://github.com/lemon24/reader/issues/297)
+    import queue
+    import threading
+
+    values: queue.Queue[tuple[bool, Any]] = queue.Queue(queue_size)
+    stop = threading.Event()
+    done = object()
+
+    def target() -> None:
+        try:
+            try:
+                for value in iterable:
+                    values.put((True, value))
+                    if stop.is_set():
+                        break
+            finally:
+                if close := getattr(iterable, 'close', None):
+                    close()
+            values.put((True, done))
+        except Exception as e:
+            values.put((False, e))
+        except BaseException as e:
+            # the caller must not wait forever, but don't swallow it either
+            values.put((False, e))
+            raise
+        finally:
+            if finalize:
+                finalize()
+
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            ok, value = values.get()
+            if not ok:
+                raise value
+            if value is done:
+                break
+            yield value
+
+    finally:
+        stop.set()
+        # unblock the thread if it is waiting for space in the queue
+        while thread.is_alive():
+            try:
+                values.get(timeout=0.01)
+            except queue.Empty:
+                pass
+        thread.join()
 
 
 class PrefixLogger(logging.LoggerAdapter):  # type: ignore
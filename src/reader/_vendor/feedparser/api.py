@@ -30,7 +30,7 @@ import io
 import urllib.error
 import urllib.parse
 import xml.sax
-from typing import IO, Dict, Optional, Union
+from typing import IO, Callable, Dict, Iterable, Optional, Union
 
 from . import http
 from .encodings import MissingEncoding, convert_file_to_utf8
@@ -155,6 +155,8 @@ def parse(
     resolve_relative_uris: Optional[bool] = None,
     sanitize_html: Optional[bool] = None,
     optimistic_encoding_detection: Optional[bool] = None,
+    html_sanitizer: Optional[Callable[[str, str, str], str]] = None,
+    ignored_namespaces: Iterable[str] = (),
 ) -> FeedParserDict:
     """Parse a feed from a URL, file, stream, or string.
 
@@ -189,6 +191,14 @@ def parse(
         (uses less memory, but the wrong encoding may be detected in rare cases).
         Defaults to the value of
         :data:`feedparser.OPTIMISTIC_ENCODING_DETECTION`, which is ``True``.
+    :param html_sanitizer:
+        (reader) If both ``resolve_relative_uris`` and ``sanitize_html``
+        are true, use this instead, as ``html_sanitizer(html, base_uri,
+        content_type)``, to resolve relative URIs and sanitize HTML content.
+    :param ignored_namespaces:
+        (reader) Skip elements whose namespace prefix (as in
+        :attr:`XMLParserMixin.namespaces`, e.g. ``georss``) is in this
+        collection, along with their content and descendants.
 
     """
 
@@ -231,6 +241,8 @@ def parse(
             resolve_relative_uris=resolve_relative_uris,
             sanitize_html=sanitize_html,
             optimistic_encoding_detection=optimistic_encoding_detection,
+            html_sanitizer=html_sanitizer,
+            ignored_namespaces=ignored_namespaces,
         )
     finally:
         if not hasattr(url_file_stream_or_string, "read"):
@@ -247,6 +259,8 @@ def _parse_file_inplace(
     resolve_relative_uris: Optional[bool] = None,
     sanitize_html: Optional[bool] = None,
     optimistic_encoding_detection: Optional[bool] = None,
+    html_sanitizer: Optional[Callable[[str, str, str], str]] = None,
+    ignored_namespaces: Iterable[str] = (),
 ) -> None:
     # Avoid a cyclic import.
     from .. import feedparser
@@ -257,6 +271,8 @@ def _parse_file_inplace(
         resolve_relative_uris = bool(feedparser.RESOLVE_RELATIVE_URIS)
     if optimistic_encoding_detection is None:
         optimistic_encoding_detection = bool(feedparser.OPTIMISTIC_ENCODING_DETECTION)
+    # the strict parser lowercases prefixes, the loose one does not
+    ignored_namespaces = frozenset(prefix.lower() for prefix in ignored_namespaces)
 
     stream_factory = convert_file_to_utf8(
         result["headers"], file, result, optimistic_encoding_detection
@@ -306,6 +322,8 @@ def _parse_file_inplace(
         feed_parser = StrictFeedParser(baseuri, baselang, "utf-8")
         feed_parser.resolve_relative_uris = resolve_relative_uris
         feed_parser.sanitize_html = sanitize_html
+        feed_parser.html_sanitizer = html_sanitizer
+        feed_parser.ignored_namespaces = ignored_namespaces
         saxparser = xml.sax.make_parser(PREFERRED_XML_PARSERS)
         saxparser.setFeature(xml.sax.handler.feature_namespaces, 1)
         try:
@@ -337,6 +355,8 @@ def _parse_file_inplace(
         feed_parser = LooseFeedParser(baseuri, baselang, "utf-8", entities)
         feed_parser.resolve_relative_uris = resolve_relative_uris
         feed_parser.sanitize_html = sanitize_html
+        feed_parser.html_sanitizer = html_sanitizer
+        feed_parser.ignored_namespaces = ignored_namespaces
 
         # If an encoding was detected, use it; otherwise, assume utf-8 and do your best.
         # Will raise io.UnsupportedOperation if the underlying file is not seekable.
@@ -25,8 +25,9 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import functools
 from time import struct_time
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from .asctime import _parse_date_asctime
 from .greek import _parse_date_greek
@@ -37,19 +38,53 @@ from .perforce import _parse_date_perforce
 from .rfc822 import _parse_date_rfc822
 from .w3dtf import _parse_date_w3dtf
 
-_date_handlers: List[Callable[[str], Optional[struct_time]]] = []
+DateHandler = Callable[[str], Optional[struct_time]]
+
+_date_handlers: List[DateHandler] = []
+
+# The handlers to try for dates that start with a letter
+# (most of them RFC 822 dates, e.g. "Sun, 06 Sep 2009 16:20:00 +0000");
+# the W3DTF and ISO 8601 handlers never match these, so they are skipped.
+_letter_date_handlers: List[DateHandler] = []
+
+# Handlers whose result depends on the current time or timezone,
+# and thus cannot be cached (only which handler matched is).
+_time_dependent_date_handlers = {_parse_date_iso8601}
+
+# Dates are often repeated (e.g. published and updated, or the same feed
+# parsed again on the next update), so the results are cached.
+_date_cache_size = 4096
 
 
 def registerDateHandler(func):
     """Register a date handler function (takes string, returns 9-tuple date in GMT)"""
     _date_handlers.insert(0, func)
+    _letter_date_handlers.insert(0, func)
+    _parse_date_cached.cache_clear()
 
 
 def _parse_date(date_string):
     """Parses a variety of date formats into a 9-tuple in GMT"""
     if not date_string:
         return None
-    for handler in _date_handlers:
+    handler, date9tuple = _parse_date_cached(date_string)
+    if handler in _time_dependent_date_handlers:
+        return handler(date_string)
+    return date9tuple
+
+
+@functools.lru_cache(maxsize=_date_cache_size)
+def _parse_date_cached(
+    date_string: str,
+) -> Tuple[Optional[DateHandler], Optional[struct_time]]:
+    # Only ISO 8601 times (not dates) can start with a letter ("T10:00").
+    first = date_string[:1]
+    if first.isalpha() and not (first == "T" and date_string[1:2].isdigit()):
+        handlers = _letter_date_handlers
+    else:
+        handlers = _date_handlers
+
+    for handler in handlers:
         try:
             date9tuple = handler(date_string)
         except (KeyError, OverflowError, ValueError, AttributeError):
@@ -58,8 +93,8 @@ def _parse_date(date_string):
             continue
         if len(date9tuple) != 9:
             continue
-        return date9tuple
-    return None
+        return handler, date9tuple
+    return None, None
 
 
 registerDateHandler(_parse_date_onblog)
@@ -71,3 +106,6 @@ registerDateHandler(_parse_date_asctime)
 registerDateHandler(_parse_date_iso8601)
 registerDateHandler(_parse_date_rfc822)
 registerDateHandler(_parse_date_w3dtf)
+
+_letter_date_handlers.remove(_parse_date_iso8601)
+_letter_date_handlers.remove(_parse_date_w3dtf)
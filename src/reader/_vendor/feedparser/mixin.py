@@ -180,6 +180,10 @@ class XMLParserMixin(
         self.namespaces_in_use = {}  # dictionary of namespaces defined by the feed
         self.resolve_relative_uris = False
         self.sanitize_html = False
+        # reader: callable(html, base_uri, content_type) that does both
+        self.html_sanitizer = None
+        # reader: lowercase namespace prefixes of elements to skip
+        self.ignored_namespaces = frozenset()
 
         # the following are used internally to track state;
         # this is really out of control and should be refactored
@@ -204,6 +208,7 @@ class XMLParserMixin(
         self.svgOK = 0
         self.title_depth = -1
         self.depth = 0
+        self.ignoring = 0
         self.hasContent = 0
         if self.lang:
             self.feeddata["language"] = self.lang.replace("_", "-")
@@ -302,6 +307,14 @@ class XMLParserMixin(
         ):
             self.inimage = 0
 
+        # reader: skip ignored elements, their content, and their descendants;
+        # the text goes to a placeholder element that is discarded at the end
+        if self.ignoring or prefix[:-1].lower() in self.ignored_namespaces:
+            if not self.ignoring:
+                self.elementstack.append([prefix + suffix, 0, []])
+            self.ignoring += 1
+            return
+
         # call special handler (if defined) or default handler
         methodname = "_start_" + prefix + suffix
         try:
@@ -333,13 +346,18 @@ class XMLParserMixin(
 
         # call special handler (if defined) or default handler
         methodname = "_end_" + prefix + suffix
-        try:
-            if self.svgOK:
-                raise AttributeError()
-            method = getattr(self, methodname)
-            method()
-        except AttributeError:
-            self.pop(prefix + suffix)
+        if self.ignoring:
+            self.ignoring -= 1
+            if not self.ignoring:
+                self.elementstack.pop()
+        else:
+            try:
+                if self.svgOK:
+                    raise AttributeError()
+                method = getattr(self, methodname)
+                method()
+            except AttributeError:
+                self.pop(prefix + suffix)
 
         # track inline content
         if self.incontent and not self.contentparams.get("type", "xml").endswith("xml"):
@@ -569,6 +587,21 @@ class XMLParserMixin(
             self.map_content_type(self.contentparams.get("type", "text/html"))
             in self.html_types
         )
+        # reader: resolve relative URIs and sanitize in one go, if asked to
+        if (
+            is_htmlish
+            and self.html_sanitizer is not None
+            and self.resolve_relative_uris
+            and self.sanitize_html
+            and element in self.can_contain_relative_uris
+            and element in self.can_contain_dangerous_markup
+            and isinstance(output, str)
+        ):
+            output = self.html_sanitizer(
+                output, self.baseuri, self.contentparams.get("type", "text/html")
+            )
+            is_htmlish = False  # skip the two passes below
+
         # resolve relative URIs within embedded markup
         if is_htmlish and self.resolve_relative_uris:
             if element in self.can_contain_relative_uris:
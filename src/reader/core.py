@@ -6,10 +6,13 @@ import numbers
 import warnings
 from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import MutableSequence
+from contextlib import contextmanager
 from contextlib import nullcontext
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 from types import MappingProxyType
 from typing import Any
@@ -30,11 +33,14 @@ from ._types import EntryFilter
 from ._types import EntryUpdateIntent
 from ._types import FeedFilter
 from ._types import NameScheme
+from ._types import SanitizedHTMLStorageType
 from ._types import SearchType
 from ._types import StorageType
 from ._types import UpdateHooks
+from ._update import get_feed_host
 from ._update import Pipeline
 from ._utils import make_pool_map
+from ._utils import make_process_pool_map
 from ._utils import MapContextManager
 from ._utils import zero_or_one
 from .exceptions import EntryNotFoundError
@@ -100,6 +106,8 @@ def make_reader(
     feed_root: str | None = None,
     plugins: Iterable[PluginInput] = DEFAULT_PLUGINS,
     session_timeout: TimeoutType = DEFAULT_TIMEOUT,
+    session_deadline: float | None = None,
+    session_max_size: int | None = None,
     reserved_name_scheme: Mapping[str, str] = DEFAULT_RESERVED_NAME_SCHEME,
     search_enabled: bool | None | Literal['auto'] = 'auto',
     _storage: StorageType | None = None,
@@ -175,6 +183,21 @@ def make_reader(
             as a float, or a (connect timeout, read timeout) tuple.
             Passed to the underlying `Requests session`_.
 
+        session_deadline (float or None):
+            When retrieving HTTP(S) feeds,
+            the maximum number of seconds to spend retrieving a feed,
+            including connecting, redirects, and reading the body;
+            unlike ``session_timeout``, this also limits
+            servers that send data slowly.
+            Feeds that take longer fail with :exc:`ParseError`.
+            If none (the default), there is no limit.
+
+        session_max_size (int or None):
+            When retrieving HTTP(S) feeds,
+            the maximum size, in bytes, of a (decoded) response body.
+            Larger feeds fail with :exc:`ParseError`.
+            If none (the default), there is no limit.
+
         reserved_name_scheme (dict(str, str)):
             Value for :attr:`~Reader.reserved_name_scheme`.
             The prefixes default to ``.reader.``/``.plugin.``,
@@ -232,6 +255,9 @@ def make_reader(
         Wrap exceptions raised during plugin initialization
         in :exc:`PluginInitError` instead of letting them bubble up.
 
+    .. versionadded:: 3.14
+        The ``session_deadline`` and ``session_max_size`` keyword arguments.
+
     """
 
     # Do as much work as possible before creating the storage.
@@ -239,7 +265,12 @@ def make_reader(
     if search_enabled not in ('auto', True, False, None):
         raise ValueError("search_enabled should be one of ('auto', True, False, None)")
 
-    parser = default_parser(feed_root, session_timeout=session_timeout)
+    parser = default_parser(
+        feed_root,
+        session_timeout=session_timeout,
+        session_deadline=session_deadline,
+        session_max_size=session_max_size,
+    )
     # circular import
     from . import USER_AGENT
 
@@ -376,6 +407,18 @@ class Reader:
         self._enable_search = _enable_search
         self._update_hooks = UpdateHooks(self)
 
+        #: During updates, write the changes for up to this many feeds
+        #: in a single transaction, for at most this many seconds;
+        #: see :class:`~reader._update.Pipeline` for details.
+        self._update_batch_size = 1
+        self._update_batch_interval: float | None = None
+        #: During updates, if greater than 0, parse the feeds
+        #: and write the changes in separate threads,
+        #: with queues of this size between them;
+        #: see :class:`~reader._update.Pipeline` for details.
+        #: Ignored for private databases (they work only in one thread).
+        self._update_queue_size = 0
+
         if _called_directly:
             warnings.warn(
                 "Reader objects should be created using make_reader(); the Reader "
@@ -788,6 +831,10 @@ class Reader:
         new: bool | None = None,
         scheduled: bool = False,
         workers: int = 1,
+        parse_workers: int = 0,
+        workers_per_host: int = 0,
+        max_feeds: int | None = None,
+        deadline: datetime | timedelta | None = None,
     ) -> None:
         r"""Update all or some of the feeds.
 
@@ -818,6 +865,24 @@ class Reader:
             scheduled (bool):
                 Only update feeds scheduled to be updated.
             workers (int): Number of threads to use when getting the feeds.
+            parse_workers (int):
+                Number of processes to use when parsing the feeds.
+                If 0 (the default), parse the feeds in the current thread.
+                If not 0, any custom parsers must be picklable.
+            workers_per_host (int):
+                Maximum number of threads getting feeds
+                from the same host at the same time;
+                feeds from different hosts are interleaved.
+                If 0 (the default), there is no limit.
+                Has no effect if ``workers`` is 1.
+            max_feeds (int or None):
+                Retrieve at most this many feeds.
+            deadline (datetime or timedelta or None):
+                Stop retrieving new feeds after this time
+                (or after this much time has passed);
+                feeds already being retrieved are still updated.
+                Naive datetimes are normalized by passing them to
+                :meth:`~datetime.datetime.astimezone`.
 
         Raises:
             UpdateHookError: For unexpected hook exceptions.
@@ -867,6 +932,13 @@ class Reader:
             ``new`` uses :attr:`~Feed.last_retrieved`
             instead of :attr:`~Feed.last_updated`.
 
+        .. versionadded:: 3.14
+            The ``parse_workers``, ``workers_per_host``,
+            ``max_feeds``, and ``deadline`` keyword arguments.
+
+        .. versionchanged:: 3.14
+            With ``scheduled=True``, update the most overdue feeds first.
+
         """
         hook_errors = self._update_hooks.group("some hooks failed")
         try:
@@ -878,6 +950,10 @@ class Reader:
                 new=new,
                 scheduled=scheduled,
                 workers=workers,
+                parse_workers=parse_workers,
+                workers_per_host=workers_per_host,
+                max_feeds=max_feeds,
+                deadline=deadline,
             )
 
             for url, value in results:
@@ -919,6 +995,10 @@ class Reader:
         new: bool | None = None,
         scheduled: bool = False,
         workers: int = 1,
+        parse_workers: int = 0,
+        workers_per_host: int = 0,
+        max_feeds: int | None = None,
+        deadline: datetime | timedelta | None = None,
         _call_feeds_update_hooks: bool = True,
     ) -> Iterable[UpdateResult]:
         r"""Update all or some of the feeds.
@@ -948,6 +1028,24 @@ class Reader:
             scheduled (bool):
                 Only update feeds scheduled to be updated.
             workers (int): Number of threads to use when getting the feeds.
+            parse_workers (int):
+                Number of processes to use when parsing the feeds.
+                If 0 (the default), parse the feeds in the current thread.
+                If not 0, any custom parsers must be picklable.
+            workers_per_host (int):
+                Maximum number of threads getting feeds
+                from the same host at the same time;
+                feeds from different hosts are interleaved.
+                If 0 (the default), there is no limit.
+                Has no effect if ``workers`` is 1.
+            max_feeds (int or None):
+                Retrieve at most this many feeds.
+            deadline (datetime or timedelta or None):
+                Stop retrieving new feeds after this time
+                (or after this much time has passed);
+                feeds already being retrieved are still updated.
+                Naive datetimes are normalized by passing them to
+                :meth:`~datetime.datetime.astimezone`.
 
         Yields:
             :class:`UpdateResult`:
@@ -1010,6 +1108,13 @@ class Reader:
             ``new`` uses :attr:`~Feed.last_retrieved`
             instead of :attr:`~Feed.last_updated`.
 
+        .. versionadded:: 3.14
+            The ``parse_workers``, ``workers_per_host``,
+            ``max_feeds``, and ``deadline`` keyword arguments.
+
+        .. versionchanged:: 3.14
+            With ``scheduled=True``, update the most overdue feeds first.
+
         """
         now = self._now()
         filter = FeedFilter.from_args(
@@ -1018,16 +1123,51 @@ class Reader:
 
         if workers < 1:
             raise ValueError("workers must be a positive integer")
+        if parse_workers < 0:
+            raise ValueError("parse_workers must be a non-negative integer")
+        if workers_per_host < 0:
+            raise ValueError("workers_per_host must be a non-negative integer")
+        if max_feeds is not None and max_feeds < 0:
+            raise ValueError("max_feeds must be a non-negative integer")
+        if isinstance(deadline, timedelta):
+            deadline = now + deadline
+        elif deadline is not None:
+            deadline = deadline.astimezone(timezone.utc)
 
         make_map: MapContextManager[Any, Any] = (
-            nullcontext(builtins.map) if workers == 1 else make_pool_map(workers)
+            nullcontext(builtins.map)
+            if workers == 1
+            else make_pool_map(workers, get_feed_host, workers_per_host)
+        )
+        make_parse_map: MapContextManager[Any, Any] | nullcontext[None] = (
+            make_process_pool_map(parse_workers) if parse_workers else nullcontext()
         )
 
+        queue_size = self._update_queue_size
+        if queue_size and self._storage_is_private():
+            # private databases can be used only from the creating thread
+            queue_size = 0
+
         if _call_feeds_update_hooks:
             self._update_hooks.run('before_feeds_update', None)
 
-        with make_map as map:
-            yield from Pipeline(self, now, map).update(filter)
+        with (
+            make_map as map,
+            make_parse_map as parse_map,
+            self._persist_sanitize_html_cache(),
+        ):
+            pipeline = Pipeline(
+                self,
+                now,
+                map,
+                parse_map,
+                batch_size=self._update_batch_size,
+                batch_interval=self._update_batch_interval,
+                queue_size=queue_size,
+                max_feeds=max_feeds,
+                deadline=deadline,
+            )
+            yield from pipeline.update(filter)
 
         if _call_feeds_update_hooks:
             hook_errors = self._update_hooks.group(
@@ -1093,6 +1233,29 @@ class Reader:
     def _now() -> datetime:
         return datetime.now(timezone.utc)
 
+    def _storage_is_private(self) -> bool:
+        # only the default storage knows about private databases
+        storage = self._storage
+        return isinstance(storage, Storage) and storage.factory.is_private()
+
+    @contextmanager
+    def _persist_sanitize_html_cache(self) -> Iterator[None]:
+        # private databases go away with the reader, so there's no point
+        cache = getattr(self._parser, 'sanitize_html_cache', None)
+        storage = self._storage
+        if (
+            cache is None
+            or not isinstance(storage, SanitizedHTMLStorageType)
+            or self._storage_is_private()
+        ):
+            yield
+            return
+        cache.store = storage
+        try:
+            yield
+        finally:
+            cache.flush()
+
     def get_entries(
         self,
         *,
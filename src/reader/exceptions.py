@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from collections.abc import Sequence
 from functools import cached_property
 from traceback import format_exception
+from typing import Any
 from typing import TYPE_CHECKING
 
 
@@ -19,9 +20,12 @@ class _FancyExceptionBase(Exception):
 
         [message: ][_str][: CauseType: cause as string]
 
-    The resulting exception pickles successfully;
-    __cause__ still gets lost per https://bugs.python.org/issue29466,
-    but a string representation of it remains stored on the exception.
+    The resulting exception pickles successfully.
+    Since __cause__ gets lost per https://bugs.python.org/issue29466,
+    it is pickled explicitly, with its traceback as a string
+    (like :mod:`concurrent.futures` does for exceptions from other processes);
+    if the cause cannot be pickled, only the traceback string remains.
+    A string representation of the cause also remains stored on the exception.
 
     """
 
@@ -60,13 +64,54 @@ class _FancyExceptionBase(Exception):
     def __reduce__(self) -> object:  # type: ignore
         # "prime" the cached properties before pickling
         str(self)
-        return super().__reduce__()
+        rv = super().__reduce__()
+        if not self.__cause__:
+            return rv
+        return _unpickle_with_cause, (rv, *_pickle_cause(self.__cause__))
 
     def __str__(self) -> str:
         parts = [self.message, self._str, self._cause_name, self._cause_str]
         return ': '.join(filter(None, parts))
 
 
+class _RemoteTraceback(Exception):
+    """The traceback of an exception pickled in another process."""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return f'\n"""\n{self.tb}"""'
+
+
+def _pickle_cause(cause: BaseException) -> tuple[BaseException | None, str]:
+    # lazy import (https://github.com/lemon24/reader/issues/297)
+    import pickle
+
+    tb = ''.join(format_exception(cause))
+    try:
+        # the cause must also unpickle successfully in the other process
+        pickle.loads(pickle.dumps(cause))
+    except Exception:
+        return None, tb
+    return cause, tb
+
+
+def _unpickle_with_cause(
+    reduced: tuple[Any, ...], cause: BaseException | None, tb: str
+) -> BaseException:
+    cls, args, *rest = reduced
+    rv: BaseException = cls(*args)
+    if rest and rest[0]:
+        rv.__setstate__(rest[0])
+    remote_tb = _RemoteTraceback(tb)
+    if cause:
+        cause.__cause__ = remote_tb
+    rv.__cause__ = cause or remote_tb
+    return rv
+
+
 class _ExceptionGroup(Exception):  # pragma: no cover
     """ExceptionGroup shim for Python 3.10.
 
@@ -289,6 +334,10 @@ class ParseError(UpdateError, FeedError, ReaderWarning):
 
     """
 
+    # How long (in seconds) the server asked us to wait before retrying;
+    # set by retrievers, used to schedule the next update. Private (for now).
+    _retry_after: int | None = None
+
 
 class UpdateHookError(UpdateError):
     r"""One or more update hooks (unexpectedly) failed.
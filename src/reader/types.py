@@ -989,6 +989,8 @@ class UpdatedFeed:
     #: The number of unmodified entries
     #: (entries that existed in storage,
     #: but had the same data in the corresponding feed file entry.)
+    #: If the update stopped early (see :attr:`UpdateConfig.early_stop_after`),
+    #: only the entries looked at before stopping are counted.
     #:
     #: .. versionadded:: 3.2
     unmodified: int = 0
@@ -997,6 +999,9 @@ class UpdatedFeed:
     def total(self) -> int:
         """The total number of entries in the retrieved feed.
 
+        If the update stopped early, this is the number of entries
+        looked at (see :attr:`unmodified`).
+
         .. versionadded:: 3.2
 
         """
@@ -1085,7 +1090,15 @@ class UpdateConfig(TypedDict, total=False):
     Invalid values are silently treated as missing.
     The default config is::
 
-        {'interval': 60, 'jitter': 0}
+        {
+            'interval': 60,
+            'jitter': 0,
+            'max_retry_after': 0,
+            'max_failure_interval': 1440,
+            'change_url_after': 0,
+            'early_stop_after': 0,
+            'full_update_every': 10,
+        }
 
     For example, given::
 
@@ -1100,10 +1113,45 @@ class UpdateConfig(TypedDict, total=False):
             # invalid feed value (100 is not between 0.0 and 1.0);
             # no global value; fall back to default value
             'jitter': 0,
+            'max_retry_after': 0,
+            'max_failure_interval': 1440,
+            'change_url_after': 0,
+            'early_stop_after': 0,
+            'full_update_every': 10,
         }
 
+    If :attr:`min_interval` or :attr:`max_interval` are set,
+    the update interval becomes *adaptive*:
+    it starts at :attr:`interval`, and on every update,
+    it is halved if the feed had new or modified entries,
+    and increased by half if the feed did not change,
+    without going outside the [:attr:`min_interval`, :attr:`max_interval`] range.
+    For example, this makes a feed that changes weekly
+    be updated (about) daily instead of hourly::
+
+        >>> reader.set_tag((), '.reader.update', {'max_interval': 60 * 24})
+
+    After two or more consecutive failed updates, the update interval
+    is doubled for every failure, up to :attr:`max_failure_interval`;
+    the first successful update resets it.
+
+    If :attr:`early_stop_after` is set, updates stop looking at
+    the entries of a feed after that many known, unchanged entries in a row
+    (most feeds list entries newest-first, so the rest are likely unchanged);
+    at least every :attr:`full_update_every` updates, all entries are looked at.
+    With the default parsers, the entries after that point are not even parsed,
+    so this makes updating large feeds that rarely change cheaper::
+
+        >>> reader.set_tag('http://example.com/feed', '.reader.update', {'early_stop_after': 5})
+
     .. versionadded:: 3.13
 
+    .. versionchanged:: 3.14
+        Add :attr:`min_interval`, :attr:`max_interval`,
+        :attr:`max_retry_after`, :attr:`max_failure_interval`,
+        :attr:`change_url_after`, :attr:`max_entries`,
+        :attr:`early_stop_after`, and :attr:`full_update_every`.
+
     """
 
     #: Update interval, in minutes.
@@ -1111,3 +1159,59 @@ class UpdateConfig(TypedDict, total=False):
 
     #: Update jitter, as a ratio of :attr:`interval`, between 0.0 and 1.0.
     jitter: float
+
+    #: Minimum adaptive update interval, in minutes.
+    #: Defaults to :attr:`interval`; values greater than it are ignored.
+    #:
+    #: .. versionadded:: 3.14
+    min_interval: int
+
+    #: Maximum adaptive update interval, in minutes.
+    #: Defaults to :attr:`interval`; values less than it are ignored.
+    #:
+    #: .. versionadded:: 3.14
+    max_interval: int
+
+    #: Maximum delay, in minutes, the server can ask for
+    #: before the next update (via the HTTP ``Cache-Control``, ``Expires``,
+    #: or ``Retry-After`` headers); 0 ignores these headers.
+    #: Defaults to 0.
+    #:
+    #: .. versionadded:: 3.14
+    max_retry_after: int
+
+    #: Maximum update interval, in minutes, for feeds whose updates
+    #: keep failing; values less than :attr:`interval` disable the backoff.
+    #: Defaults to one day.
+    #:
+    #: .. versionadded:: 3.14
+    max_failure_interval: int
+
+    #: Change the feed URL (with :meth:`~.Reader.change_feed_url`)
+    #: after this many updates in a row permanently redirected
+    #: (HTTP 301 or 308) to the same URL; 0 disables this.
+    #: Defaults to 0.
+    #:
+    #: .. versionadded:: 3.14
+    change_url_after: int
+
+    #: Maximum number of entries to update, from the start of the feed;
+    #: the rest are ignored (and, if the parser supports it, not even parsed).
+    #: Defaults to no limit.
+    #:
+    #: .. versionadded:: 3.14
+    max_entries: int
+
+    #: Stop looking at the entries of a feed after this many
+    #: known, unchanged entries in a row; 0 disables this.
+    #: Defaults to 0.
+    #:
+    #: .. versionadded:: 3.14
+    early_stop_after: int
+
+    #: If :attr:`early_stop_after` is set, look at all the entries
+    #: at least every this many updates (1 means always).
+    #: Defaults to 10.
+    #:
+    #: .. versionadded:: 3.14
+    full_update_every: int
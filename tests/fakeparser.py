@@ -97,7 +97,7 @@ class Parser:
     class session_factory:
         persistent = staticmethod(nullcontext)
 
-    def retrieve(self, url, http_etag, http_last_modified, is_parallel):
+    def retrieve(self, url, http_etag, http_last_modified):
         if self.should_raise and self.should_raise(url):
             try:
                 # We raise so the exception has a traceback set.
@@ -108,7 +108,7 @@ class Parser:
             return nullcontext(None)
         return nullcontext(RetrieveResult(BytesIO(b'opaque')))
 
-    def parse(self, url, result):
+    def parse(self, url, result, stream=False):
         assert result.resource.read() == b'opaque', result
 
         for feed_number, feed in self.feeds.items():
@@ -115,6 +115,11 @@ class _update_feed_methods:
         for _ in reader.update_feeds_iter(workers=2):
             pass
 
+    def update_feeds_iter_batched(reader, _):
+        reader._update_batch_size = 2
+        for _ in reader.update_feeds_iter():
+            pass
+
     def update_feed(reader, url):
         reader.update_feed(url)
 
@@ -132,6 +137,10 @@ class _update_feeds_iter_methods:
     def update_feeds_iter_workers(reader):
         return reader.update_feeds_iter(workers=2)
 
+    def update_feeds_iter_batched(reader):
+        reader._update_batch_size = 2
+        return reader.update_feeds_iter()
+
     def update_feeds_iter_simulated(reader):
         for feed in reader.get_feeds(updates_enabled=True):
             try:
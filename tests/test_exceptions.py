@@ -1,4 +1,5 @@
 import pickle
+import traceback
 
 import pytest
 
@@ -8,6 +9,7 @@ from reader import SingleUpdateHookError
 from reader import TagError
 from reader import UpdateHookErrorGroup
 from reader.exceptions import _FancyExceptionBase
+from reader.exceptions import _RemoteTraceback
 
 
 def test_fancy_exception_base():
@@ -44,6 +46,37 @@ def test_fancy_exception_base():
     assert str(exc) == 'another message: URL: builtins.Exception: cause'
 
 
+class UnpicklableError(Exception):
+    def __init__(self, required):
+        super().__init__()
+
+
+@pytest.mark.parametrize('cause_cls', [ValueError, UnpicklableError])
+def test_fancy_exception_pickle_cause(cause_cls):
+    try:
+        try:
+            raise cause_cls('cause')
+        except Exception as e:
+            raise _FancyExceptionBase('message') from e
+    except _FancyExceptionBase as e:
+        exc = e
+
+    unpickled = pickle.loads(pickle.dumps(exc))
+    assert str(unpickled) == str(exc)
+
+    # the original traceback is kept as a string, like concurrent.futures does
+    tb = ''.join(traceback.format_exception(unpickled))
+    assert "raise cause_cls('cause')" in tb
+
+    cause = unpickled.__cause__
+    if cause_cls is UnpicklableError:
+        assert isinstance(cause, _RemoteTraceback)
+    else:
+        assert type(cause) is cause_cls
+        assert str(cause) == 'cause'
+        assert isinstance(cause.__cause__, _RemoteTraceback)
+
+
 def _all_classes(cls):
     yield cls
     for subclass in cls.__subclasses__():
@@ -1,6 +1,10 @@
+import contextlib
 import io
 import json
 import logging
+import os
+import threading
+import traceback
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
@@ -12,11 +16,16 @@ from reader._parser import default_parser
 from reader._parser import FeedArgumentTuple
 from reader._parser import Parser
 from reader._parser import RetrieveResult
+from reader._parser._http_utils import parse_retry_after
+from reader._parser.etree import ElementTreeParser
 from reader._parser.feedparser import FeedparserParser
 from reader._parser.file import FileRetriever
 from reader._parser.jsonfeed import JSONFeedParser
 from reader._parser.requests import SessionWrapper
 from reader._types import FeedData
+from reader._types import NotModified
+from reader._types import ParsedFeed
+from reader._utils import make_process_pool_map
 from reader._vendor import feedparser
 from reader.exceptions import ParseError
 from utils import make_url_base
@@ -28,6 +37,17 @@ def parse(request):
     yield parse
 
 
+@pytest.fixture
+def no_etree(monkeypatch):
+    """Make the default parser always use feedparser,
+    for tests that look at how feedparser gets called.
+
+    """
+    monkeypatch.setattr(
+        ElementTreeParser, '__call__', lambda self, *args: self.fallback(*args)
+    )
+
+
 def str_bytes_parser(parse):
     def wrapper(url, file, headers=None):
         if isinstance(file, str):
@@ -173,7 +193,7 @@ def test_parse(monkeypatch, feed_type, data_file, parse, make_url, data_dir):
     expected = {'url_base': url_base, 'rel_base': rel_base}
     exec(data_dir.joinpath(feed_filename + '.py').read_text(), expected)
 
-    feed, entries, _, _, mime_type = parse(feed_url)
+    feed, entries, _, _, mime_type, *_ = parse(feed_url)
     entries = list(entries)
 
     assert feed == expected['feed']
@@ -193,7 +213,7 @@ def test_no_mime_type(monkeypatch, parse, make_url, data_dir):
 
     parse.mount_parser_by_url(feed_url, custom_parser)
 
-    feed, entries, _, _, mime_type = parse(feed_url)
+    feed, entries, _, _, mime_type, *_ = parse(feed_url)
 
     with open(str(feed_path), encoding='utf-8') as f:
         expected_feed = FeedData(url=feed_url, title=f.read())
@@ -202,7 +222,7 @@ def test_no_mime_type(monkeypatch, parse, make_url, data_dir):
     assert entries == []
 
 
-def test_feedparser_exceptions(monkeypatch, parse, data_dir):
+def test_feedparser_exceptions(monkeypatch, parse, data_dir, no_etree):
     """parse() should reraise most feedparser exceptions."""
 
     feedparser_exception = Exception("whatever")
@@ -229,7 +249,7 @@ def test_feedparser_exceptions(monkeypatch, parse, data_dir):
     'exc_cls', [feedparser.CharacterEncodingOverride, feedparser.NonXMLContentType]
 )
 def test_parse_survivable_feedparser_exceptions(
-    monkeypatch, caplog, parse, data_dir, exc_cls
+    monkeypatch, caplog, parse, data_dir, exc_cls, no_etree
 ):
     """parse() should not reraise some acceptable feedparser exceptions."""
 
@@ -355,20 +375,22 @@ def test_parse_returns_etag_last_modified(
     make_http_etag_last_modified_url.last_modified = 'last_modified'
 
     feed_url = make_http_etag_last_modified_url(data_dir.joinpath('full.' + feed_type))
-    _, _, etag, last_modified, _ = parse(feed_url)
+    _, _, etag, last_modified, *_ = parse(feed_url)
 
     assert etag == 'etag'
     assert last_modified == 'last_modified'
 
     feed_url = make_http_url(data_dir.joinpath('full.atom'))
-    _, _, etag, last_modified, _ = parse(feed_url)
+    _, _, etag, last_modified, *_ = parse(feed_url)
 
     assert etag == last_modified == None
 
+    # files get an etag made from their stat() result
     feed_url = make_relative_path_url(data_dir.joinpath('full.' + feed_type))
-    _, _, etag, last_modified, _ = parse(feed_url)
+    _, _, etag, last_modified, *_ = parse(feed_url)
 
-    assert etag == last_modified == None
+    assert etag.startswith('"file-')
+    assert last_modified == None
 
 
 @pytest.mark.parametrize('tz', ['UTC', 'Europe/Helsinki'])
@@ -384,7 +406,7 @@ def test_parse_local_timezone(monkeypatch_tz, request, parse, tz, data_dir):
     exec(feed_path.with_suffix('.atom.py').read_text(), expected)
 
     monkeypatch_tz(tz)
-    feed, _, _, _, _ = parse(str(feed_path))
+    feed, *_ = parse(str(feed_path))
     assert feed.updated == expected['feed'].updated
 
 
@@ -415,7 +437,7 @@ def test_parse_response_plugins(monkeypatch, make_http_url, data_dir):
     parse.session_factory.response_hooks.append(do_nothing_plugin)
     parse.session_factory.response_hooks.append(rewrite_to_empty_plugin)
 
-    feed, _, _, _, _ = parse(feed_url)
+    feed, *_ = parse(feed_url)
     assert req_plugin.called
     assert do_nothing_plugin.called
     assert rewrite_to_empty_plugin.called
@@ -475,8 +497,57 @@ def test_parallel_persistent_session(parse, make_http_url, data_dir):
     assert sessions[0] is sessions[1]
 
 
+def _parse_map_builtin():
+    return contextlib.nullcontext(map)
+
+
+def _parse_map_process_pool():
+    return make_process_pool_map(2)
+
+
+@pytest.mark.parametrize(
+    'make_parse_map',
+    [
+        _parse_map_builtin,
+        pytest.param(_parse_map_process_pool, marks=pytest.mark.slow),
+    ],
+)
+def test_parallel_parse_map(parse, data_dir, make_parse_map):
+    feeds = [
+        FeedArgumentTuple(str(data_dir.joinpath(name)))
+        for name in ('full.atom', 'full.rss', 'nonexistent.rss')
+    ]
+    expected = {feed.url: parse(feed.url) for feed in feeds[:2]}
+
+    with make_parse_map() as parse_map:
+        rv = dict(parse.parallel(feeds, parse_map=parse_map))
+
+    assert {k: v for k, v in rv.items() if k != feeds[2]} == {
+        feed: expected[feed.url] for feed in feeds[:2]
+    }
+    assert isinstance(rv[feeds[2]], ParseError)
+    assert rv[feeds[2]].url == feeds[2].url
+
+
+@pytest.mark.slow
+def test_parallel_parse_map_error_cause(tmp_path):
+    tmp_path.joinpath('feed.json').write_text('{')
+    parse = default_parser(str(tmp_path))
+    feeds = [FeedArgumentTuple('feed.json')]
+
+    with make_process_pool_map(1) as parse_map:
+        ((_, rv),) = parse.parallel(feeds, parse_map=parse_map)
+
+    assert isinstance(rv, ParseError)
+    assert isinstance(rv.__cause__, json.JSONDecodeError)
+    # the traceback from the worker process is kept as well
+    assert 'json.loads' in ''.join(traceback.format_exception(rv))
+
+
 @pytest.mark.parametrize('exc_cls', [Exception, OSError])
-def test_feedparser_parse_call(monkeypatch, parse, make_url, data_dir, exc_cls):
+def test_feedparser_parse_call(
+    monkeypatch, parse, make_url, data_dir, exc_cls, no_etree
+):
     """feedparser.parse must always be called with True
     resolve_relative_uris and sanitize_html.
 
@@ -504,6 +575,169 @@ def test_feedparser_parse_call(monkeypatch, parse, make_url, data_dir, exc_cls):
     assert feedparser_parse.kwargs['sanitize_html'] == True
 
 
+DATES = [
+    'Sun, 06 Sep 2009 16:20:00 +0000',
+    'Thu, 01 Jan 2004 19:48:21 GMT',
+    '01 Jan 2004 19:48:21 GMT',
+    'Sun Jan  4 16:29:06 PST 2004',
+    'Τετ, 21 Ιαν 2004 14:56:36 EET',
+    '2003-12-13T18:30:02Z',
+    '2004-02-28T18:14:55-08:00',
+    '2004-07-08 23:56:58 -00:00',
+    '2004-05-25 오후 11:23:17',
+    '2009-09-06',
+    '20040105T10:00',
+    'T10:00',
+    '--01-05',
+    'Tuesday',
+    'garbage',
+    '',
+]
+
+
+@pytest.mark.parametrize('date_string', DATES)
+def test_feedparser_parse_date(date_string):
+    """The date shape dispatch and cache don't change the result
+    of trying all the date handlers in order.
+
+    """
+    from reader._vendor.feedparser import datetimes
+
+    def parse_date_sequential(date_string):
+        for handler in datetimes._date_handlers:
+            try:
+                date9tuple = handler(date_string)
+            except (KeyError, OverflowError, ValueError, AttributeError):
+                continue
+            if date9tuple and len(date9tuple) == 9:
+                return date9tuple
+        return None
+
+    expected = parse_date_sequential(date_string) if date_string else None
+    assert datetimes._parse_date(date_string) == expected
+    # cached
+    assert datetimes._parse_date(date_string) == expected
+
+
+def test_feedparser_register_date_handler(monkeypatch):
+    from reader._vendor.feedparser import datetimes
+
+    for name in '_date_handlers', '_letter_date_handlers':
+        monkeypatch.setattr(datetimes, name, list(getattr(datetimes, name)))
+
+    date_string = 'Sun, 06 Sep 2009 16:20:00 +0000'
+    datetimes._parse_date(date_string)
+    datetimes.registerDateHandler(lambda _: tuple(range(9)))
+    try:
+        assert datetimes._parse_date(date_string) == tuple(range(9))
+        assert datetimes._parse_date('2009-09-06') == tuple(range(9))
+    finally:
+        datetimes._parse_date_cached.cache_clear()
+
+
+IGNORED_NAMESPACES_RSS = """\
+<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"
+    xmlns:admin="http://webns.net/mvcb/"
+    xmlns:cc="http://web.resource.org/cc/"
+    xmlns:creativeCommons="http://backend.userland.com/creativeCommonsRssModule"
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:feedburner="http://rssnamespace.org/feedburner/ext/1.0"
+    xmlns:georss="http://www.georss.org/georss"
+    xmlns:gml="http://www.opengis.net/gml"
+    xmlns:itunes="http://www.itunes.com/DTDs/PodCast-1.0.dtd"
+    xmlns:media="http://search.yahoo.com/mrss/"
+    xmlns:psc="http://podlove.org/simple-chapters"
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns:slash="http://purl.org/rss/1.0/modules/slash/"
+    xmlns:thr="http://purl.org/rss/1.0/modules/threading/"
+    xmlns:wfw="http://wellformedweb.org/commentAPI/">
+<channel>
+    <title>Title</title>
+    <admin:generatorAgent rdf:resource="http://example.com/generator"/>
+    <creativeCommons:license>http://example.com/license</creativeCommons:license>
+    <itunes:author>Feed Author</itunes:author>
+    <item>
+        <link>http://example.com/1</link>
+        <dc:creator>Author<georss:point>1 2</georss:point></dc:creator>
+        <media:description>Summary<slash:comments>3</slash:comments></media:description>
+        <georss:where>
+            <gml:Point><gml:pos>45.256 -71.92</gml:pos></gml:Point>
+        </georss:where>
+        <psc:chapters version="1.2">
+            <psc:chapter start="00:00:00" title="Chapter"/>
+        </psc:chapters>
+        <cc:license rdf:resource="http://example.com/license"/>
+        <wfw:commentRss>http://example.com/1/comments</wfw:commentRss>
+        <thr:total>3</thr:total>
+        <feedburner:origLink>http://example.com/orig/1</feedburner:origLink>
+        <enclosure url="http://example.com/1.mp3" type="audio/mpeg" length="1"/>
+    </item>
+    <item>
+        <guid>2</guid>
+        <itunes:summary>Summary<thr:total>3</thr:total> two</itunes:summary>
+        <media:title>Title<georss:point>1 2</georss:point> two</media:title>
+        <georss:point>45.256 -71.92</georss:point>
+    </item>
+</channel>
+</rss>
+"""
+
+
+@pytest.mark.parametrize('loose', [False, True])
+def test_feedparser_ignored_namespaces(loose):
+    """Skipping the elements in IGNORED_NAMESPACES
+    does not change the FeedData / EntryData we get.
+
+    """
+    data = IGNORED_NAMESPACES_RSS.encode('utf-8')
+    # feedparser uses the loose parser for non-XML content types
+    headers = {'content-type': 'text/plain' if loose else 'application/rss+xml'}
+
+    def parse(parser):
+        feed, entries = parser('url', io.BytesIO(data), headers)
+        return feed, list(entries)
+
+    feed, entries = parse(FeedparserParser())
+    assert (feed, entries) == parse(FeedparserParser(ignored_namespaces=()))
+    assert feed.author == 'Feed Author'
+    assert [(e.id, e.title, e.author, e.summary) for e in entries] == [
+        ('http://example.com/1', None, 'Author', 'Summary3'),
+        ('2', 'Title1 2 two', None, 'Summary3 two'),
+    ]
+    assert entries[0].enclosures
+
+    def parse_feedparser(ignored_namespaces):
+        return feedparser.parse(
+            io.BytesIO(data),
+            response_headers=headers,
+            ignored_namespaces=ignored_namespaces,
+        )
+
+    def get_keys(result):
+        keys = set(result.feed)
+        for entry in result.entries:
+            keys.update(entry)
+            keys.update(link['rel'] for link in entry.get('links', ()))
+        return keys
+
+    ignored_keys = {
+        'admin_generatoragent',
+        'where',
+        'psc_chapters',
+        'license',
+        'wfw_commentrss',
+        'thr_total',
+        'feedburner_origlink',
+    }
+    result = parse_feedparser(())
+    assert result.bozo == loose
+    assert ignored_keys <= get_keys(result)
+    result = parse_feedparser(FeedparserParser().ignored_namespaces)
+    assert result.bozo == loose
+    assert not ignored_keys & get_keys(result)
+
+
 def test_missing_entry_id():
     """Handle RSS entries without guid.
     https://github.com/lemon24/reader/issues/170
@@ -531,7 +765,7 @@ def test_missing_entry_id():
 
     # ... and only link.
     with pytest.raises(ParseError) as excinfo, pytest.warns(ParseError):
-        feedparser_parse(
+        _, entries = feedparser_parse(
             'url',
             """
             <?xml version="1.0" encoding="UTF-8" ?>
@@ -546,6 +780,8 @@ def test_missing_entry_id():
             </rss>
             """.strip(),
         )
+        # the entries are processed lazily
+        list(entries)
     assert excinfo.value.url == 'url'
     assert 'entry with no id' in excinfo.value.message
 
@@ -571,14 +807,14 @@ def test_missing_entry_id():
             </rss>
             """.strip(),
         )
-    assert [e.title for e in entries] == ["Example entry"]
+        assert [e.title for e in entries] == ["Example entry"]
     assert len(warnings) == 2, warnings
     assert warnings[0].message.url == 'url'
     assert 'entry with no id' in warnings[0].message.message
 
     # There is no fallback for Atom.
     with pytest.raises(ParseError) as excinfo, pytest.warns(ParseError):
-        feedparser_parse(
+        _, entries = feedparser_parse(
             'url',
             """
             <?xml version="1.0" encoding="utf-8"?>
@@ -592,6 +828,7 @@ def test_missing_entry_id():
             </feed>
             """.strip(),
         )
+        list(entries)
     assert excinfo.value.url == 'url'
     assert 'entry with no id' in excinfo.value.message
 
@@ -668,6 +905,116 @@ def test_jsonfeed_invalid_json():
     assert isinstance(excinfo.value.__cause__, json.JSONDecodeError)
 
 
+JSONFEED_INCREMENTAL = [
+    '{"version": "https://jsonfeed.org/version/1.1", "items": []}',
+    ' \n{ "version" : "https://jsonfeed.org/version/1.1" , "items" : [ ] } \n',
+    '{"version": "https://jsonfeed.org/version/1.1"}',
+    '{"version": "https://jsonfeed.org/version/1.1", "items": {"id": "1"}}',
+    # members after items, duplicate items
+    '{"items": [{"id": "1"}], "language": "en", '
+    '"version": "https://jsonfeed.org/version/1.1", "title": "title"}',
+    '{"version": "https://jsonfeed.org/version/1.1", '
+    '"items": [{"id": "1"}], "items": [{"id": "2"}, {"id": "3"}]}',
+    '{"version": "https://jsonfeed.org/version/1.1", '
+    '"items": [{"id": "1"}], "items": null}',
+    '{"version": "https://jsonfeed.org/version/1.1", '
+    '"items": null, "items": [{"id": "2", "content_text": "[]{},\\"]"}]}',
+]
+
+JSONFEED_INVALID = [
+    'malformed JSON',
+    '',
+    '{',
+    '{"version": "https://jsonfeed.org/version/1.1"',
+    '{"version" "https://jsonfeed.org/version/1.1"}',
+    '{"version": "https://jsonfeed.org/version/1.1",}',
+    '{"version": "https://jsonfeed.org/version/1.1" "items": []}',
+    '{version: "https://jsonfeed.org/version/1.1"}',
+    '{"version": "https://jsonfeed.org/version/1.1", "items": [}',
+    '{"version": "https://jsonfeed.org/version/1.1", "items": [{"id": "1"},]}',
+    '{"version": "https://jsonfeed.org/version/1.1", "items": [{"id": "1"} {}]}',
+    '{"version": "https://jsonfeed.org/version/1.1", "items": []} extra',
+    '{} {}',
+    '[] extra',
+]
+
+
+@pytest.mark.parametrize(
+    'data',
+    [f'{name}.json' for name in ('full', '10', 'empty', 'invalid', 'unknown')]
+    + JSONFEED_INCREMENTAL,
+)
+def test_jsonfeed_incremental(data_dir, data):
+    if data.endswith('.json'):
+        data = data_dir.joinpath(data).read_text()
+
+    def parse(incremental):
+        feed, entries = str_bytes_parser(JSONFeedParser(incremental))('url', data)
+        return feed, list(entries)
+
+    assert parse(True) == parse(False)
+
+
+@pytest.mark.parametrize('data', JSONFEED_INVALID)
+@pytest.mark.parametrize('incremental', [False, True])
+def test_jsonfeed_incremental_invalid_json(data, incremental):
+    with pytest.raises(ParseError) as excinfo:
+        str_bytes_parser(JSONFeedParser(incremental))('url', data)
+    assert 'invalid JSON' in excinfo.value.message
+    assert isinstance(excinfo.value.__cause__, json.JSONDecodeError)
+
+
+def test_jsonfeed_incremental_is_lazy():
+    data = """
+        {
+            "version": "https://jsonfeed.org/version/1.1",
+            "items": [{"id": "1"}, {"content_text": "no id"}],
+            "title": "title"
+        }
+    """
+    feed, entries = str_bytes_parser(JSONFeedParser(incremental=True))('url', data)
+    assert feed.title == 'title'
+    assert next(iter(entries)).id == '1'
+    with pytest.raises(ParseError) as excinfo:
+        list(entries)
+    assert 'entry with no id' in excinfo.value.message
+
+
+def test_jsonfeed_incremental_default(monkeypatch):
+    data = '{"version": "https://jsonfeed.org/version/1.1", "items": [{}]}'
+
+    # small documents are decoded upfront
+    with pytest.raises(ParseError):
+        jsonfeed_parse('url', data)
+
+    # large ones incrementally
+    monkeypatch.setattr('reader._parser.jsonfeed.INCREMENTAL_MIN_SIZE', len(data))
+    _, entries = jsonfeed_parse('url', data)
+    with pytest.raises(ParseError) as excinfo:
+        list(entries)
+    assert 'entry with no id' in excinfo.value.message
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        # things orjson doesn't accept, but json does
+        '{"version": "https://jsonfeed.org/version/1.1", "title": NaN}',
+        '{"version": "https://jsonfeed.org/version/1.1", "x": 123456789012345678901}',
+        '{"version": "https://jsonfeed.org/version/1.1", "title": "title", '
+        '"items": [{"id": 123456789012345678901}, {"id": -9223372036854775809}]}',
+        '{"version": "https://jsonfeed.org/version/1.1", "title": "\\ud800"}',
+        '{"version": "https://jsonfeed.org/version/1.1", "title": "title"}'.encode(
+            'utf-16'
+        ),
+    ],
+)
+def test_jsonfeed_loads_fallback(data):
+    feed, entries = jsonfeed_parse('url', data)
+    expected = str_bytes_parser(JSONFeedParser(incremental=True))('url', data)
+    assert (feed, list(entries)) == (expected[0], list(expected[1]))
+
+
 @pytest.fixture
 def make_http_set_headers_url(requests_mock):
     def make_url(feed_path, headers=None):
@@ -678,7 +1025,9 @@ def make_http_set_headers_url(requests_mock):
     yield make_url
 
 
-def test_response_headers(monkeypatch, make_http_set_headers_url, parse, data_dir):
+def test_response_headers(
+    monkeypatch, make_http_set_headers_url, parse, data_dir, no_etree
+):
     """The parser should pass the response headers it got from requests.get()
     to feedparser.parse().
 
@@ -695,7 +1044,7 @@ def test_response_headers(monkeypatch, make_http_set_headers_url, parse, data_di
 
 
 def test_default_response_headers(
-    monkeypatch, make_http_set_headers_url, parse, data_dir
+    monkeypatch, make_http_set_headers_url, parse, data_dir, no_etree
 ):
     """The response headers passed to feedparser.parse() should have specific
     headers set even if they weren't present in the requests.get() response.
@@ -710,6 +1059,183 @@ def test_default_response_headers(
     assert mock.call_args[1]['response_headers']['Content-Location'] == feed_url
 
 
+@pytest.mark.parametrize('parse_map', [None, map])
+def test_resource_hash(parse, make_http_url, data_dir, parse_map):
+    feed_url = make_http_url(data_dir.joinpath('full.atom'))
+    result = parse(feed_url)
+    assert result.resource_hash
+
+    feeds = [
+        FeedArgumentTuple(feed_url, resource_hash=result.resource_hash),
+        FeedArgumentTuple(feed_url, resource_hash=b'other'),
+        FeedArgumentTuple(feed_url),
+    ]
+    results = [r for _, r in parse.parallel(feeds, parse_map=parse_map)]
+    assert results == [NotModified(), result, result]
+
+
+DATE = 'Wed, 21 Oct 2015 07:00:00 GMT'
+
+
+@pytest.mark.parametrize(
+    'headers, expected',
+    [
+        ({}, None),
+        ({'Retry-After': '120'}, 120),
+        ({'Retry-After': 'Wed, 21 Oct 2015 08:00:00 GMT', 'Date': DATE}, 3600),
+        ({'Retry-After': 'Wed, 21 Oct 2015 06:00:00 GMT', 'Date': DATE}, 0),
+        ({'Retry-After': 'soon', 'Cache-Control': 'max-age=60'}, 60),
+        ({'Cache-Control': 'public, max-age=600'}, 600),
+        ({'Cache-Control': 'max-age=600', 'Age': '100'}, 500),
+        ({'Cache-Control': 'max-age=600', 'Age': '1000'}, 0),
+        ({'Cache-Control': 'no-cache, max-age=600'}, None),
+        ({'Cache-Control': 'no-store'}, None),
+        ({'Expires': 'Wed, 21 Oct 2015 07:10:00 GMT', 'Date': DATE}, 600),
+        ({'Expires': '0', 'Date': DATE}, None),
+        (
+            {
+                'Cache-Control': 'max-age=60',
+                'Expires': 'Wed, 21 Oct 2015 07:10:00 GMT',
+                'Date': DATE,
+            },
+            60,
+        ),
+    ],
+)
+def test_parse_retry_after(headers, expected):
+    headers = requests.structures.CaseInsensitiveDict(headers)
+    assert parse_retry_after(headers) == expected
+
+
+def test_retry_after(make_http_set_headers_url, parse, data_dir):
+    feed_url = make_http_set_headers_url(
+        data_dir.joinpath('empty.atom'), {'Cache-Control': 'max-age=600'}
+    )
+    assert parse(feed_url).retry_after == 600
+
+    feed_url = make_http_set_headers_url(data_dir.joinpath('full.atom'))
+    assert parse(feed_url).retry_after is None
+
+
+@pytest.mark.parametrize('parse_map', [None, map])
+def test_retry_after_not_modified(requests_mock, parse, parse_map):
+    url = 'http://example.com/feed'
+    requests_mock.get(url, status_code=304, headers={'Cache-Control': 'max-age=600'})
+    feeds = [FeedArgumentTuple(url, 'etag')]
+    ((_, result),) = parse.parallel(feeds, parse_map=parse_map)
+    assert result == NotModified(600)
+    assert not result
+
+    # the convenience wrapper still returns None
+    assert parse(url, 'etag') is None
+
+
+@pytest.mark.parametrize('status, expected', [(429, 120), (503, 120), (404, None)])
+def test_retry_after_bad_status(requests_mock, parse, status, expected):
+    url = 'http://example.com/feed'
+    requests_mock.get(url, status_code=status, headers={'Retry-After': '120'})
+    with pytest.raises(ParseError) as excinfo:
+        parse(url)
+    assert excinfo.value._retry_after == expected
+
+
+@pytest.mark.parametrize(
+    'statuses, expected',
+    [
+        ([], None),
+        ([301], 'http://example.com/feed'),
+        ([308, 301], 'http://example.com/feed'),
+        ([301, 302], None),
+        ([307], None),
+    ],
+)
+def test_permanent_redirect(requests_mock, parse, data_dir, statuses, expected):
+    urls = [f'http://example.com/{i}' for i in range(len(statuses))]
+    urls.append('http://example.com/feed')
+    for url, next_url, status in zip(urls, urls[1:], statuses):
+        requests_mock.get(url, status_code=status, headers={'Location': next_url})
+    requests_mock.get(
+        urls[-1],
+        text=data_dir.joinpath('full.atom').read_text(),
+        headers={'Content-Type': 'application/atom+xml'},
+    )
+
+    assert parse(urls[0]).permanent_redirect == expected
+
+
+@pytest.mark.parametrize(
+    'status, headers, expected',
+    [
+        (200, {}, False),
+        (200, {'IM': 'feed'}, False),
+        (226, {'IM': 'feed'}, True),
+        (226, {'IM': 'gzip, Feed'}, True),
+        (226, {'IM': 'vcdiff'}, False),
+    ],
+)
+def test_delta(requests_mock, parse, data_dir, status, headers, expected):
+    url = 'http://example.com/feed'
+    requests_mock.get(
+        url,
+        status_code=status,
+        text=data_dir.joinpath('full.atom').read_text(),
+        headers={'Content-Type': 'application/atom+xml', **headers},
+    )
+    result = parse(url)
+    assert result.is_delta == expected
+    assert requests_mock.last_request.headers['A-IM'] == 'feed'
+
+
+def test_file_etag(tmp_path):
+    path = tmp_path.joinpath('feed.xml')
+    path.write_bytes(b'one')
+    retriever = FileRetriever(str(tmp_path))
+
+    with retriever('feed.xml') as result:
+        assert result.resource.read() == b'one'
+        etag = result.http_etag
+    assert etag
+
+    # same stat() result, the file is not read
+    with retriever('feed.xml', etag) as result:
+        assert result is None
+
+    path.write_bytes(b'two!')
+    with retriever('feed.xml', etag) as result:
+        assert result.resource.read() == b'two!'
+        assert result.http_etag != etag
+        etag = result.http_etag
+
+    # modification time only
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+    with retriever('feed.xml', etag) as result:
+        assert result.http_etag != etag
+
+
+def test_file_empty(tmp_path):
+    # empty files can't be mmap-ed
+    path = tmp_path.joinpath('feed.xml')
+    path.write_bytes(b'')
+    with FileRetriever(str(tmp_path))('feed.xml') as result:
+        assert result.resource.read() == b''
+        assert result.http_etag
+
+
+@pytest.mark.skipif("not hasattr(os, 'mkfifo')")
+def test_file_fifo(tmp_path):
+    # no etag for non-regular files, since their contents can change
+    # without the stat() result changing; they can't be mmap-ed either
+    path = tmp_path.joinpath('feed.xml')
+    os.mkfifo(path)
+    thread = threading.Thread(target=path.write_bytes, args=(b'one',), daemon=True)
+    thread.start()
+    with FileRetriever(str(tmp_path))('feed.xml', 'etag') as result:
+        assert result.resource.read() == b'one'
+        assert result.http_etag is None
+    thread.join()
+
+
 @pytest.mark.parametrize('scheme', ['', 'file:', 'file:///', 'file://localhost/'])
 @pytest.mark.parametrize('relative', [False, True])
 def test_feed_root_empty(data_dir, scheme, relative):
@@ -951,7 +1477,7 @@ def test_parser_selection():
 
     http_parser = make_dummy_parser('httpp-', 'type/http')
     parse.mount_parser_by_mime_type(http_parser)
-    assert parse('http:one', 'etag', None) == (
+    assert parse('http:one', 'etag', None) == ParsedFeed(
         'httpp-http',
         ['http:one'],
         'etag',
@@ -974,7 +1500,7 @@ def test_parser_selection():
 
     file_parser = make_dummy_parser('filep-')
     parse.mount_parser_by_mime_type(file_parser, 'type/file, text/plain;q=0.8')
-    assert parse('file:one', None, 'last-modified') == (
+    assert parse('file:one', None, 'last-modified') == ParsedFeed(
         'filep-file',
         ['file:one'],
         None,
@@ -1007,14 +1533,14 @@ def test_parser_selection():
     assert "unaware parser" in str(excinfo.value)
 
     parse.mount_parser_by_mime_type(make_dummy_parser('fallbackp-'), '*/*')
-    assert parse('nomt:one') == (
+    assert parse('nomt:one') == ParsedFeed(
         'fallbackp-nomt',
         ['nomt:one'],
         None,
         None,
         'application/octet-stream',
     )
-    assert parse('unkn:one') == (
+    assert parse('unkn:one') == ParsedFeed(
         'fallbackp-unkn',
         ['unkn:one'],
         None,
@@ -1023,9 +1549,13 @@ def test_parser_selection():
     )
     assert nomt_retriever.last_http_accept == 'type/http,type/file,text/plain;q=0.8,*/*'
 
-    assert parse('file:o') == ('urlp-file', ['file:o'], None, None, 'type/file')
+    assert parse('file:o') == ParsedFeed(
+        'urlp-file', ['file:o'], None, None, 'type/file'
+    )
     assert file_retriever.last_http_accept is None
-    assert parse('file:///o') == ('urlp-file', ['file:///o'], None, None, 'type/file')
+    assert parse('file:///o') == ParsedFeed(
+        'urlp-file', ['file:///o'], None, None, 'type/file'
+    )
 
 
 def test_retriever_selection():
@@ -1035,14 +1565,14 @@ def test_retriever_selection():
     parse.mount_retriever('http://specific.com', make_dummy_retriever('specific'))
     parse.mount_parser_by_mime_type(make_dummy_parser(), '*/*')
 
-    assert parse('http://generic.com/', 'etag', None) == (
+    assert parse('http://generic.com/', 'etag', None) == ParsedFeed(
         'generic',
         ['http://generic.com/'],
         'etag',
         None,
         'type/subtype',
     )
-    assert parse('http://specific.com/', None, 'last-modified') == (
+    assert parse('http://specific.com/', None, 'last-modified') == ParsedFeed(
         'specific',
         ['http://specific.com/'],
         None,
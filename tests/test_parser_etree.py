@@ -0,0 +1,261 @@
+"""Differential tests for the ElementTree fast path.
+
+Anything ElementTreeParser parses itself must come out
+exactly like FeedparserParser would have parsed it;
+anything else must go to the fallback parser.
+
+"""
+
+import io
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from reader._parser.etree import ElementTreeParser
+from reader._parser.feedparser import FeedparserParser
+
+
+URL = 'http://example.com/feed.xml'
+
+RSS = """\
+<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:atom="http://www.w3.org/2005/Atom"
+    xmlns:sy="http://purl.org/rss/1.0/modules/syndication/">
+<channel>
+{feed}
+<item>
+{entry}
+</item>
+</channel>
+</rss>
+"""
+
+ATOM = """\
+<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"{attrs}>
+{feed}
+<entry>
+{entry}
+</entry>
+</feed>
+"""
+
+
+def rss(entry='<guid>g</guid>', feed='<title>T</title>'):
+    return RSS.format(feed=feed, entry=entry).encode('utf-8')
+
+
+def atom(entry='<id>i</id>', feed='<title>T</title>', attrs=''):
+    return ATOM.format(feed=feed, entry=entry, attrs=attrs).encode('utf-8')
+
+
+TEXTS = [
+    'plain',
+    '  spaced  \n',
+    'café ’ 中',
+    'Ã© mojibake',
+    '\u0080\u0093 cp1252',
+    'Tom &amp; Jerry',
+    '&lt;b&gt;bold&lt;/b&gt;',
+    '&lt;p&gt;a &lt;a href="rel/x"&gt;link&lt;/a&gt;&lt;/p&gt;',
+    '&lt;script&gt;x&lt;/script&gt;y',
+    '<![CDATA[<em>cdata</em> &amp; more]]>',
+    '',
+]
+
+DATES = ['Sun, 06 Sep 2009 16:20:00 +0000', '2003-12-13T18:30:02Z', 'garbage']
+
+RSS_ENTRY_TAGS = ['title', 'description', 'content:encoded', 'author', 'dc:creator']
+RSS_FEED_TAGS = ['title', 'description', 'link', 'managingEditor']
+ATOM_TEXT_TAGS = ['title', 'summary', 'content']
+
+FAST = [
+    *(
+        rss(f'<guid>g</guid><{tag}>{text}</{tag}>')
+        for tag in RSS_ENTRY_TAGS
+        for text in TEXTS
+    ),
+    *(rss(feed=f'<{tag}>{text}</{tag}>') for tag in RSS_FEED_TAGS for text in TEXTS),
+    *(rss(f'<guid>g</guid><pubDate>{date}</pubDate>') for date in DATES),
+    *(rss(feed=f'<lastBuildDate>{date}</lastBuildDate>') for date in DATES),
+    rss('<guid isPermaLink="false">g</guid>'),
+    rss('<guid>rel/g</guid><link>http://example.com/l</link>'),
+    rss('<link>http://example.com/l</link><guid>rel/g</guid>'),
+    rss('<link>http://example.com/?a=1&amp;amp;b=2</link>'),
+    rss('<link>http://example.com/?a=1&amp;b;=2</link>'),
+    rss('<link></link><guid>http://example.com/g</guid>'),
+    rss('<guid>g</guid><enclosure url="http://e/a" type="Audio/MPEG" length="1"/>'),
+    rss('<guid>g</guid><enclosure url="rel/e" length="x"/><enclosure url=""/>'),
+    rss('<guid>g</guid><atom:link rel="enclosure" href="rel/enc"/>'),
+    rss('<atom:link href="http://example.com/alt"/><guid>g</guid>'),
+    rss(
+        '<guid>g</guid>'
+        '<content:encoded>c</content:encoded><description>d</description>'
+    ),
+    rss('<guid>g</guid><content:encoded xml:lang="en_US">c</content:encoded>'),
+    rss('<guid>g</guid><content type="text/whatever">c</content>'),
+    rss('<guid>g</guid><category>c</category><comments>http://c</comments>'),
+    rss(feed='<image><url>http://i</url><link>rel/l</link></image><link>l</link>'),
+    rss(feed='<atom:link rel="self" href="http://s"/><link>http://l</link>'),
+    rss(feed='<sy:updatePeriod>hourly</sy:updatePeriod><ttl>60</ttl>'),
+    *(
+        atom(f'<id>i</id><{tag}>{text}</{tag}>')
+        for tag in ATOM_TEXT_TAGS
+        for text in TEXTS
+    ),
+    *(
+        atom(f'<id>i</id><{tag} type="html">{text}</{tag}>')
+        for tag in ATOM_TEXT_TAGS
+        for text in TEXTS
+    ),
+    *(atom(f'<id>i</id><author><name>{text}</name></author>') for text in TEXTS),
+    *(atom(f'<id>i</id><updated>{date}</updated>') for date in DATES),
+    atom('<id>rel/id</id>'),
+    atom('<id>http://example.com/i</id><link href="http://example.com/l"/>'),
+    atom('<id>i</id><link rel="self" href="http://s"/>'),
+    atom('<id>i</id><link href=""/>'),
+    atom('<id>i</id><link rel="ALTERNATE" TYPE="TEXT/HTML" href="http://c"/>'),
+    atom('<id>i</id><link rel="alternate" type="application/pdf" href="http://p"/>'),
+    atom('<id>i</id><link rel="enclosure" href="rel/e" type="Audio/X" length="5"/>'),
+    atom('<id>i</id><author><name>N</name><email>e@x</email></author>'),
+    atom('<id>i</id><author><email>e@x</email><uri>http://u</uri></author>'),
+    atom('<id>i</id><author>  <name> N </name>  </author>'),
+    atom('<id>i</id><contributor><name>C</name></contributor>'),
+    atom('<id>i</id><content>c</content><summary>s</summary>'),
+    atom('<id>i</id><content type="text">c</content><content type="html">h</content>'),
+    atom('<id>i</id><content xml:lang="pt_BR">c</content>'),
+    atom('<id>i</id><content>c</content>', attrs=' xml:lang="en"'),
+    atom(feed='<id>http://example.com/</id><link href="http://example.com/l"/>'),
+    atom(feed='<generator>G</generator><icon>i.png</icon><rights>r</rights>'),
+]
+
+FALLBACK = [
+    # unsupported encodings
+    b'\xef\xbb\xbf' + rss(),
+    rss().replace(b'utf-8', b'iso-8859-1'),
+    rss().decode().replace('utf-8', 'utf-16').encode('utf-16'),
+    # not well-formed
+    rss(feed='<title>&nbsp;</title>'),
+    rss(feed='<title>unclosed'),
+    rss().replace(b'<rss', b'<!DOCTYPE rss>\n<rss'),
+    # other versions
+    rss().replace(b'"2.0"', b'"0.91"'),
+    rss(feed='<title xmlns:rss1="http://purl.org/rss/1.0/">T</title>'),
+    b"""\
+<?xml version="1.0"?>
+<rdf:RDF
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns="http://purl.org/rss/1.0/">
+<channel><title>T</title></channel>
+<item><title>i</title><link>http://example.com/i</link></item>
+</rdf:RDF>
+""",
+    # unsupported elements
+    rss('<guid>g</guid><source url="http://s">S</source>'),
+    rss('<guid>g</guid><title><b>x</b></title>'),
+    rss('<guid>g</guid><title>one</title><title>two</title>'),
+    rss(feed='<skipHours><hour>1</hour></skipHours>'),
+    atom('<id>i</id><source><id>s</id></source>'),
+    atom('<id>i</id><content src="http://x"/>'),
+    atom('<id>i</id><content type="image/png">aGk=</content>'),
+    atom('<id>i</id><author><name>A</name></author><author><name>B</name></author>'),
+    atom('<id>i</id><foo xmlns="http://example.com/ns">x</foo>'),
+    # unsupported attributes / content types
+    atom('<id>i</id><title xml:base="http://b/">t</title>'),
+    atom(
+        '<id>i</id><content type="xhtml">'
+        '<div xmlns="http://www.w3.org/1999/xhtml"><b>x</b></div>'
+        '</content>'
+    ),
+]
+
+# the first entries are parsed by ElementTreeParser, the rest by the fallback
+LATE_FALLBACK = [
+    rss('<guid>a</guid></item><item><guid>b</guid><source url="http://s">S</source>'),
+    rss(
+        '<guid>a</guid></item><item><guid>b</guid></item><item><title><b>x</b></title>'
+    ),
+    rss(
+        '<title>no id</title></item><item><guid>b</guid><title>1</title><title>2</title>'
+    ),
+    atom('<id>a</id></entry><entry><id>b</id><content src="http://x"/>'),
+]
+
+HEADERS = [
+    None,
+    {'content-type': 'application/rss+xml', 'content-location': URL},
+    {'content-type': 'application/xml', 'content-location': 'https://e.com/d/'},
+    {'content-type': 'text/xml; charset=utf-8', 'content-language': 'de_DE'},
+    {'content-type': 'text/html; charset=utf-8'},
+    # feedparser misses the content type (looks it up case-sensitively)
+    CaseInsensitiveDict({'Content-Type': 'application/atom+xml'}),
+]
+
+
+class Fallback:
+    def __init__(self):
+        self.parser = FeedparserParser()
+        self.called = False
+
+    def __call__(self, *args):
+        self.called = True
+        return self.parser(*args)
+
+
+def parse(parser, data, headers):
+    try:
+        feed, entries = parser(URL, io.BytesIO(data), headers)
+        return feed, list(entries)
+    except Exception as e:
+        return repr(e)
+
+
+@pytest.mark.parametrize('headers', HEADERS)
+@pytest.mark.parametrize('data', FAST)
+def test_fast(data, headers):
+    fallback = Fallback()
+    expected = parse(FeedparserParser(), data, headers)
+    actual = parse(ElementTreeParser(fallback), data, headers)
+    assert not fallback.called
+    assert actual == expected
+
+
+@pytest.mark.parametrize('data', FALLBACK)
+def test_fallback(data):
+    fallback = Fallback()
+    expected = parse(FeedparserParser(), data, None)
+    actual = parse(ElementTreeParser(fallback), data, None)
+    assert fallback.called
+    assert actual == expected
+
+
+@pytest.mark.parametrize('data', LATE_FALLBACK)
+def test_late_fallback(data):
+    fallback = Fallback()
+    expected = parse(FeedparserParser(), data, None)
+    feed, entries = ElementTreeParser(fallback)(URL, io.BytesIO(data), None)
+    assert not fallback.called
+    actual = feed, list(entries)
+    assert fallback.called
+    assert actual == expected
+
+
+@pytest.mark.parametrize('headers', HEADERS[:3])
+@pytest.mark.parametrize('feed_type', ['rss', 'atom'])
+@pytest.mark.parametrize('data_file', ['full', 'empty', 'relative'])
+def test_data_files(data_dir, data_file, feed_type, headers):
+    data = data_dir.joinpath(f'{data_file}.{feed_type}').read_bytes()
+    fallback = Fallback()
+    expected = parse(FeedparserParser(), data, headers)
+    actual = parse(ElementTreeParser(fallback), data, headers)
+    assert not fallback.called
+    assert actual == expected
+
+
+def test_fallback_json():
+    fallback = Fallback()
+    parse(ElementTreeParser(fallback), rss(), {'content-type': 'application/json'})
+    assert fallback.called
@@ -0,0 +1,320 @@
+"""Differential tests for the html.parser-based sanitizer.
+
+Anything sanitize_html() handles itself must come out
+exactly like sanitize_html_sgmllib() would have it;
+anything else must go to sanitize_html_sgmllib().
+
+"""
+
+import io
+import pickle
+import random
+
+import pytest
+
+from reader._parser import default_parser
+from reader._parser.etree import ElementTreeParser
+from reader._parser.feedparser import FeedparserParser
+from reader._parser.sanitizer import _Sanitizer
+from reader._parser.sanitizer import _Unsupported
+from reader._parser.sanitizer import sanitize_html
+from reader._parser.sanitizer import sanitize_html_sgmllib
+from reader._parser.sanitizer import SanitizeHTMLCache
+from reader.exceptions import StorageError
+
+
+CONTENT_TYPES = ['text/html', 'application/xhtml+xml']
+BASES = ['http://example.com/a/b', '', 'javascript:x']
+
+FAST = [
+    # text
+    'plain',
+    '  spaced  \r\n',
+    'café ’ 中',
+    'Tom &amp; Jerry',
+    'Tom & Jerry &',
+    '&lt;b&gt; &nbsp; &apos; &AMP; &Amp;',
+    '&foo; &foo &a.b; &a-b &x;y',
+    '&#65; &#150; &#x96; &#X41; &#0; &#39; &#34; &#039; &#99999999999;',
+    # tags
+    '<p>one</p><p>two',
+    '<P CLASS="X">x</P >',
+    '<b>bold</b> <i>italic</i> <unknown>u</unknown> <font color=red>f</font>',
+    '<a:b>x</a:b><x-y z=1>y</x-y>',
+    '<br><br/><br /><hr>x</br><p/><P/>',
+    'a &amp;</br>t; & </hr>x',
+    '<table><tr><td background="bg.png">c</td></tr></table>',
+    # attributes
+    '<a href="rel/x?a=1&b=2" title="T">link</a>',
+    '<a href="?a=1&amp;b=2">x</a>',
+    '<a href=\'single\'>x</a><a href=unquoted/path>y</a>',
+    '<a\thref="x"\n>x</a><a href = "x" >y</a><a\xa0href=x>z</a>',
+    '<a HREF="first" href="second">x</a>',
+    '<a title>x</a><input checked disabled=disabled>',
+    '<a rel="NoFollow" type="Text/HTML" href="x">x</a>',
+    '<a title="it&#39;s &quot;q&quot; &lt;&gt;&q">x</a>',
+    '<a href="javascript:alert(1)">x</a><a href="mailto:a@b">y</a>',
+    '<a href="  http://x  ">x</a><a href="HTTP://X">y</a>',
+    '<a href="//host/p">x</a><a href="#frag">y</a><a href="">z</a>',
+    '<img src="/i.png" alt="i" width="1" longdesc="  l ">',
+    '<img src=x.png/><img src="y.png"/><embed src="e"/><meta />',
+    '<link rel="Stylesheet" href="s.css"/>',
+    '<object data="d"><param name="a" value="b"></object>',
+    '<iframe src="f"></iframe><blockquote cite="c">q</blockquote>',
+    '<video poster="p" src="v"></video><body background="b">',
+    # styles
+    '<div style="color: red; background: url(x)">x</div>',
+    '<div style="margin: 0 auto; padding: 1px; float: left;">x</div>',
+    '<div style="border: 1px solid #000">x</div>',
+    '<span style="color: red" style="color: blue">x</span>',
+    # unacceptable elements
+    '<script>alert(1)</script>after',
+    '<script src="s.js"/>after',
+    '<style>p &amp; q {}</style><applet>a &foo; &#65;</applet>',
+    '</script>dropped<script>',
+    # comments, processing instructions
+    '<!-- comment -->x<!---->y<!--a-b-->',
+    '<script><!-- kept --></script>',
+    '<?php echo 1 ?>x',
+    # (escaped) declarations
+    '<!x> <!ELEMENT y>',
+]
+
+FALLBACK = [
+    # tokenized differently
+    'a < b',
+    'a <> b',
+    '<1>',
+    '</>',
+    '</ p>',
+    '</p x>',
+    '<a/b>',
+    '<a/ >',
+    '<a href="x" / >',
+    '<a href="x"title="y">',
+    '<a b=>',
+    '<a b=c"d>',
+    '<a title="&#34;">',
+    '<a title="a > b">',
+    '<script>if (a < b) {}</script>',
+    # references
+    '&#65',
+    '&#xZ;',
+    '&#;',
+    '&#',
+    '&amp',
+    '&#१;',
+    # sgmllib drops the void end tag, then sees &t; as a reference
+    '&</br>t;',
+    'a &am</img>p; b',
+    '<script>&</br>t;</script>',
+    # comments, processing instructions, declarations
+    '<!-->',
+    '<!--->',
+    '<!-- a -- b -->',
+    '<!-- <b> -->',
+    '<!-- &amp; -->',
+    '<!--',
+    '<?',
+    '<?a<b>',
+    '<!DOCTYPE html>',
+    '<![CDATA[x]]>',
+    # HTMLSanitizer state we don't track
+    '<svg><rect/></svg>',
+    '<math><mi>x</mi></math>',
+]
+
+
+@pytest.mark.parametrize('base', BASES)
+@pytest.mark.parametrize('content_type', CONTENT_TYPES)
+@pytest.mark.parametrize('html', FAST)
+def test_fast(html, content_type, base):
+    expected = sanitize_html_sgmllib(html, base, content_type)
+    assert _Sanitizer(base, content_type).sanitize(html) == expected
+    assert sanitize_html(html, base, content_type) == expected
+
+
+@pytest.mark.parametrize('content_type', CONTENT_TYPES)
+@pytest.mark.parametrize('html', FALLBACK)
+def test_fallback(html, content_type):
+    base = BASES[0]
+    with pytest.raises(_Unsupported):
+        _Sanitizer(base, content_type).sanitize(html)
+    expected = sanitize_html_sgmllib(html, base, content_type)
+    assert sanitize_html(html, base, content_type) == expected
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_combinations(seed):
+    rng = random.Random(seed)
+    snippets = FAST + FALLBACK
+    for _ in range(50):
+        html = ''.join(rng.choices(snippets, k=rng.randint(2, 6)))
+        for content_type in CONTENT_TYPES:
+            expected = sanitize_html_sgmllib(html, BASES[0], content_type)
+            assert sanitize_html(html, BASES[0], content_type) == expected, html
+
+
+@pytest.mark.parametrize('parser_cls', [FeedparserParser, ElementTreeParser])
+@pytest.mark.parametrize('data_file', ['full.rss', 'relative.rss', 'relative.atom'])
+def test_parser(data_dir, data_file, parser_cls):
+    url = 'http://example.com/feed.xml'
+    path = data_dir.joinpath(data_file)
+
+    calls = []
+
+    def spy(*args):
+        calls.append(args)
+        return sanitize_html(*args)
+
+    def parse(sanitize_html):
+        with path.open('rb') as file:
+            feed, entries = parser_cls(sanitize_html=sanitize_html)(url, file)
+            return feed, list(entries)
+
+    assert parse(spy) == parse(sanitize_html_sgmllib)
+    assert calls
+
+
+def test_cache():
+    calls = []
+
+    def sanitize(*args):
+        calls.append(args)
+        return sanitize_html(*args)
+
+    cache = SanitizeHTMLCache(sanitize, max_size=20)
+    base, content_type = BASES[0], CONTENT_TYPES[0]
+
+    assert cache('<b>one</b>', base, content_type) == '<b>one</b>'
+    assert cache('<b>one</b>', base, content_type) == '<b>one</b>'
+    assert len(calls) == 1
+    assert (len(cache), cache.size) == (1, 10)
+
+    # the key includes the base URI and the content type
+    assert cache('<a href="x">', base, content_type).endswith('/a/x">')
+    cache('<b>one</b>', '', content_type)
+    cache('<b>one</b>', base, CONTENT_TYPES[1])
+    assert len(calls) == 4
+
+    # values larger than max_size and values without markup are not cached
+    assert (len(cache), cache.size) == (2, 20)
+    cache('text', base, content_type)
+    assert (len(cache), cache.size) == (2, 20)
+
+    # least recently used values are evicted first
+    cache('<b>one</b>', base, content_type)
+    cache('<b>two</b>', base, content_type)
+    cache('<b>one</b>', base, content_type)
+    cache('<b>six</b>', base, content_type)
+    assert (len(cache), cache.size) == (2, 20)
+
+    del calls[:]
+    cache('<b>one</b>', base, content_type)
+    cache('<b>six</b>', base, content_type)
+    assert calls == []
+    cache('<b>two</b>', base, content_type)
+    assert len(calls) == 1
+
+
+class Store(dict):
+    def get_sanitized_html(self, key):
+        return self.get(key)
+
+    def add_sanitized_html(self, values, max_count):
+        for key, value in values:
+            self.setdefault(key, value)
+
+
+def test_cache_store():
+    calls = []
+
+    def sanitize(*args):
+        calls.append(args)
+        return sanitize_html(*args)
+
+    base, content_type = BASES[0], CONTENT_TYPES[0]
+    store = Store()
+    cache = SanitizeHTMLCache(sanitize)
+    cache.store = store
+    cache.flush_size = 3
+
+    cache('<b>one</b>', base, content_type)
+    cache('<b>two</b>', base, content_type)
+    assert len(calls) == 2
+    assert store == {}
+
+    # added in batches...
+    cache('<b>six</b>', base, content_type)
+    assert sorted(store.values()) == ['<b>one</b>', '<b>six</b>', '<b>two</b>']
+    # ...and on flush
+    cache('<b>ten</b>', base, content_type)
+    assert len(store) == 3
+    cache.flush()
+    assert len(store) == 4
+
+    # another process, with an empty in-memory cache
+    del calls[:]
+    other = SanitizeHTMLCache(sanitize)
+    other.store = store
+    assert other('<b>one</b>', base, content_type) == '<b>one</b>'
+    assert other('<b>one</b>', '', content_type) == '<b>one</b>'
+    assert len(calls) == 1
+    assert len(other) == 2
+    other.flush()
+    assert len(store) == 5
+
+
+def test_cache_store_errors(caplog):
+    class BrokenStore:
+        def get_sanitized_html(self, key):
+            raise StorageError('get')
+
+        def add_sanitized_html(self, values, max_count):
+            raise StorageError('add')
+
+    base, content_type = BASES[0], CONTENT_TYPES[0]
+    cache = SanitizeHTMLCache()
+    cache.store = BrokenStore()
+
+    assert cache('<b>one</b>', base, content_type) == '<b>one</b>'
+    assert "could not get sanitized HTML" in caplog.text
+    cache.flush()
+    assert "could not add sanitized HTML" in caplog.text
+    assert cache._pending == []
+
+
+def test_cache_pickle():
+    cache = SanitizeHTMLCache()
+    base, content_type = BASES[0], CONTENT_TYPES[0]
+    cache('<b>one</b>', base, content_type)
+
+    # copies unpickled in the same process share a cache
+    cache.store = Store()
+    one = pickle.loads(pickle.dumps(cache))
+    two = pickle.loads(pickle.dumps(cache))
+    assert one is two
+    assert one is not cache
+    assert len(one) == 0
+    assert one.store is None
+
+    one('<b>two</b>', base, content_type)
+    assert len(two) == 1
+    assert len(cache) == 1
+
+
+def test_default_parser_cache(data_dir):
+    parser = default_parser(_lazy=False)
+    etree_parser = parser.get_parser_by_mime_type('application/rss+xml')
+    feedparser_parser = etree_parser.fallback
+    assert isinstance(etree_parser.sanitize_html, SanitizeHTMLCache)
+    assert feedparser_parser.sanitize_html is etree_parser.sanitize_html
+
+    data = data_dir.joinpath('relative.rss').read_bytes()
+    _, entries = etree_parser('url', io.BytesIO(data))
+    list(entries)
+    size = len(etree_parser.sanitize_html)
+    assert size
+    _, entries = feedparser_parser('url', io.BytesIO(data))
+    list(entries)
+    assert len(etree_parser.sanitize_html) == size
@@ -880,14 +880,16 @@ def test_last_retrieved_update_after_basic(reader, action):
     feed = reader.get_feed(feed)
 
     assert feed.last_retrieved == datetime(2010, 1, 1, 0, 59, 59)
-    assert feed.update_after == datetime(2010, 1, 1, 1)
+    # consecutive failures double the interval
+    backoff = 2 if action == 'raise_exc' else 1
+    assert feed.update_after == datetime(2010, 1, 1, backoff)
 
     reader._now = lambda: datetime(2010, 1, 1, 1)
     reader.update_feeds()
     feed = reader.get_feed(feed)
 
     assert feed.last_retrieved == datetime(2010, 1, 1, 1)
-    assert feed.update_after == datetime(2010, 1, 1, 2)
+    assert feed.update_after == datetime(2010, 1, 1, 2 * backoff)
 
 
 @pytest.mark.parametrize(
@@ -2525,6 +2527,21 @@ def test_session_timeout(monkeypatch, make_reader, kwargs, expected_timeout):
     assert exc_info.value.__cause__.args == ('timeout', expected_timeout)
 
 
+@pytest.mark.parametrize(
+    'kwargs, expected',
+    [
+        ({}, (None, None)),
+        ({'session_deadline': 1.5, 'session_max_size': 1000}, (1.5, 1000)),
+    ],
+)
+def test_session_deadline_max_size(make_reader, kwargs, expected):
+    reader = make_reader(':memory:', **kwargs)
+    session_factory = reader._parser.session_factory
+    assert (session_factory.deadline, session_factory.max_size) == expected
+    with session_factory() as session:
+        assert (session.deadline, session.max_size) == expected
+
+
 def test_reserved_names(make_reader):
     with pytest.raises(ValueError):
         make_reader(':memory:', reserved_name_scheme={})
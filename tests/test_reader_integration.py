@@ -1,8 +1,11 @@
+import gzip
 import socketserver
 import threading
+import time
 
 import pytest
 
+from reader import ParseError
 from reader import USER_AGENT
 from utils import make_url_base
 from utils import utc_datetime
@@ -12,6 +15,7 @@ class Server(socketserver.TCPServer):
     def __init__(self, *args):
         super().__init__(*args)
         self.response = b''
+        self.responses = {}
         self.request = None
 
     @property
@@ -30,8 +34,21 @@ class Handler(socketserver.StreamRequestHandler):
             lines.append(line)
             if not line.rstrip():
                 break
-        self.server.request = parse_request(b''.join(lines))
-        self.wfile.write(self.server.response)
+        self.server.request = request = parse_request(b''.join(lines))
+        path = request[0].split()[1]
+        response = self.server.responses.get(path, self.server.response)
+        # a list of parts means "send them slowly"
+        if isinstance(response, bytes):
+            response = [response]
+        try:
+            for i, part in enumerate(response):
+                if i:
+                    time.sleep(0.05)
+                self.wfile.write(part)
+                self.wfile.flush()
+        except BrokenPipeError:
+            # the client gave up
+            pass
 
 
 @pytest.fixture
@@ -207,3 +224,45 @@ def test_etag_last_modified(reader, data_dir, server):
     request_line, headers, body = server.request
     assert headers[b'If-None-Match'] == b'"11111-67890abcdef12"'
     assert headers[b'If-Modified-Since'] == b'Thu, 1 Jan 2020 11:11:11 GMT'
+
+
+@pytest.mark.slow
+def test_max_size_deadline(make_reader, db_path, data_dir, server):
+    body = data_dir.joinpath('full.atom').read_bytes()
+    gzipped = gzip.compress(body)
+    response = make_response(body)
+    server.responses = {
+        b'/length': response,
+        b'/eof': response.replace(b'Content-Length', b'X-Content-Length'),
+        b'/gzip': response.split(b'\r\n', 1)[0]
+        + b'\r\nContent-Type: text/xml\r\nContent-Encoding: gzip\r\n'
+        + b'Content-Length: %d\r\n\r\n' % len(gzipped)
+        + gzipped,
+        # a server trickling bytes, 20 * 0.05s = 1s
+        b'/slow': [response[i : i + 100] for i in range(0, len(response), 100)][:20],
+    }
+
+    def make_reader_with_feeds(**kwargs):
+        reader = make_reader(db_path, **kwargs)
+        for path in server.responses:
+            reader.add_feed(server.url + path.decode()[1:], exist_ok=True)
+        return reader
+
+    reader = make_reader_with_feeds(session_max_size=len(body))
+    for path in 'length', 'eof', 'gzip':
+        assert reader.update_feed(server.url + path).new == 2, path
+    reader.close()
+
+    reader = make_reader_with_feeds(session_max_size=len(body) - 1)
+    for path in 'length', 'eof', 'gzip':
+        with pytest.raises(ParseError) as exc_info:
+            reader.update_feed(server.url + path)
+        assert f'larger than {len(body) - 1} bytes' in str(exc_info.value), path
+    reader.close()
+
+    reader = make_reader_with_feeds(session_deadline=0.3)
+    start = time.monotonic()
+    with pytest.raises(ParseError) as exc_info:
+        reader.update_feed(server.url + 'slow')
+    assert 'longer than 0.3 seconds' in str(exc_info.value)
+    assert time.monotonic() - start < 0.9
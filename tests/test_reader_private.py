@@ -1,4 +1,5 @@
 import io
+import tracemalloc
 from contextlib import contextmanager
 from datetime import datetime
 
@@ -228,6 +229,49 @@ def test_retriever_parser_process_hooks(reader):
     assert entry.feed.title == 'FILE'
 
 
+def test_resource_hash(reader):
+    """If the retrieved resource did not change since the last update,
+    it is not parsed again.
+
+    """
+    retriever = CustomRetriever()
+    retriever.slow_to_read = True
+    retriever.process_feed_for_update = lambda feed: feed
+    reader._parser.mount_retriever('test:', retriever)
+    parser = CustomParser()
+    reader._parser.mount_parser_by_mime_type(parser)
+
+    urls = []
+    parser.in_call = urls.append
+
+    reader.add_feed('test:one')
+
+    def update():
+        (result,) = reader.update_feeds_iter()
+        return result.value
+
+    assert update().new == 1
+    assert urls == ['test:one']
+
+    # not parsed, same as not modified
+    assert update() is None
+    assert urls == ['test:one']
+    assert reader.get_feed('test:one').last_retrieved
+
+    # stale feeds get parsed regardless
+    reader._storage.set_feed_stale('test:one', True)
+    assert update().new == 0
+    assert urls == ['test:one'] * 2
+
+    # the hash gets stored even if the feed did not change
+    with reader._storage.get_db() as db:
+        db.execute("UPDATE feeds SET resource_hash = NULL;")
+    assert update().unmodified == 1
+    assert urls == ['test:one'] * 3
+    assert update() is None
+    assert urls == ['test:one'] * 3
+
+
 def setup_custom(reader, target_name, method_name, slow_to_read):
     retriever = CustomRetriever()
     reader._parser.mount_retriever('test:', retriever)
@@ -315,3 +359,239 @@ def test_retriever_parser_parse_error(
     assert rv[1].error is exc
     assert rv[2].updated_feed
     assert rv[3].updated_feed
+
+
+class StreamingParser(CustomParser):
+    def __call__(self, url, file, headers):
+        self.consumed = []
+        feed = FeedData(url, title='feed')
+
+        def make_entries():
+            for i in range(10):
+                if i == self.fail_at:
+                    raise RuntimeError('error')
+                self.consumed.append(i)
+                yield EntryData(url, f'{i}', title=f'entry {i}')
+
+        return feed, make_entries()
+
+    fail_at = None
+
+
+def test_parser_stream(reader):
+    """Entries are consumed as the parser yields them,
+    and errors while doing so are treated like any other parse error.
+
+    """
+    retriever = CustomRetriever()
+    retriever.process_feed_for_update = lambda feed: feed
+    reader._parser.mount_retriever('test:', retriever)
+    reader._parser.mount_parser_by_mime_type(parser := StreamingParser())
+    reader.add_feed('test:one')
+
+    reader.set_tag('test:one', '.reader.update', {'max_entries': 3})
+    (result,) = reader.update_feeds_iter()
+    assert result.updated_feed.new == 3
+    assert parser.consumed == [0, 1, 2]
+
+    parser.fail_at = 5
+    (result,) = reader.update_feeds_iter()
+    assert result.updated_feed.unmodified == 3
+
+    reader.delete_tag('test:one', '.reader.update')
+    (result,) = reader.update_feeds_iter()
+    assert isinstance(result.error, ParseError)
+    assert result.error.message == 'unexpected error during parser'
+    assert parser.consumed == [0, 1, 2, 3, 4]
+    assert reader.get_feed('test:one').last_exception
+    assert len(list(reader.get_entries())) == 3
+
+
+class LargeEntriesParser(CustomParser):
+    def __call__(self, url, file, headers):
+        feed = FeedData(url, title='feed')
+        entries = (
+            EntryData(url, f'{i}', title=f'entry {i}', summary=f'{i}' + 'x' * 50_000)
+            for i in range(400)
+        )
+        if not self.lazy:
+            entries = list(entries)
+        return feed, entries
+
+    lazy = True
+
+
+@pytest.mark.slow
+def test_parser_stream_memory(reader):
+    """With a parser that yields entries lazily,
+    an update does not keep all of them in memory at the same time
+    (only the ones that need updating, plus a storage chunk).
+
+    """
+    reader._storage.chunk_size = 10
+    retriever = CustomRetriever()
+    retriever.process_feed_for_update = lambda feed: feed
+    reader._parser.mount_retriever('test:', retriever)
+    reader._parser.mount_parser_by_mime_type(parser := LargeEntriesParser())
+    reader.add_feed('test:one')
+    reader.update_feeds()
+
+    def get_peak_memory():
+        tracemalloc.start()
+        try:
+            (result,) = reader.update_feeds_iter()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert result.updated_feed.unmodified == 400
+        return peak
+
+    parser.lazy = False
+    list_peak = get_peak_memory()
+    parser.lazy = True
+    lazy_peak = get_peak_memory()
+
+    # the summaries are about 20 MB
+    assert list_peak > 15_000_000
+    assert lazy_peak < list_peak / 4
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('feed_type', ['rss', 'atom'])
+def test_default_parser_stream_memory(reader, tmp_path, feed_type):
+    """The default parser yields the entries of large feeds lazily,
+    so an update does not keep all of them in memory at the same time.
+
+    """
+    summary = 'text ' * 200
+    if feed_type == 'rss':
+        template = '<rss version="2.0"><channel><title>{}</title>{}</channel></rss>'
+        entry = '<item><guid>{0}</guid><description>{0} {1}</description></item>'
+    else:
+        template = (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>{}</title>{}</feed>'
+        )
+        entry = '<entry><id>{0}</id><summary>{0} {1}</summary></entry>'
+    entries = ''.join(entry.format(i, summary) for i in range(10_000))
+
+    path = tmp_path.joinpath(f'feed.{feed_type}')
+    url = str(path)
+    path.write_text(template.format('one', entries))
+    reader._storage.chunk_size = 10
+    reader.add_feed(url)
+    reader.update_feeds()
+    # change the feed, so it gets parsed again
+    path.write_text(template.format('two', entries))
+
+    def get_peak_memory(fn):
+        tracemalloc.start()
+        try:
+            rv = fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return rv, peak
+
+    parsed_feed, eager_peak = get_peak_memory(lambda: reader._parser(url))
+    assert len(parsed_feed.entries) == 10_000
+    del parsed_feed
+
+    (result,), stream_peak = get_peak_memory(lambda: list(reader.update_feeds_iter()))
+    assert result.updated_feed.unmodified == 10_000
+    assert reader.get_feed(url).title == 'two'
+
+    # the summaries alone are about 10 MB
+    assert eager_peak > 10_000_000
+    assert stream_peak < eager_peak / 4
+
+
+@pytest.mark.parametrize('feed_type', ['rss', 'atom'])
+def test_early_stop_default_parser(reader, tmp_path, monkeypatch, feed_type):
+    """With the default parser, entries after an early stop are not parsed."""
+    from reader._parser import etree
+
+    if feed_type == 'rss':
+        template = '<rss version="2.0"><channel><title>{}</title>{}</channel></rss>'
+        entry = '<item><guid>{0}</guid><description>{0}</description></item>'
+        builder_cls = etree._RSSBuilder
+    else:
+        template = (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>{}</title>{}</feed>'
+        )
+        entry = '<entry><id>{0}</id><summary>{0}</summary></entry>'
+        builder_cls = etree._AtomBuilder
+    entries = ''.join(entry.format(i) for i in range(100))
+
+    path = tmp_path.joinpath(f'feed.{feed_type}')
+    url = str(path)
+    path.write_text(template.format('one', entries))
+    reader.add_feed(url)
+    reader.update_feeds()
+    reader.set_tag(url, '.reader.update', {'early_stop_after': 5})
+    path.write_text(template.format('two', entries))
+
+    parsed = []
+    old_entry = builder_cls.entry
+
+    def entry(self, *args):
+        rv = old_entry(self, *args)
+        parsed.append(rv.id)
+        return rv
+
+    monkeypatch.setattr(builder_cls, 'entry', entry)
+
+    (result,) = reader.update_feeds_iter()
+    assert reader.get_feed(url).title == 'two'
+    assert result.updated_feed.unmodified == 5
+    assert parsed == [str(i) for i in range(5)]
+
+
+@pytest.mark.parametrize('feed_type', ['rss', 'atom'])
+def test_sanitize_html_cache_persisted(make_reader, db_path, tmp_path, feed_type):
+    """Unchanged content is sanitized only once, even across processes."""
+    if feed_type == 'rss':
+        template = '<rss version="2.0"><channel><title>{}</title>{}</channel></rss>'
+        entry = '<item><guid>{0}</guid><description>{1}</description></item>'
+    else:
+        template = (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>{}</title>{}</feed>'
+        )
+        entry = '<entry><id>{0}</id><summary type="html">{1}</summary></entry>'
+    summary = '&lt;p&gt;entry &lt;b&gt;{}&lt;/b&gt;&lt;/p&gt;'
+    entries = ''.join(entry.format(i, summary.format(i)) for i in range(10))
+
+    path = tmp_path.joinpath(f'feed.{feed_type}')
+    url = str(path)
+    path.write_text(template.format('one', entries))
+
+    def update():
+        # a new reader has a new (empty) in-memory cache
+        reader = make_reader(db_path, feed_root='')
+        cache = reader._parser.sanitize_html_cache
+        calls = []
+        sanitize_html = cache.sanitize_html
+
+        def spy(*args):
+            calls.append(args)
+            return sanitize_html(*args)
+
+        cache.sanitize_html = spy
+        reader.add_feed(url, exist_ok=True)
+        reader.update_feeds()
+        reader.close()
+        return reader, calls
+
+    reader, calls = update()
+    assert len(calls) == 10
+    assert reader.get_entry((url, '3')).summary == '<p>entry <b>3</b></p>'
+
+    # change the feed, so it gets parsed again
+    path.write_text(template.format('two', entries))
+    reader, calls = update()
+    assert reader.get_feed(url).title == 'two'
+    assert calls == []
+
+
+def test_sanitize_html_cache_private(reader):
+    reader.update_feeds()
+    assert reader._parser.sanitize_html_cache.store is None
@@ -6,10 +6,17 @@ TODO: move all update tests from test_reader.py here
 """
 
 import threading
+from contextlib import nullcontext
+from datetime import timedelta
 
 import pytest
 
 from fakeparser import Parser
+from reader._types import FeedFilter
+from reader._types import NotModified
+from reader._update import next_update_after
+from reader.exceptions import ParseError
+from reader.types import UpdatedFeed
 from utils import utc_datetime as datetime
 
 
@@ -29,8 +36,8 @@ def test_duplicate_ids(reader):
 
     # parser only supports unique ids, so we monkeypatch it
 
-    def parse(url, result):
-        rv = old_parse(url, result)
+    def parse(url, result, **kwargs):
+        rv = old_parse(url, result, **kwargs)
         (entry,) = rv.entries
         rv = rv._replace(entries=[entry._replace(title='two'), entry])
         return rv
@@ -161,3 +168,666 @@ def test_entry_deleted_during_update(monkeypatch, db_path, make_reader):
     assert before_efu.first_updated == after_efu.first_updated
     assert before_efu.first_updated_epoch == after_efu.first_updated_epoch
     assert before_efu.recent_sort == after_efu.recent_sort
+
+
+def test_batched_hooks_order(reader):
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    calls = []
+    reader.before_feed_update_hooks.append(
+        lambda r, url: calls.append(('before', url, reader.get_entry_counts().total))
+    )
+    reader.after_entry_update_hooks.append(
+        lambda r, e, s: calls.append(('entry', e.feed_url, reader.get_entry(e).id))
+    )
+    reader.after_feed_update_hooks.append(lambda r, url: calls.append(('after', url)))
+
+    reader._update_batch_size = 2
+    results = list(reader.update_feeds_iter())
+
+    assert [r.url for r in results] == ['1', '2', '3']
+    assert [r.updated_feed.new for r in results] == [1, 1, 1]
+    assert calls == [
+        ('before', '1', 0),
+        ('before', '2', 0),
+        ('entry', '1', '1, 1'),
+        ('after', '1'),
+        ('entry', '2', '2, 1'),
+        ('after', '2'),
+        ('before', '3', 2),
+        ('entry', '3', '3, 1'),
+        ('after', '3'),
+    ]
+
+
+def test_batched_feed_deleted(reader):
+    """If a feed is deleted during a batched update,
+    the other feeds in the same batch are still updated.
+
+    """
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    def before_feed_update(reader, url):
+        if url == '2':
+            reader.delete_feed(url)
+
+    reader.before_feed_update_hooks.append(before_feed_update)
+
+    reader._update_batch_size = 3
+    results = list(reader.update_feeds_iter())
+
+    assert [r.url for r in results] == ['1', '3']
+    assert {e.feed_url for e in reader.get_entries()} == {'1', '3'}
+    assert all(f.last_updated for f in reader.get_feeds())
+
+
+@pytest.mark.slow
+def test_parse_workers(reader, data_dir):
+    urls = [str(data_dir.joinpath(name)) for name in ('full.atom', 'full.rss')]
+    for url in urls:
+        reader.add_feed(url)
+
+    reader.update_feeds(workers=2, parse_workers=2)
+
+    assert {e.feed_url for e in reader.get_entries()} == set(urls)
+    assert {f.url: f.last_exception for f in reader.get_feeds()} == dict.fromkeys(urls)
+
+
+def test_parse_workers_invalid(reader):
+    with pytest.raises(ValueError):
+        reader.update_feeds(parse_workers=-1)
+
+
+def test_workers_per_host(reader, monkeypatch):
+    hosts = []
+
+    def get_feed_host(feed):
+        hosts.append(feed.url)
+        return 'host'
+
+    monkeypatch.setattr('reader.core.get_feed_host', get_feed_host)
+
+    reader._parser = parser = Parser()
+    for i in range(6):
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    reader.update_feeds(workers=4, workers_per_host=1)
+
+    assert sorted(hosts) == [str(i) for i in range(6)]
+    assert len(list(reader.get_entries())) == 6
+
+
+def test_workers_per_host_invalid(reader):
+    with pytest.raises(ValueError):
+        reader.update_feeds(workers_per_host=-1)
+
+
+def test_scheduled_order(reader):
+    """Scheduled updates get the most overdue feeds first."""
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+
+    reader._now = lambda: datetime(2010, 1, 1, 10)
+    reader.update_feed('2')
+    reader._now = lambda: datetime(2010, 1, 1, 9)
+    reader.update_feed('1')
+
+    reader._now = lambda: datetime(2010, 1, 1, 12)
+    results = reader.update_feeds_iter(scheduled=True, max_feeds=1)
+    assert [r.url for r in results] == ['3']
+    results = reader.update_feeds_iter(scheduled=True)
+    assert [r.url for r in results] == ['1', '2']
+
+
+@pytest.mark.parametrize('max_feeds, expected', [(None, 3), (0, 0), (2, 2)])
+def test_max_feeds(reader, max_feeds, expected):
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    results = list(reader.update_feeds_iter(max_feeds=max_feeds))
+
+    assert [r.url for r in results] == ['1', '2', '3'][:expected]
+    assert len(list(reader.get_entries())) == expected
+
+
+def test_max_feeds_invalid(reader):
+    with pytest.raises(ValueError):
+        reader.update_feeds(max_feeds=-1)
+
+
+@pytest.mark.parametrize(
+    'deadline, expected',
+    [
+        (None, 3),
+        (datetime(2009, 1, 1), 0),
+        (timedelta(0), 0),
+        (timedelta(minutes=1), 1),
+        (timedelta(minutes=2), 2),
+        (datetime(2010, 1, 1, 0, 2), 2),
+    ],
+)
+def test_deadline(reader, deadline, expected):
+    """Each retrieval takes one minute;
+    once the deadline passes, no new feeds are retrieved.
+
+    """
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    now = datetime(2010, 1, 1)
+    reader._now = lambda: now
+    old_retrieve = parser.retrieve
+
+    def retrieve(*args):
+        nonlocal now
+        now += timedelta(minutes=1)
+        return old_retrieve(*args)
+
+    parser.retrieve = retrieve
+
+    results = list(reader.update_feeds_iter(deadline=deadline))
+
+    assert [r.url for r in results] == ['1', '2', '3'][:expected]
+
+
+@pytest.mark.parametrize(
+    'kwargs, expected',
+    [
+        (dict(deadline=timedelta(minutes=2)), 2),
+        (dict(max_feeds=2), 2),
+        (dict(deadline=timedelta(minutes=3), max_feeds=2), 2),
+        (dict(deadline=timedelta(minutes=2), max_feeds=4), 2),
+    ],
+)
+def test_budget_workers_per_host(make_reader, db_path, monkeypatch, kwargs, expected):
+    """The by-host map queues feeds long before it retrieves them;
+    the deadline must still apply when they are retrieved.
+
+    """
+    reader = make_reader(db_path)
+    monkeypatch.setattr('reader.core.get_feed_host', lambda feed: 'host')
+
+    reader._parser = parser = Parser()
+    for i in range(6):
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    now = datetime(2010, 1, 1)
+    reader._now = lambda: now
+    old_retrieve = parser.retrieve
+
+    def retrieve(*args):
+        nonlocal now
+        now += timedelta(minutes=1)
+        return old_retrieve(*args)
+
+    parser.retrieve = retrieve
+
+    kwargs.update(workers=2, workers_per_host=1)
+    results = list(reader.update_feeds_iter(**kwargs))
+
+    assert len(results) == expected
+    assert len(list(reader.get_entries())) == expected
+
+
+@pytest.mark.parametrize('batch_size', [1, 2])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_update_queue_size(make_reader, db_path, workers, batch_size):
+    """With _update_queue_size, writes and hooks happen in the writer thread,
+    and the results are yielded in the calling thread.
+
+    """
+    reader = make_reader(db_path)
+    reader._parser = parser = Parser()
+    for i in range(6):
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    threads = set()
+    reader.after_feed_update_hooks.append(
+        lambda r, url: threads.add(threading.current_thread().name)
+    )
+
+    reader._update_batch_size = batch_size
+    reader._update_queue_size = 1
+    results = list(reader.update_feeds_iter(workers=workers))
+
+    assert sorted(r.url for r in results) == [str(i) for i in range(6)]
+    assert {r.value.new for r in results} == {1}
+    assert len(list(reader.get_entries())) == 6
+    assert threads == {'reader-update-write'}
+
+
+def test_update_queue_size_error(make_reader, db_path, monkeypatch):
+    reader = make_reader(db_path)
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+
+    def get_feeds_for_update(*args):
+        raise RuntimeError('error')
+        yield
+
+    monkeypatch.setattr(reader._storage, 'get_feeds_for_update', get_feeds_for_update)
+
+    reader._update_queue_size = 1
+    with pytest.raises(RuntimeError, match='error'):
+        reader.update_feeds()
+
+
+def test_update_queue_size_break(make_reader, db_path):
+    reader = make_reader(db_path)
+    reader._parser = parser = Parser()
+    for i in range(6):
+        reader.add_feed(parser.feed(i))
+
+    reader._update_queue_size = 1
+    results = reader.update_feeds_iter()
+    next(results)
+    results.close()
+
+    # the stages stop after the values already in the queues
+    assert len([f for f in reader.get_feeds() if f.last_updated]) < 6
+    assert not [t for t in threading.enumerate() if t.name.startswith('reader-')]
+
+
+def test_update_queue_size_private_database(reader):
+    """Private databases can't be used from other threads,
+    so parsing and writing happen in the calling thread.
+
+    """
+    reader._parser = parser = Parser()
+    for i in range(3):
+        reader.add_feed(parser.feed(i))
+        parser.entry(i, 1)
+
+    threads = set()
+    reader.after_feed_update_hooks.append(
+        lambda r, url: threads.add(threading.current_thread())
+    )
+
+    reader._update_queue_size = 1
+    results = list(reader.update_feeds_iter(workers=2))
+
+    assert {r.value.new for r in results} == {1}
+    assert len(list(reader.get_entries())) == 3
+    assert threads == {threading.current_thread()}
+
+
+def test_feed_config_prefetched(reader, monkeypatch):
+    """The per-feed update config comes from get_feeds_for_update(),
+    not from one get_tag() call per feed.
+
+    """
+    reader._parser = parser = Parser()
+    for i in 1, 2, 3:
+        reader.add_feed(parser.feed(i))
+    reader.set_tag('2', '.reader.update', {'interval': 120})
+
+    get_tag_calls = []
+
+    def get_tag(resource_id, *args):
+        get_tag_calls.append(resource_id)
+        return type(reader).get_tag(reader, resource_id, *args)
+
+    monkeypatch.setattr(reader, 'get_tag', get_tag)
+
+    reader._now = lambda: datetime(2010, 1, 1)
+    reader.update_feeds()
+
+    assert get_tag_calls == [()]
+    assert {f.url: f.update_after for f in reader.get_feeds()} == {
+        '1': datetime(2010, 1, 1, 1),
+        '2': datetime(2010, 1, 1, 2),
+        '3': datetime(2010, 1, 1, 1),
+    }
+
+
+def test_adaptive_interval(reader):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.set_tag((), '.reader.update', {'min_interval': 20, 'max_interval': 240})
+
+    def update(url='1'):
+        reader.update_feeds()
+        (feed,) = reader._storage.get_feeds_for_update(FeedFilter(url))
+        return feed.adaptive_interval
+
+    # unchanged feed, grows by half every time, up to max_interval
+    assert update() == 90
+    assert update() == 135
+    assert update() == 203
+    assert update() == 240
+    assert update() == 240
+
+    # new entries, halves every time, down to min_interval
+    for i, expected in enumerate([120, 60, 30, 20, 20]):
+        parser.entry(1, i)
+        assert update() == expected
+
+    # errors don't change it
+    parser.raise_exc()
+    assert update() == 20
+    parser.reset_mode()
+
+    # changing the feed URL resets it
+    reader.change_feed_url('1', '2')
+    parser.feed(2)
+    assert update('2') == 90
+
+    # the update_after uses it
+    reader._now = lambda: datetime(2010, 1, 1)
+    assert update('2') == 135
+    expected = next_update_after(datetime(2010, 1, 1), 135)
+    assert reader.get_feed('2').update_after == expected
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        {},
+        {'min_interval': 60, 'max_interval': 60},
+        {'min_interval': 120, 'max_interval': 30},
+        {'min_interval': 0, 'max_interval': 'x'},
+    ],
+)
+def test_adaptive_interval_disabled(reader, config):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.set_tag((), '.reader.update', config)
+
+    for day in 1, 2:
+        reader._now = lambda: datetime(2010, 1, day)
+        reader.update_feeds()
+        assert reader.get_feed('1').update_after == datetime(2010, 1, day, 1)
+
+
+@pytest.mark.parametrize(
+    'retry_after, config, expected',
+    [
+        (None, {'max_retry_after': 1440}, datetime(2010, 1, 1, 1)),
+        (60 * 30, {'max_retry_after': 1440}, datetime(2010, 1, 1, 1)),
+        (3600 * 3, {'max_retry_after': 1440}, datetime(2010, 1, 1, 3)),
+        (3600 * 48, {'max_retry_after': 1440}, datetime(2010, 1, 2)),
+        (3600 * 3, {'max_retry_after': 120}, datetime(2010, 1, 1, 2)),
+        (3600 * 3, {'max_retry_after': 0}, datetime(2010, 1, 1, 1)),
+        (3600 * 3, {}, datetime(2010, 1, 1, 1)),
+    ],
+)
+@pytest.mark.parametrize('mode', ['parsed', 'not_modified', 'error'])
+def test_retry_after(reader, retry_after, config, expected, mode):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.set_tag((), '.reader.update', config)
+
+    if mode == 'parsed':
+        old_parse = parser.parse
+
+        def parse(url, result, **kwargs):
+            rv = old_parse(url, result, **kwargs)
+            return rv._replace(retry_after=retry_after)
+
+        parser.parse = parse
+
+    elif mode == 'not_modified':
+
+        def retrieve(url, *args):
+            return nullcontext(NotModified(retry_after))
+
+        parser.retrieve = retrieve
+
+    else:
+
+        def retrieve(url, *args):
+            exc = ParseError(url)
+            exc._retry_after = retry_after
+            raise exc
+
+        parser.retrieve = retrieve
+
+    reader._now = lambda: datetime(2010, 1, 1)
+    reader.update_feeds()
+
+    feed = reader.get_feed('1')
+    assert (feed.last_exception is not None) == (mode == 'error')
+    assert feed.update_after == expected
+
+
+def test_failure_backoff(reader):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.add_feed(parser.feed(2))
+    reader.set_tag('2', '.reader.update', {'max_failure_interval': 60 * 4})
+    reader._now = lambda: datetime(2010, 1, 1)
+
+    def update(url='1'):
+        reader.update_feeds(feed=url)
+        (feed,) = reader._storage.get_feeds_for_update(FeedFilter(url))
+        return feed.consecutive_failures, reader.get_feed(url).update_after
+
+    # the first failure keeps the interval
+    parser.raise_exc()
+    assert update() == (1, datetime(2010, 1, 1, 1))
+
+    # then it doubles every time, up to max_failure_interval
+    assert update() == (2, datetime(2010, 1, 1, 2))
+    assert update() == (3, datetime(2010, 1, 1, 4))
+    assert update() == (4, datetime(2010, 1, 1, 8))
+    assert update() == (5, datetime(2010, 1, 1, 16))
+    assert update() == (6, datetime(2010, 1, 2))
+    assert update() == (7, datetime(2010, 1, 2))
+
+    # per-feed config works
+    for _ in range(4):
+        update('2')
+    assert update('2') == (5, datetime(2010, 1, 1, 4))
+
+    # changing the feed URL resets it
+    reader.change_feed_url('2', '3')
+    parser.feed(3)
+    assert update('3') == (1, datetime(2010, 1, 1, 1))
+
+    # success resets it
+    parser.reset_mode()
+    assert update() == (0, datetime(2010, 1, 1, 1))
+    parser.raise_exc()
+    assert update() == (1, datetime(2010, 1, 1, 1))
+
+
+@pytest.mark.parametrize('config', [{'max_failure_interval': 0}, {'interval': 120}])
+def test_failure_backoff_disabled(reader, config):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.set_tag((), '.reader.update', {'max_failure_interval': 120} | config)
+    reader._now = lambda: datetime(2010, 1, 1)
+    parser.raise_exc()
+
+    interval = config.get('interval', 60)
+    for _ in range(3):
+        reader.update_feeds()
+        expected = next_update_after(datetime(2010, 1, 1), interval)
+        assert reader.get_feed('1').update_after == expected
+
+
+def test_change_url_after(reader, caplog):
+    caplog.set_level('INFO', 'reader')
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    parser.feed(2)
+    parser.entry(1, 1)
+    reader.set_tag((), '.reader.update', {'change_url_after': 3})
+
+    redirects = {'1': '2', '2': None}
+    old_parse = parser.parse
+
+    def parse(url, result, **kwargs):
+        rv = old_parse(url, result, **kwargs)
+        return rv._replace(permanent_redirect=redirects[url])
+
+    parser.parse = parse
+
+    def update(url='1'):
+        reader.update_feeds()
+        (feed,) = reader._storage.get_feeds_for_update(FeedFilter(url))
+        return feed.redirect_url, feed.redirect_count
+
+    assert update() == ('2', 1)
+    # not modified doesn't change the count, a different URL resets it
+    parser.not_modified()
+    assert update() == ('2', 1)
+    parser.reset_mode()
+    redirects['1'] = '3'
+    assert update() == ('3', 1)
+    redirects['1'] = '2'
+    assert update() == ('2', 1)
+    assert update() == ('2', 2)
+
+    # ...until change_url_after is reached
+    reader.update_feeds()
+    assert [f.url for f in reader.get_feeds()] == ['2']
+    assert [e.id for e in reader.get_entries()] == ['1, 1']
+    assert update('2') == (None, 0)
+    assert "changed URL to '2'" in caplog.text
+
+
+def test_change_url_after_exists(reader, caplog):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    reader.add_feed(parser.feed(2))
+    reader.set_tag('1', '.reader.update', {'change_url_after': 1})
+
+    old_parse = parser.parse
+    parser.parse = lambda *args, **kwargs: old_parse(*args, **kwargs)._replace(
+        permanent_redirect='2'
+    )
+
+    reader.update_feeds()
+    assert {f.url for f in reader.get_feeds()} == {'1', '2'}
+    assert "could not change URL to '2'" in caplog.text
+
+
+def test_early_stop(reader, caplog):
+    caplog.set_level('INFO', 'reader')
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1))
+    for i in range(1, 11):
+        parser.entry(1, i)
+    reader.set_tag(
+        (), '.reader.update', {'early_stop_after': 2, 'full_update_every': 3}
+    )
+
+    consumed = []
+    old_parse = parser.parse
+
+    def parse(*args, **kwargs):
+        rv = old_parse(*args, **kwargs)
+        entries = (consumed.append(e.id) or e for e in rv.entries)
+        return rv._replace(entries=entries)
+
+    parser.parse = parse
+
+    lookups = []
+    old_get_entries_for_update = reader._storage.get_entries_for_update
+
+    def get_entries_for_update(entries):
+        lookups.append(None)
+        return old_get_entries_for_update(entries)
+
+    reader._storage.get_entries_for_update = get_entries_for_update
+
+    def update():
+        consumed.clear()
+        lookups.clear()
+        (result,) = reader.update_feeds_iter()
+        (feed,) = reader._storage.get_feeds_for_update(FeedFilter('1'))
+        counts = None
+        if rv := result.updated_feed:
+            counts = rv.new, rv.modified, rv.unmodified
+        return counts, len(consumed), feed.early_stops
+
+    # the first update looks at everything
+    assert update() == ((10, 0, 0), 10, 0)
+
+    # no changes, stop after 2, without looking at the rest of the entries
+    assert update() == ((0, 0, 2), 2, 1)
+    assert "2 unchanged entries in a row, stopping" in caplog.text
+
+    # a change further down is not noticed...
+    parser.entry(1, 10, title='ten')
+    assert update() == ((0, 0, 2), 2, 2)
+    # ...until the full update
+    assert update() == ((0, 1, 9), 10, 0)
+    # which looks up all the entries at once
+    assert len(lookups) == 1
+    assert reader.get_entry(('1', '1, 10')).title == 'ten'
+
+    # changes reset the unchanged count
+    parser.entry(1, 1, title='one')
+    parser.entry(1, 3, title='three')
+    # entries are looked up early_stop_after at a time, hence the 6th
+    assert update() == ((0, 2, 3), 6, 1)
+    assert len(lookups) == 3
+
+    # not modified doesn't change the count
+    parser.not_modified()
+    assert update() == (None, 0, 1)
+    parser.reset_mode()
+
+    # stale feeds look at everything
+    reader._storage.set_feed_stale('1', True)
+    assert update() == ((0, 10, 0), 10, 0)
+
+    # disabled
+    reader.set_tag('1', '.reader.update', {'early_stop_after': 0})
+    assert update() == ((0, 0, 10), 10, 0)
+
+
+def test_delta_update(reader):
+    reader._parser = parser = Parser()
+    reader.add_feed(parser.feed(1, title='full'))
+    parser.entry(1, 1, title='one')
+    parser.entry(1, 2)
+    parser.http_etag = 'etag-1'
+    reader.update_feeds()
+
+    # a delta has only the changed entries, and maybe partial feed data
+    parser.feed(1, title=None)
+    parser.entries[1].clear()
+    parser.entry(1, 1, title='one again')
+    parser.entry(1, 3)
+    parser.http_etag = 'etag-2'
+    old_parse = parser.parse
+    parser.parse = lambda *args, **kwargs: old_parse(*args, **kwargs)._replace(
+        is_delta=True
+    )
+
+    (result,) = reader.update_feeds_iter()
+    assert result.updated_feed == UpdatedFeed('1', new=1, modified=1)
+
+    assert reader.get_feed('1').title == 'full'
+    (feed,) = reader._storage.get_feeds_for_update(FeedFilter('1'))
+    assert feed.http_etag == 'etag-2'
+    assert {e.id: e.title for e in reader.get_entries()} == {
+        '1, 1': 'one again',
+        '1, 2': 'Entry #2',
+        '1, 3': 'Entry #3',
+    }
+
+    # no entries changed, nothing to store
+    parser.http_etag = 'etag-3'
+    (result,) = reader.update_feeds_iter()
+    assert result.updated_feed == UpdatedFeed('1', unmodified=2)
+    (feed,) = reader._storage.get_feeds_for_update(FeedFilter('1'))
+    assert feed.http_etag == 'etag-2'
+    assert reader.get_feed('1').title == 'full'
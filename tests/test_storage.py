@@ -258,6 +258,27 @@ def add_or_update_entries(storage, feed, entry):
     )
 
 
+def update_feeds_and_entries(storage, feed, entry):
+    storage.update_feeds_and_entries(
+        [
+            (
+                FeedUpdateIntent(
+                    feed.url, datetime(2010, 1, 1), datetime(2010, 1, 1), None
+                ),
+                [
+                    EntryUpdateIntent(
+                        entry,
+                        entry.updated,
+                        datetime(2010, 1, 1),
+                        datetime(2010, 1, 1),
+                        datetime(2010, 1, 1),
+                    )
+                ],
+            )
+        ]
+    )
+
+
 def add_entry(storage, feed, entry):
     storage.add_entry(
         EntryUpdateIntent(
@@ -298,6 +319,14 @@ def get_entry_counts(storage, _, __):
     storage.get_entry_counts(now=datetime(2010, 1, 1)),
 
 
+def get_sanitized_html(storage, _, __):
+    storage.get_sanitized_html(b'key')
+
+
+def add_sanitized_html(storage, _, __):
+    storage.add_sanitized_html([(b'key', 'value')], 10)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize(
     'do_stuff',
@@ -318,6 +347,7 @@ def get_entry_counts(storage, _, __):
         update_feed,
         add_or_update_entry,
         add_or_update_entries,
+        update_feeds_and_entries,
         add_entry,
         delete_entries,
         get_entries,
@@ -326,6 +356,8 @@ def get_entry_counts(storage, _, __):
         delete_tag,
         get_feed_counts,
         get_entry_counts,
+        get_sanitized_html,
+        add_sanitized_html,
     ],
 )
 def test_errors_locked(db_path, do_stuff):
@@ -600,6 +632,134 @@ def test_get_set_recent_sort(storage):
     assert excinfo.value.resource_id == ('feed', 'xxx')
 
 
+def test_sanitized_html(storage):
+    assert storage.get_sanitized_html(b'one') is None
+
+    storage.add_sanitized_html([(b'one', '1'), (b'two', '2')], 3)
+    assert storage.get_sanitized_html(b'one') == '1'
+
+    # existing keys are ignored
+    storage.add_sanitized_html([(b'one', 'x')], 3)
+    assert storage.get_sanitized_html(b'one') == '1'
+
+    # the values added first are deleted first
+    storage.add_sanitized_html([(b'three', '3'), (b'four', '4')], 3)
+    assert storage.get_sanitized_html(b'one') is None
+    assert [storage.get_sanitized_html(k) for k in (b'two', b'three', b'four')] == [
+        '2',
+        '3',
+        '4',
+    ]
+
+
 def test_application_id(storage):
     id = storage.factory().execute('pragma application_id').fetchone()[0]
     assert id == int.from_bytes(b'read', 'big')
+
+
+@rename_argument('storage', 'storage_with_two_entries')
+def test_add_or_update_entries_insert_only_columns(storage):
+    """Updating an existing entry preserves the columns set on insert,
+    resets original_feed, and updates everything else.
+
+    """
+    storage.set_entry_read(('feed', 'one'), True, None)
+    storage.get_db().execute(
+        "UPDATE entries SET original_feed = 'old' WHERE id = 'one';"
+    ).close()
+
+    storage.add_or_update_entries(
+        [
+            EntryUpdateIntent(
+                EntryData('feed', 'one', datetime(2010, 1, 3), title='one'),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                1,
+                2,
+                added_by='user',
+            ),
+            EntryUpdateIntent(
+                EntryData('feed', 'three', datetime(2010, 1, 3)),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                datetime(2010, 1, 4),
+                2,
+            ),
+        ]
+    )
+
+    entries = {e.id: e for e in storage.get_entries()}
+
+    one = entries['one']
+    assert one.title == 'one'
+    assert one.updated == datetime(2010, 1, 3)
+    assert one.last_updated == datetime(2010, 1, 4)
+    assert one.added == datetime(2010, 1, 2)
+    assert one.added_by == 'user'
+    assert one.read
+    assert one.original_feed_url == 'feed'
+    (efu,) = storage.get_entries_for_update([('feed', 'one')])
+    assert efu.first_updated_epoch == datetime(2010, 1, 2)
+    assert efu.recent_sort == datetime(2010, 1, 4)
+    assert efu.hash_changed == 2
+
+    three = entries['three']
+    assert three.added == datetime(2010, 1, 4)
+    assert three.added_by == 'feed'
+    assert not three.read
+
+
+def test_add_or_update_entries_feed_not_found(storage):
+    storage.add_feed('one', datetime(2010, 1, 1))
+
+    def make_intent(feed_url):
+        return EntryUpdateIntent(
+            EntryData(feed_url, 'entry'),
+            datetime(2010, 1, 1),
+            datetime(2010, 1, 1),
+            datetime(2010, 1, 1),
+            datetime(2010, 1, 1),
+        )
+
+    with pytest.raises(FeedNotFoundError) as excinfo:
+        storage.add_or_update_entries([make_intent('one'), make_intent('two')])
+    assert excinfo.value.url == 'two'
+
+
+@pytest.mark.parametrize('single_query_min', [0, 2, 1000])
+def test_get_entries_for_update_order(storage, single_query_min):
+    storage.entries_for_update_single_query_min = single_query_min
+    for feed_url in 'one', 'two':
+        storage.add_feed(feed_url, datetime(2010, 1, 1))
+    for i, resource_id in enumerate(
+        [('one', '1'), ('one', '3'), ('two', '1'), ('two', '2')]
+    ):
+        storage.add_or_update_entry(
+            EntryUpdateIntent(
+                EntryData(*resource_id),
+                datetime(2010, 1, 1),
+                datetime(2010, 1, 1 + i),
+                datetime(2010, 1, 1),
+                datetime(2010, 1, 1),
+            )
+        )
+
+    resource_ids = [
+        ('one', '3'),
+        ('one', '2'),
+        ('one', '1'),
+        ('one', '3'),
+        ('one', '4'),
+        ('two', '2'),
+        ('two', '1'),
+        ('three', '1'),
+        ('one', '1'),
+    ]
+    rv = [
+        efu.first_updated.day if efu else None
+        for efu in storage.get_entries_for_update(resource_ids)
+    ]
+    assert rv == [2, None, 1, 2, None, 4, 3, None, 1]
@@ -99,3 +99,37 @@ def test_better_str_partial():
 
     assert str(partial(Cls.meth, two=2)) == 'meth(two=2)'
     assert str(partial(Cls().meth, two=2)) == 'meth(two=2)'
+
+
+def test_make_pool_map_by_key():
+    import threading
+    import time
+    from collections import Counter
+
+    from reader._utils import make_pool_map
+
+    lock = threading.Lock()
+    running = Counter()
+    max_running = Counter()
+    total = []
+
+    def fn(arg):
+        key, _ = arg
+        with lock:
+            running[key] += 1
+            max_running[key] = max(max_running[key], running[key])
+            total.append(sum(running.values()))
+        time.sleep(0.01)
+        with lock:
+            running[key] -= 1
+        return arg
+
+    args = [('a', i) for i in range(8)] + [('b', i) for i in range(4)]
+    args += [(None, i) for i in range(4)]
+
+    with make_pool_map(4, key=lambda arg: arg[0], max_per_key=2) as map:
+        assert sorted(map(fn, args), key=str) == sorted(args, key=str)
+
+    assert max_running['a'] == max_running['b'] == 2
+    # other keys kept the workers busy
+    assert max(total) == 4